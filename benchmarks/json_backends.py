@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Compare the JSON backends supported by :mod:`dyn.compat` on a synthetic
+``/AllRecord/`` response, timing both decoding the raw response body and
+encoding a large set of request arguments.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/json_backends.py [--records N] [--repeat N]
+"""
+import argparse
+import timeit
+
+from dyn.compat import (JSON_BACKENDS, get_json_backend, json_dumps,
+                        json_loads, set_json_backend)
+
+
+def all_record_payload(n_records):
+    """Build an /AllRecord/ response body holding *n_records* records, split
+    across a realistic mix of record types
+    """
+    data = {'a_records': [], 'cname_records': [], 'mx_records': [],
+            'txt_records': []}
+    for i in range(n_records):
+        fqdn = 'host{}.example.com'.format(i)
+        record = {'zone': 'example.com', 'fqdn': fqdn, 'ttl': 3600,
+                  'record_id': 100000 + i}
+        kind = i % 10
+        if kind < 6:
+            record.update(record_type='A', rdata={
+                'address': '10.{}.{}.{}'.format(i >> 16 & 255, i >> 8 & 255,
+                                                i & 255)})
+            data['a_records'].append(record)
+        elif kind < 8:
+            record.update(record_type='CNAME',
+                          rdata={'cname': 'target{}.example.net.'.format(i)})
+            data['cname_records'].append(record)
+        elif kind < 9:
+            record.update(record_type='MX', rdata={
+                'exchange': 'mail{}.example.com.'.format(i), 'preference': 10})
+            data['mx_records'].append(record)
+        else:
+            record.update(record_type='TXT', rdata={
+                'txtdata': 'v=spf1 include:_spf.example.com ~all {}'.format(i)})
+            data['txt_records'].append(record)
+    response = {'status': 'success', 'data': data, 'job_id': 1234567,
+                'msgs': [{'INFO': 'get: Found {} records'.format(n_records),
+                          'SOURCE': 'BLL', 'ERR_CD': None, 'LVL': 'INFO'}]}
+    return response
+
+
+def run(records=100000, repeat=5):
+    """Time every installed backend. Returns a *dict* mapping each backend's
+    name to the best of *repeat* timings, in seconds, for decoding the
+    response body and encoding its data
+    """
+    original = get_json_backend()
+    payload = all_record_payload(records)
+    set_json_backend('stdlib')
+    body = json_dumps(payload).encode('UTF-8')
+    results = {}
+    try:
+        for name in JSON_BACKENDS:
+            try:
+                set_json_backend(name)
+            except ImportError:
+                continue
+            loads = min(timeit.repeat(lambda: json_loads(body), number=1,
+                                      repeat=repeat))
+            dumps = min(timeit.repeat(lambda: json_dumps(payload['data']),
+                                      number=1, repeat=repeat))
+            results[name] = {'loads': loads, 'dumps': dumps}
+    finally:
+        set_json_backend(original)
+    return {'records': records, 'body_bytes': len(body), 'backends': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    opts = parser.parse_args()
+
+    results = run(opts.records, opts.repeat)
+    baseline = results['backends']['stdlib']
+    print('{} records, {:.1f} MB body'.format(
+        results['records'], results['body_bytes'] / 1e6))
+    print('{:<12}{:>12}{:>10}{:>12}{:>10}'.format('backend', 'loads (ms)',
+                                                  'speedup', 'dumps (ms)',
+                                                  'speedup'))
+    for name, timing in sorted(results['backends'].items(),
+                               key=lambda x: x[1]['loads']):
+        print('{:<12}{:>12.1f}{:>9.1f}x{:>12.1f}{:>9.1f}x'.format(
+            name, timing['loads'] * 1e3, baseline['loads'] / timing['loads'],
+            timing['dumps'] * 1e3, baseline['dumps'] / timing['dumps']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Measure the throughput of building full records from API data, as
+:meth:`~dyn.tm.zones.Zone.get_all_records` does, and of reading back their
+rdata, both as a plain record's :meth:`~dyn.tm.records.DNSRecord.rdata` and
+as a Traffic Director record's JSON. No API calls are made.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/record_schema.py [--rows N]
+"""
+import argparse
+import time
+
+from dyn.tm.records import ARecord, CNAMERecord, MXRecord, TXTRecord
+from dyn.tm.services.dsf import DSFARecord, DSFMXRecord
+
+from json_backends import all_record_payload
+
+#: The record class of each record type in the payload
+CLASSES = {'A': ARecord, 'CNAME': CNAMERecord, 'MX': MXRecord,
+           'TXT': TXTRecord}
+#: The number of distinct rows cycled through
+DISTINCT = 10000
+
+
+def _rows():
+    """The arguments of DISTINCT records, as built from an /AllRecord/
+    response
+    """
+    rows = []
+    data = all_record_payload(DISTINCT)['data']
+    for records in data.values():
+        for record in records:
+            kwargs = dict(record, **record['rdata'])
+            cls = CLASSES[kwargs['record_type']]
+            rows.append((cls, kwargs.pop('zone'), kwargs.pop('fqdn'),
+                         kwargs))
+    return rows
+
+
+def _rate(rows, func):
+    """Call *func* *rows* times, returning the calls made per second"""
+    start = time.time()
+    func(rows)
+    return rows / (time.time() - start)
+
+
+def build(rows):
+    """Build *rows* records"""
+    table = _rows()
+    size = len(table)
+    for i in range(rows):
+        cls, zone, fqdn, kwargs = table[i % size]
+        cls(zone, fqdn, create=False, **kwargs)
+
+
+def rdata(rows):
+    """Read the rdata of *rows* records"""
+    records = [cls(zone, fqdn, create=False, **kwargs)
+               for cls, zone, fqdn, kwargs in _rows()]
+    size = len(records)
+    for i in range(rows):
+        records[i % size].rdata()
+
+
+def dsf_json(rows):
+    """Serialize *rows* Traffic Director records"""
+    records = [DSFARecord('10.0.{}.{}'.format(i >> 8 & 255, i & 255),
+                          label='a{}'.format(i)) for i in range(DISTINCT // 2)]
+    records += [DSFMXRecord('mail{}.example.com.'.format(i), 10,
+                            label='mx{}'.format(i))
+                for i in range(DISTINCT // 2)]
+    size = len(records)
+    for i in range(rows):
+        records[i % size].to_json(svc_id='service')
+
+
+def run(rows=1000000):
+    """Time every phase over *rows* rows. Returns a *dict* mapping each phase
+    to its rows per second
+    """
+    return {'build': _rate(rows, build), 'rdata': _rate(rows, rdata),
+            'dsf_json': _rate(rows, dsf_json)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    opts = parser.parse_args()
+
+    results = run(opts.rows)
+    print('{} rows'.format(opts.rows))
+    print('{:<10}{:>14}'.format('phase', 'rows/s'))
+    for phase in ('build', 'rdata', 'dsf_json'):
+        print('{:<10}{:>14,.0f}'.format(phase, results[phase]))
+
+
+if __name__ == '__main__':
+    main()
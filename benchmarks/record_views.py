@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Compare the time taken to build, and the memory held by, the full and the
+compact views of a very large zone's records, as returned by
+:meth:`~dyn.tm.zones.Zone.get_all_records`. The API is stood in for by an
+in-memory connection answering with a synthetic ``/AllRecord/`` response, so
+the timings include decoding the response, which is the same for both views.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/record_views.py [--records N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from dyn.compat import json_dumps
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+from json_backends import all_record_payload
+from request_overhead import _FakeConnection
+
+
+def measure(zone, view):
+    """Fetch every record of *zone* as *view*, returning the seconds taken and
+    the bytes still held once the response has been discarded. Memory is
+    traced in a second fetch, whose records are held until counted, as
+    tracing slows the first down
+    """
+    gc.collect()
+    start = time.time()
+    records = zone.get_all_records(view=view)
+    elapsed = time.time() - start
+    del records
+    gc.collect()
+    tracemalloc.start()
+    try:
+        records = zone.get_all_records(view=view)
+        gc.collect()
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    count = sum(len(x) for x in records.values())
+    return {'records': count, 'seconds': elapsed, 'bytes': held}
+
+
+def run(records=500000):
+    """Time both views of a zone holding *records* records. Returns a *dict*
+    mapping each view to its timing and memory use
+    """
+    body = json_dumps(all_record_payload(records)).encode('UTF-8')
+    session = DynectSession('customer', 'user', 'password', auto_auth=False)
+    session._pool.clear()
+    session._pool.factory = lambda: _FakeConnection(body)
+    session._token = 'benchmark-token'
+    zone = Zone('example.com', api=False)
+    try:
+        return {view: measure(zone, view) for view in ('full', 'compact')}
+    finally:
+        DynectSession.close_session()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--records', type=int, default=500000)
+    opts = parser.parse_args()
+
+    results = run(opts.records)
+    full = results['full']
+    print('{} records'.format(full['records']))
+    print('{:<10}{:>12}{:>10}{:>14}{:>10}'.format('view', 'build (s)',
+                                                  'speedup', 'held (MB)',
+                                                  'saving'))
+    for view, result in sorted(results.items()):
+        print('{:<10}{:>12.2f}{:>9.1f}x{:>14.1f}{:>9.1f}x'.format(
+            view, result['seconds'], full['seconds'] / result['seconds'],
+            result['bytes'] / 1e6, full['bytes'] / float(result['bytes'])))
+
+
+if __name__ == '__main__':
+    main()
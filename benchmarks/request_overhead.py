@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""Measure the client side overhead of a single small API call, such as a
+record PUT, by executing calls against an in-memory connection which answers
+instantly. Everything timed is time spent inside the dyn library itself.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/request_overhead.py [--calls N] [--history]
+                                                       [--debug]
+"""
+import argparse
+import logging
+import time
+
+from dyn.compat import json_dumps
+from dyn.tm.session import DynectSession
+
+
+class _FakeResponse(object):
+    """A canned, successful, HTTP response"""
+    status = 200
+
+    def __init__(self, body):
+        self._body = body
+
+    def read(self, amt=None):
+        return self._body
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class _FakeConnection(object):
+    """An HTTPConnection stand in which never touches the network"""
+    sock = None
+
+    def __init__(self, body):
+        self._response = _FakeResponse(body)
+
+    def putrequest(self, method, uri):
+        pass
+
+    def putheader(self, header, *values):
+        pass
+
+    def endheaders(self, message_body=None):
+        pass
+
+    def send(self, data):
+        pass
+
+    def getresponse(self):
+        return self._response
+
+    def close(self):
+        pass
+
+
+def record_put_response():
+    """The body of a typical successful ARecord PUT"""
+    return json_dumps({
+        'status': 'success', 'job_id': 1234567,
+        'data': {'zone': 'example.com', 'fqdn': 'www.example.com',
+                 'record_type': 'A', 'record_id': 7654321, 'ttl': 300,
+                 'rdata': {'address': '10.0.0.1'}},
+        'msgs': [{'INFO': 'update: Record updated', 'SOURCE': 'BLL',
+                  'ERR_CD': None, 'LVL': 'INFO'}]}).encode('UTF-8')
+
+
+def run(calls=20000, history=False, debug=False):
+    """Time *calls* record PUTs. Returns a *dict* holding the mean per-call
+    overhead in microseconds
+    """
+    body = record_put_response()
+    session = DynectSession('customer', 'user', 'password', auto_auth=False,
+                            history=history)
+    session._pool.clear()
+    session._pool.factory = lambda: _FakeConnection(body)
+    session._token = 'benchmark-token'
+
+    logger = session.logger
+    level, handlers = logger.level, logger.handlers
+    if debug:
+        logger.setLevel(logging.DEBUG)
+        logger.handlers = [logging.NullHandler()]
+    args = {'rdata': {'address': '10.0.0.1'}, 'ttl': 300}
+    uri = '/ARecord/example.com/www.example.com/7654321/'
+    try:
+        for _ in range(min(calls, 1000)):
+            session.execute(uri, 'PUT', args)
+        start = time.time()
+        for _ in range(calls):
+            session.execute(uri, 'PUT', args)
+        elapsed = time.time() - start
+    finally:
+        logger.setLevel(level)
+        logger.handlers = handlers
+        DynectSession.close_session()
+    return {'calls': calls, 'history': history, 'debug': debug,
+            'usec_per_call': elapsed / calls * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--history', action='store_true',
+                        help='record every call in the session history')
+    parser.add_argument('--debug', action='store_true',
+                        help='enable DEBUG logging to a null handler')
+    opts = parser.parse_args()
+
+    result = run(opts.calls, opts.history, opts.debug)
+    print('{calls} calls (history={history}, debug={debug}): '
+          '{usec_per_call:.1f} usec per call'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
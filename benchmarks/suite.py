@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""Run typical workflows end to end against a local stand-in for the APIs,
+:mod:`dyn.testing.fakeserver`, with latency injected into every response.
+Each workflow runs in a fresh process, and reports its ops/sec, p50 and p99
+latency, the API calls made per operation and the process' peak RSS. The
+results are written to a JSON file which may be compared against an earlier
+run's.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/suite.py [--output FILE] [--compare FILE]
+                                            [--latency SECONDS] [--scale N]
+                                            [--workflow NAME ...]
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import time
+from collections import OrderedDict
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import dyn
+from dyn.compat import get_json_backend
+from dyn.metrics import RequestObserver
+from dyn.mm.session import MMSession
+from dyn.testing.fakeserver import FakeServerProcess
+from dyn.tm.records import ARecord
+from dyn.tm.services.dsf import get_all_records
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone, get_all_zones
+
+#: Zones generated by the fake server, mapped to their number of records
+ZONES = OrderedDict([('records10k.example.com', 10000),
+                     ('records100k.example.com', 100000),
+                     ('create.example.com', 0), ('update.example.com', 0)])
+#: The number of additional, empty, zones listed by get_all_zones
+EXTRA_ZONES = 100
+#: The number of records in the Traffic Director service
+DSF_RECORDS = 100
+#: The number of items in every Message Management report
+REPORT_SIZE = 2000
+
+
+class _CallCounter(RequestObserver):
+    """Counts every HTTP request sent, including retries and polls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def on_request(self, session, method, uri, request_bytes):
+        self.calls += 1
+
+
+def _tm_session(session_kwargs, auto_auth=True):
+    return DynectSession('customer', 'user', 'password', auto_auth=auto_auth,
+                         **session_kwargs)
+
+
+def login(session_kwargs, ops):
+    """Log in to Traffic Management"""
+    session = _tm_session(session_kwargs, auto_auth=False)
+    return session, lambda i: session.authenticate()
+
+
+def zones(session_kwargs, ops):
+    """List every zone with get_all_zones"""
+    session = _tm_session(session_kwargs)
+    return session, lambda i: get_all_zones()
+
+
+def _zone_records(name):
+    def workflow(session_kwargs, ops):
+        session = _tm_session(session_kwargs)
+        zone = Zone(name)
+        return session, lambda i: zone.get_all_records()
+    workflow.__doc__ = 'Zone.get_all_records on {}'.format(name)
+    return workflow
+
+
+def arecord_create(session_kwargs, ops):
+    """Create A records, one call each"""
+    session = _tm_session(session_kwargs)
+
+    def op(i):
+        ARecord('create.example.com', 'host{}.create.example.com'.format(i),
+                address='10.0.{}.{}'.format(i >> 8 & 255, i & 255))
+    return session, op
+
+
+def arecord_update(session_kwargs, ops):
+    """Update the address of existing A records, one call each"""
+    session = _tm_session(session_kwargs)
+    records = [ARecord('update.example.com',
+                       'host{}.update.example.com'.format(i),
+                       address='10.0.{}.{}'.format(i >> 8 & 255, i & 255))
+               for i in range(ops)]
+
+    def op(i):
+        records[i].address = '10.1.{}.{}'.format(i >> 8 & 255, i & 255)
+    return session, op
+
+
+def dsf_records(session_kwargs, ops):
+    """Fetch every record of a Traffic Director service"""
+    session = _tm_session(session_kwargs)
+    service_id = session.execute('/DSF/', 'POST',
+                                 {'label': 'bench'})['data']['service_id']
+    for i in range(DSF_RECORDS):
+        rdata = {'rdata_a': {'address': '10.2.0.{}'.format(i % 256)}}
+        session.execute('/DSFRecord/{}/'.format(service_id), 'POST', {
+            'rdata_class': 'A', 'ttl': 30, 'label': 'record{}'.format(i),
+            'weight': 1, 'automation': 'auto', 'endpoints': [],
+            'endpoint_up_count': 1, 'eligible': 'true', 'status': 'up',
+            'torpidity': 0, 'dsf_record_set_id': 'set', 'service_id':
+            service_id, 'rdata': [{'data': rdata}]})
+    return session, lambda i: get_all_records(service_id)
+
+
+def mm_report(session_kwargs, ops):
+    """Pull every page of a Message Management report"""
+    session = MMSession('apikey', **session_kwargs)
+    args = {'starttime': '2015-01-01T00:00:00',
+            'endtime': '2015-02-01T00:00:00'}
+
+    def op(i):
+        items, start = [], 0
+        while True:
+            page = session.execute('/reports/sent', 'GET',
+                                   dict(args, startindex=start))['sent']
+            items += page
+            if len(page) < 500:
+                return items
+            start += len(page)
+    return session, op
+
+
+#: Every workflow, mapped to its default number of operations
+WORKFLOWS = OrderedDict([
+    ('login', (login, 100)),
+    ('get_all_zones', (zones, 50)),
+    ('zone_records_10k', (_zone_records('records10k.example.com'), 10)),
+    ('zone_records_100k', (_zone_records('records100k.example.com'), 3)),
+    ('arecord_create', (arecord_create, 200)),
+    ('arecord_update', (arecord_update, 200)),
+    ('dsf_get_all_records', (dsf_records, 5)),
+    ('mm_report', (mm_report, 20)),
+])
+
+
+def _percentile(values, pct):
+    """The nearest rank *pct* percentile of *values*"""
+    values = sorted(values)
+    return values[max(int(math.ceil(pct / 100.0 * len(values))) - 1, 0)]
+
+
+def _peak_rss_mb():
+    """The peak resident set size of this process, in megabytes"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == 'darwin':
+        peak /= 1024.0
+    return peak / 1024.0
+
+
+def run_workflow(name, ops, session_kwargs):
+    """Run *ops* operations of the workflow *name*, returning a *dict* of its
+    results. Intended to be run in a fresh process, so that the peak RSS
+    belongs to this workflow alone
+    """
+    workflow = WORKFLOWS[name][0]
+    session, op = workflow(session_kwargs, ops)
+    counter = _CallCounter()
+    session.add_observer(counter)
+    latencies = []
+    start = time.time()
+    for i in range(ops):
+        began = time.time()
+        op(i)
+        latencies.append(time.time() - began)
+    elapsed = time.time() - start
+    return {'ops': ops, 'seconds': elapsed, 'ops_per_sec': ops / elapsed,
+            'p50_ms': _percentile(latencies, 50) * 1e3,
+            'p99_ms': _percentile(latencies, 99) * 1e3,
+            'calls_per_op': counter.calls / float(ops),
+            'peak_rss_mb': _peak_rss_mb()}
+
+
+def _scaled(count, scale):
+    """*count* multiplied by *scale*, but never less than 1 unless *count* is
+    0
+    """
+    return max(int(count * scale), 1) if count else 0
+
+
+def run(latency=0.02, scale=1, workflows=None):
+    """Run *workflows*, defaulting to all of them, against a fake server in a
+    child process. Both the number of operations run and the size of the
+    zones and reports they run against are multiplied by *scale*. Returns a
+    *dict* of the environment and each workflow's results
+    """
+    workflows = workflows or list(WORKFLOWS)
+    server = FakeServerProcess(
+        latency=latency, report_size=_scaled(REPORT_SIZE, scale),
+        zones=_scaled(EXTRA_ZONES, scale),
+        populate=['{}={}'.format(name, _scaled(count, scale))
+                  for name, count in ZONES.items()])
+    results = OrderedDict()
+    with server:
+        for name in workflows:
+            ops = _scaled(WORKFLOWS[name][1], scale)
+            pool = multiprocessing.Pool(1)
+            try:
+                results[name] = pool.apply(run_workflow, (
+                    name, ops, server.session_kwargs))
+            finally:
+                pool.close()
+                pool.join()
+    return {'environment': {'dyn': dyn.__version__,
+                            'python': platform.python_version(),
+                            'implementation': platform.python_implementation(),
+                            'platform': platform.platform(),
+                            'json_backend': get_json_backend(),
+                            'latency': latency, 'scale': scale,
+                            'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'workflows': results}
+
+
+def _change(old, new):
+    """Format the relative change from *old* to *new*"""
+    if not old or new is None:
+        return ''
+    return '{:+.1f}%'.format((new - old) * 100.0 / old)
+
+
+def report(results, baseline=None):
+    """Print a table of *results*, with the change from *baseline* if given"""
+    columns = ('ops_per_sec', 'p50_ms', 'p99_ms', 'calls_per_op',
+               'peak_rss_mb')
+    print('{:<22}'.format('workflow') +
+          ''.join('{:>14}'.format(x) for x in columns))
+    old = (baseline or {}).get('workflows', {})
+    for name, result in results['workflows'].items():
+        print('{:<22}'.format(name) + ''.join(
+            '{:>14.2f}'.format(result[x]) if result[x] is not None else
+            '{:>14}'.format('-') for x in columns))
+        if name in old:
+            print('{:<22}'.format('') + ''.join(
+                '{:>14}'.format(_change(old[name].get(x), result[x]))
+                for x in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--output', default='benchmark-results.json',
+                        help='the file to write results to')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='the results of an earlier run to compare to')
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='seconds added to every API response')
+    parser.add_argument('--scale', type=float, default=1,
+                        help='multiply the number of operations run, and '
+                             'the size of the zones and reports they run '
+                             'against')
+    parser.add_argument('--workflow', action='append',
+                        choices=list(WORKFLOWS),
+                        help='run only this workflow, may be given more '
+                             'than once')
+    opts = parser.parse_args()
+
+    baseline = None
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)
+    results = run(opts.latency, opts.scale, opts.workflow)
+    with open(opts.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    report(results, baseline)
+    print('Results written to {}'.format(opts.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Compare the time taken to write a very large zone out as a Master file,
+and the peak memory used doing so, between
+:meth:`~dyn.tm.zones.Zone.export_zonefile` and formatting the records built
+by :meth:`~dyn.tm.zones.Zone.get_all_records`. The API is stood in for by an
+in-memory connection answering with a synthetic ``/AllRecord/`` response,
+read incrementally, and the file written is discarded.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/zonefile_export.py [--records N]
+"""
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+
+from dyn.compat import json_dumps
+from dyn.tm.records import DNSRecord
+from dyn.tm.session import DynectSession
+from dyn.tm.zonefile import write_zonefile
+from dyn.tm.zones import Zone
+
+from json_backends import all_record_payload
+from request_overhead import _FakeConnection
+
+#: The SOA record of the synthetic zone
+SOA = {'zone': 'example.com', 'fqdn': 'example.com', 'record_type': 'SOA',
+       'ttl': 3600, 'record_id': 1,
+       'rdata': {'mname': 'ns1.example.com.', 'rname': 'admin.example.com.',
+                 'serial': 1, 'refresh': 3600, 'retry': 600,
+                 'expire': 604800, 'minimum': 60}}
+
+
+class _StreamedResponse(object):
+    """A canned, successful, HTTP response which may be read in chunks"""
+    status = 200
+
+    def __init__(self, body):
+        self.read = io.BytesIO(body).read
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class _ZoneConnection(_FakeConnection):
+    """Answers SOA record calls with the zone's SOA record, and any other
+    call with its /AllRecord/ response
+    """
+
+    def __init__(self, bodies):
+        self._bodies = bodies
+        self._uri = None
+
+    def putrequest(self, method, uri):
+        self._uri = uri
+
+    def getresponse(self):
+        key = 'soa' if '/SOARecord/' in self._uri else 'all'
+        return _StreamedResponse(self._bodies[key])
+
+
+class _Sink(object):
+    """A file which counts, and discards, the text written to it"""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, text):
+        self.size += len(text)
+
+
+def objects(zone, fp):
+    """Build every record of *zone*, then write them out"""
+    records = zone.get_all_records()
+    return write_zonefile(fp, ({'fqdn': x.fqdn, 'ttl': x.ttl,
+                                'record_type': x.rec_name.upper(),
+                                'rdata': DNSRecord.rdata(x)}
+                               for records in records.values()
+                               for x in records), zone.name)
+
+
+def export(zone, fp):
+    """Write every record of *zone* out straight from the API's response"""
+    return zone.export_zonefile(fp)
+
+
+def measure(zone, func):
+    """Write *zone* out with *func*, returning the seconds taken and the peak
+    bytes allocated. Memory is traced in a second run, as tracing slows the
+    first down
+    """
+    gc.collect()
+    sink = _Sink()
+    start = time.time()
+    count = func(zone, sink)
+    elapsed = time.time() - start
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(zone, _Sink())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'records': count, 'seconds': elapsed, 'bytes': peak,
+            'size': sink.size}
+
+
+def run(records=500000):
+    """Time both ways of writing out a zone holding *records* records.
+    Returns a *dict* mapping each way to its timing and memory use
+    """
+    payload = all_record_payload(records)
+    payload['data']['soa_records'] = [SOA]
+    soa = dict(payload, data=[SOA])
+    bodies = {'all': json_dumps(payload).encode('UTF-8'),
+              'soa': json_dumps(soa).encode('UTF-8')}
+    del payload
+    session = DynectSession('customer', 'user', 'password', auto_auth=False)
+    session._pool.clear()
+    session._pool.factory = lambda: _ZoneConnection(bodies)
+    session._new_connection = session._pool.factory
+    session._token = 'benchmark-token'
+    zone = Zone('example.com', api=False)
+    try:
+        return {'objects': measure(zone, objects),
+                'export': measure(zone, export)}
+    finally:
+        DynectSession.close_session()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--records', type=int, default=500000)
+    opts = parser.parse_args()
+
+    results = run(opts.records)
+    objects = results['objects']
+    print('{} records, {:.1f} MB written'.format(
+        objects['records'], objects['size'] / 1e6))
+    print('{:<10}{:>12}{:>10}{:>14}{:>10}'.format('method', 'write (s)',
+                                                  'speedup', 'peak (MB)',
+                                                  'saving'))
+    for method in ('objects', 'export'):
+        result = results[method]
+        print('{:<10}{:>12.2f}{:>9.1f}x{:>14.1f}{:>9.1f}x'.format(
+            method, result['seconds'], objects['seconds'] / result['seconds'],
+            result['bytes'] / 1e6, objects['bytes'] / float(result['bytes'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""dyn.aio provides an asyncio native counterpart to :mod:`dyn.core`. The
+:class:`~dyn.aio.AsyncSessionEngine` speaks HTTP/1.1 directly over asyncio
+streams, keeping a pool of keep-alive connections so that many API calls can
+be in flight at once from a single event loop. Note: this module requires
+Python 3.5 or higher.
+"""
+import ssl as ssl_lib
+import time
+import asyncio
+import logging
+from collections import deque
+
+from . import __version__
+from .compat import json_loads, force_unicode
+from .core import (SessionEngine, clean_args, _Retry, _overload_reason,
+                   _retry_after)
+from .jobs import JOB_TIMEOUT, JobTimeout, backoff
+from .retry import RetryPolicy, ZoneBackoff, zone_key
+
+__author__ = 'jnappi'
+__all__ = ['AsyncConnection', 'AsyncConnectionPool', 'AsyncSessionEngine']
+
+
+class _Response(object):
+    """A fully read HTTP response"""
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def getheader(self, name, default=None):
+        """Return the value of the response header *name*"""
+        return self.headers.get(name.lower(), default)
+
+
+class AsyncConnection(object):
+    """A single keep-alive HTTP/1.1 connection built on asyncio streams"""
+
+    def __init__(self, host, port, ssl_context=None, timeout=300):
+        """Create a new :class:`~dyn.aio.AsyncConnection`. The connection is
+        not opened until the first request is made.
+
+        :param host: The host to connect to
+        :param port: The port to connect to
+        :param ssl_context: An ``ssl.SSLContext`` to wrap the connection with,
+            or *None* for an unencrypted connection
+        :param timeout: The number of seconds to wait on any single request
+        """
+        super(AsyncConnection, self).__init__()
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self._reader = self._writer = None
+
+    @property
+    def is_open(self):
+        """Whether or not this connection currently has an open stream which
+        the server has not closed
+        """
+        return self._writer is not None and not self._reader.at_eof()
+
+    async def open(self):
+        """Open the underlying stream to the server"""
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl_context)
+
+    def close(self):
+        """Close the underlying stream, if open"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def request(self, method, uri, headers, body=b''):
+        """Send a single HTTP request and read the full response
+
+        :param method: The HTTP method to use
+        :param uri: The uri of the resource to interact with
+        :param headers: A *dict* of request headers
+        :param body: The encoded request body
+        :return: A response object exposing ``status``, ``getheader`` and
+            ``body``
+        """
+        if not self.is_open:
+            await self.open()
+        lines = ['{} {} HTTP/1.1'.format(method, uri),
+                 'Host: {}'.format(self.host),
+                 'Content-Length: {}'.format(len(body))]
+        lines.extend('{}: {}'.format(key, val)
+                     for key, val in headers.items())
+        head = '\r\n'.join(lines) + '\r\n\r\n'
+        self._writer.write(head.encode('latin-1') + body)
+        await self._writer.drain()
+        return await asyncio.wait_for(self._read_response(), self.timeout)
+
+    async def _read_response(self):
+        """Read and parse a full HTTP response off of the stream"""
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionError('Server closed the connection')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, val = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = val.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self._reader.readline()).split(b';')[0],
+                           16)
+                if size == 0:
+                    await self._reader.readline()
+                    break
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await self._reader.readexactly(
+                int(headers['content-length']))
+        else:
+            body = await self._reader.read()
+
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return _Response(status, headers, body)
+
+
+class AsyncConnectionPool(object):
+    """A pool of :class:`~dyn.aio.AsyncConnection`'s. Limits the number of
+    requests in flight to the size of the pool, reusing idle keep-alive
+    connections whenever possible
+    """
+
+    def __init__(self, factory, size=10, idle_timeout=60):
+        """Create a new :class:`~dyn.aio.AsyncConnectionPool`
+
+        :param factory: A callable returning a new
+            :class:`~dyn.aio.AsyncConnection`
+        :param size: The maximum number of connections this pool will hold
+        :param idle_timeout: The number of seconds a connection may sit unused
+            in the pool before it is closed and evicted
+        """
+        super(AsyncConnectionPool, self).__init__()
+        if size < 1:
+            raise ValueError('AsyncConnectionPool size must be at least 1')
+        self.factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = deque()
+        self._semaphore = None
+
+    async def get(self):
+        """Check a connection out of this pool, waiting for one to be returned
+        if the pool is exhausted
+        """
+        if self._semaphore is None:
+            # Created lazily so that it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self.size)
+        await self._semaphore.acquire()
+        cutoff = None
+        if self.idle_timeout is not None:
+            cutoff = time.time() - self.idle_timeout
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if (cutoff is None or last_used >= cutoff) and conn.is_open:
+                return conn
+            conn.close()
+        return self.factory()
+
+    def put(self, conn, discard=False):
+        """Return a connection to this pool
+
+        :param conn: A connection previously checked out via
+            :meth:`~dyn.aio.AsyncConnectionPool.get`
+        :param discard: If *True* the connection is closed rather than kept
+            for reuse
+        """
+        if discard:
+            conn.close()
+        else:
+            self._idle.append((conn, time.time()))
+        self._semaphore.release()
+
+    def clear(self):
+        """Close all idle connections held by this pool"""
+        while self._idle:
+            conn, _ = self._idle.pop()
+            conn.close()
+
+
+class AsyncSessionEngine(object):
+    """Base object representing an asyncio based API Session. The request
+    preparation and response bookkeeping mirror that of
+    :class:`~dyn.core.SessionEngine`, only the transport differs.
+    """
+    _valid_methods = tuple()
+    uri_root = '/'
+
+    # Transport agnostic helpers shared with the blocking SessionEngine
+    _validate_uri = SessionEngine._validate_uri
+    _validate_method = SessionEngine._validate_method
+    _prepare_arguments = SessionEngine._prepare_arguments
+    _meta_update = SessionEngine._meta_update
+    _idempotent = SessionEngine._idempotent
+    name = SessionEngine.name
+
+    def __init__(self, host=None, port=443, ssl=True, pool_size=10,
+                 pool_idle_timeout=60, timeout=300, retry_policy=None):
+        """Initialize an asyncio API session
+
+        :param host: API server address
+        :param port: Port to connect to the API server
+        :param ssl: Enable SSL
+        :param pool_size: The maximum number of API calls which may be in
+            flight at any given time
+        :param pool_idle_timeout: The number of seconds an unused connection
+            is kept open before being closed
+        :param timeout: The number of seconds to wait on any single request
+        :param retry_policy: The :class:`~dyn.retry.RetryPolicy` governing
+            which failed calls are retried and how long to back off between
+            attempts. Defaults to :class:`~dyn.retry.RetryPolicy`'s defaults
+        """
+        super(AsyncSessionEngine, self).__init__()
+        self.extra_headers = dict()
+        self.logger = logging.getLogger(self.name)
+        self.host = host
+        self.port = port
+        self.ssl = ssl
+        self.timeout = timeout
+        self.poll_incomplete = True
+        self.content_type = 'application/json'
+        self._token = self._last_response = None
+        self._permissions = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._zone_backoff = ZoneBackoff()
+        self._ssl_context = ssl_lib.create_default_context() if ssl else None
+        self._pool = AsyncConnectionPool(self._new_connection, pool_size,
+                                         pool_idle_timeout)
+
+    def _new_connection(self):
+        """Create a new, unopened, connection to the API server"""
+        msg = 'Establishing {} connection to {}:{}'
+        self.logger.info(msg.format('SSL' if self.ssl else 'unencrypted',
+                                    self.host, self.port))
+        return AsyncConnection(self.host, self.port, self._ssl_context,
+                               self.timeout)
+
+    def _headers(self):
+        """Build the headers to send along with an API request"""
+        headers = {'Content-Type': self.content_type,
+                   'User-Agent': 'dyn-py v{}'.format(__version__)}
+        headers.update(self.extra_headers)
+        if self._token is not None:
+            headers['Auth-Token'] = self._token
+        return headers
+
+    async def _request(self, uri, method, body):
+        """Send a request over a pooled connection and return the response
+
+        :param uri: The uri of the resource to interact with
+        :param method: The HTTP method to use
+        :param body: Encoded arguments to send to the server
+        """
+        conn = await self._pool.get()
+        discard = True
+        try:
+            response = await conn.request(method, uri, self._headers(),
+                                          body.encode('UTF-8'))
+            discard = False
+            return response
+        finally:
+            self._pool.put(conn, discard=discard)
+
+    async def execute(self, uri, method, args=None, final=False):
+        """Execute a commands against the rest server. Failed calls are
+        retried, without blocking the event loop, as governed by this
+        session's :class:`~dyn.retry.RetryPolicy`
+
+        :param uri: The uri of the resource to access. /REST/ will be prepended
+            if it is not at the beginning of the uri
+        :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
+        :param args: Any arguments to be sent as a part of the request
+        :param final: boolean flag representing whether or not this call may
+            be retried if it fails
+        """
+        uri = self._validate_uri(uri)
+        self._validate_method(method)
+        raw_args, args, uri = self._prepare_arguments(args, method, uri)
+
+        msg = 'uri: {}, method: {}, args: {}'
+        self.logger.debug(msg.format(uri, method, clean_args(raw_args)))
+
+        policy = self.retry_policy
+        idempotent = self._idempotent(uri, method)
+        zone = zone_key(uri)
+        started = time.time()
+        attempt = 0
+        while True:
+            attempt += 1
+            last = final or policy.exhausted(attempt, started)
+            await self._wait_for_zone(zone)
+            retry_after = None
+            try:
+                return await self._attempt(uri, method, args, raw_args, last)
+            except (IOError, asyncio.TimeoutError,
+                    asyncio.IncompleteReadError):
+                # The failed connection has already been discarded
+                if last or not policy.retries(RetryPolicy.CONNECTION,
+                                              idempotent) or \
+                        not await self._handle_error(uri, method, raw_args):
+                    raise
+                reason = RetryPolicy.CONNECTION
+            except _Retry as e:
+                reason, retry_after = e.reason, e.retry_after
+
+            delay = policy.delay(attempt, started)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            msg = 'Retrying {} {} in {:.2f}s after attempt {} ({})'
+            self.logger.info(msg.format(method, uri, delay, attempt, reason))
+            if reason == RetryPolicy.BLOCKED and zone is not None:
+                self._zone_backoff.hold(zone, delay)
+            else:
+                await asyncio.sleep(delay)
+
+    async def _wait_for_zone(self, zone):
+        """Wait, without blocking the event loop, until *zone* is no longer
+        being held
+
+        :param zone: The name of the zone about to be called, or *None*
+        """
+        remaining = self._zone_backoff.remaining(zone)
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            remaining = self._zone_backoff.remaining(zone)
+
+    async def _attempt(self, uri, method, args, raw_args, last):
+        """Make a single attempt at an API call over a pooled connection
+
+        :param uri: The validated uri of the resource to access
+        :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
+        :param args: The encoded arguments to send to the server
+        :param raw_args: The arguments as passed to
+            :meth:`~dyn.aio.AsyncSessionEngine.execute`
+        :param last: Whether or not this is the last attempt allowed
+        """
+        response = await self._request(uri, method, args)
+        reason = _overload_reason(response.status)
+        if reason is not None and not last and \
+                self.retry_policy.retries(reason,
+                                          self._idempotent(uri, method)):
+            raise _Retry(reason, _retry_after(response))
+        return await self._handle_response(response, uri, method, raw_args,
+                                           last)
+
+    async def _handle_error(self, uri, method, raw_args):
+        """Handle the processing of a connection error with the api, repairing
+        this session as needed. Return *True* if the failed call may safely be
+        retried. Note, to be implemented as needed in subclasses.
+        """
+        return False
+
+    async def _handle_response(self, response, uri, method, raw_args, final):
+        """Handle the processing of the API's response"""
+        self.logger.debug('RESPONSE: {0}'.format(response.body))
+        self._last_response = response
+        if self.poll_incomplete:
+            response = await self.poll_response(response)
+            self._last_response = response
+        ret_val = json_loads(response.body)
+
+        self._meta_update(uri, method, ret_val)
+        # Handle retrying if ZoneProp is blocking the current task
+        error_msg = 'Operation blocked by current task'
+        if ret_val['status'] == 'failure' and error_msg in \
+                ret_val['msgs'][0]['INFO'] and not final and \
+                self.retry_policy.retries(RetryPolicy.BLOCKED):
+            raise _Retry(RetryPolicy.BLOCKED)
+        return await self._process_response(ret_val, method, final)
+
+    async def _process_response(self, response, method, final=False):
+        """API Method. Process an API response for failure, incomplete, or
+        success and throw any appropriate errors
+        """
+        return response
+
+    async def poll_response(self, response, timeout=JOB_TIMEOUT):
+        """While a response indicates that the job is incomplete, poll the
+        redirect location for the final response, backing off between polls,
+        without blocking the event loop
+
+        :param response: the response containing return codes
+        :param timeout: how long (in seconds) to poll for before raising a
+            :class:`~dyn.jobs.JobTimeout`
+        """
+        deadline = time.time() + timeout
+        delays = backoff()
+        while response.status == 307:
+            uri = response.getheader('Location')
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise JobTimeout('Job {} did not complete within {} '
+                                 'seconds'.format(uri, timeout))
+            await asyncio.sleep(min(next(delays), remaining))
+            self.logger.info('Polling {}'.format(uri))
+            response = await self._request(uri, 'GET', '')
+        return response
+
+    async def close(self):
+        """Close all pooled connections held by this session"""
+        self._pool.clear()
+
+    def __str__(self):
+        """str override"""
+        return force_unicode('<{}>').format(self.name)
+
+    __repr__ = __unicode__ = __str__
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""This module contains an optional read-through cache for the results of GET
+API calls. Cached results expire after a fixed time to live, the least
+recently used are evicted once the cache is full, and any write made through
+the same session invalidates the cached results it may have changed::
+
+    >>> from dyn.cache import ResponseCache
+    >>> from dyn.tm.session import DynectSession
+    >>> s = DynectSession('customer', 'user', 'password',
+    ...                   cache=ResponseCache(ttl=30))
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from .compat import json, json_dumps, json_loads
+from .retry import zone_key
+
+__author__ = 'jnappi'
+__all__ = ['ResponseCache']
+
+#: API resources whose responses must never be served from a cache
+_UNCACHEABLE = ('Session', 'Job')
+
+
+def _resource(uri):
+    """Return the name of the API resource at *uri*, ie 'ARecord'"""
+    segments = uri.split('?')[0].strip('/').split('/')
+    return segments[1] if len(segments) > 1 else None
+
+
+class ResponseCache(object):
+    """A thread-safe, size bounded, cache of GET responses. Entries are scoped
+    by the zone (or other top level resource) their uri refers to. A write to
+    a scope invalidates every entry in that scope, along with any unscoped
+    listings such as '/REST/Zone/'.
+    """
+
+    def __init__(self, ttl=30, max_entries=1024):
+        """Create a new :class:`~dyn.cache.ResponseCache`
+
+        :param ttl: The number of seconds a response remains valid
+        :param max_entries: The maximum number of responses held at once
+        """
+        super(ResponseCache, self).__init__()
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        self._init_state()
+
+    def _init_state(self):
+        """Build an empty store and its lock"""
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(uri, args):
+        """Build the cache key for a GET of *uri* with *args*
+
+        :param uri: A validated API uri
+        :param args: A *dict* of arguments sent along with the request
+        """
+        uri = '/'.join(x for x in uri.split('/') if x)
+        return uri, json.dumps(args, sort_keys=True) if args else ''
+
+    def cacheable(self, uri):
+        """Return whether or not responses for *uri* may be cached"""
+        return _resource(uri) not in _UNCACHEABLE
+
+    def get(self, key):
+        """Return a fresh copy of the response stored under *key*, or *None* if
+        it is missing or has expired
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= time.time():
+                self.misses += 1
+                return None
+            # Reinsert to mark this entry as the most recently used
+            self._entries[key] = entry
+            self.hits += 1
+        # Entries are stored serialized so that callers mutating a response
+        # can never corrupt the cached copy
+        return json_loads(entry[2])
+
+    def set(self, key, response):
+        """Store *response* under *key*
+
+        :param key: A key built by :meth:`~dyn.cache.ResponseCache.key`
+        :param response: The processed, JSON serializable, API response
+        """
+        entry = (time.time() + self.ttl, zone_key(key[0]),
+                 json_dumps(response))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uri):
+        """Drop every entry which a write to *uri* may have made stale
+
+        :param uri: The uri of a POST, PUT or DELETE call
+        """
+        scope = zone_key(uri)
+        with self._lock:
+            if scope is None:
+                # Logins, logouts and unscoped writes may change anything
+                self._entries.clear()
+                return
+            stale = [key for key, entry in self._entries.items()
+                     if entry[1] is None or entry[1] == scope]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        """The number of responses currently cached, including expired
+        entries which have not yet been evicted
+        """
+        return len(self._entries)
+
+    def __getstate__(self):
+        """Locks can't be pickled, and cached responses aren't worth
+        shipping
+        """
+        d = self.__dict__.copy()
+        d.pop('_entries', None)
+        d.pop('_lock', None)
+        return d
+
+    def __setstate__(self, state):
+        """Rebuild an empty store after unpickling"""
+        self.__dict__ = state
+        self._init_state()
+
+    def __str__(self):
+        """str override"""
+        return '<ResponseCache>: {}/{} entries, {}s ttl'.format(
+            len(self), self.max_entries, self.ttl)
+
+    __repr__ = __unicode__ = __str__
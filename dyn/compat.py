@@ -2,6 +2,7 @@
 """python 2-3 compatability layer. The bulk of this was borrowed from
 kennethreitz's requests module
 """
+import os
 import sys
 from datetime import datetime
 
@@ -34,6 +35,9 @@ if is_py2:
     from httplib import (HTTPConnection, HTTPSConnection,
                          HTTPException)
     from urllib import urlencode, pathname2url
+    from urlparse import parse_qs
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
 
     string_types = (str, unicode)  # NOQA
 
@@ -75,8 +79,10 @@ if is_py2:
 elif is_py3:
     from http.client import (HTTPConnection, HTTPSConnection,  # NOQA
                              HTTPException)  # NOQA
-    from urllib.parse import urlencode  # NOQA
+    from urllib.parse import urlencode, parse_qs  # NOQA
     from urllib.request import pathname2url  # NOQA
+    from http.server import BaseHTTPRequestHandler, HTTPServer  # NOQA
+    from socketserver import ThreadingMixIn  # NOQA
     import json  # NOQA
     string_types = (str,)
 
@@ -107,3 +113,78 @@ elif is_py3:
         if date_string[-3] != ':':
             date_string = date_string[:-2] + ':' + date_string[-2:]
         return date_string
+
+# -------------
+# JSON Backends
+# -------------
+
+#: Names of the supported JSON backends, in the order 'auto' prefers them
+JSON_BACKENDS = ('orjson', 'ujson', 'simplejson', 'stdlib')
+
+
+def _stdlib_loads(data):
+    if isinstance(data, bytes):
+        data = data.decode('UTF-8')
+    return json.loads(data)
+
+
+def _load_json_backend(name):
+    """Import the JSON backend *name* and return its (dumps, loads) pair. All
+    dumps functions return text, all loads functions accept text or UTF-8
+    encoded bytes
+    """
+    if name in ('stdlib', 'json'):
+        return json.dumps, _stdlib_loads
+    if name == 'orjson':
+        import orjson
+
+        def dumps(obj):
+            return orjson.dumps(obj).decode('UTF-8')
+        return dumps, orjson.loads
+    if name == 'ujson':
+        import ujson
+        return ujson.dumps, ujson.loads
+    if name == 'simplejson':
+        import simplejson
+        return simplejson.dumps, _stdlib_loads
+    raise ValueError('Unknown JSON backend {!r}, expected one of {}'.format(
+        name, ', '.join(JSON_BACKENDS + ('auto',))))
+
+
+def set_json_backend(name='auto'):
+    """Select the JSON library used to encode API requests and decode API
+    responses. Returns the name of the backend selected.
+
+    :param name: One of 'stdlib', 'orjson', 'ujson', 'simplejson', or 'auto'
+        to use the fastest of those which is installed
+    """
+    global _json_backend, _json_dumps, _json_loads
+    if name == 'auto':
+        for candidate in JSON_BACKENDS:
+            try:
+                return set_json_backend(candidate)
+            except ImportError:
+                continue
+    _json_dumps, _json_loads = _load_json_backend(name)
+    _json_backend = 'stdlib' if name == 'json' else name
+    return _json_backend
+
+
+def get_json_backend():
+    """Return the name of the JSON backend currently in use"""
+    return _json_backend
+
+
+def json_dumps(obj):
+    """Serialize *obj* to a JSON formatted string using the selected backend"""
+    return _json_dumps(obj)
+
+
+def json_loads(data):
+    """Deserialize *data*, JSON formatted text or UTF-8 encoded bytes, using
+    the selected backend
+    """
+    return _json_loads(data)
+
+
+set_json_backend(os.environ.get('DYN_JSON_BACKEND', 'stdlib'))
@@ -8,13 +8,21 @@ import base64
 import copy
 import time
 import locale
+import math
+import select
 import logging
 import threading
+import weakref
+from collections import deque, namedtuple
+from contextlib import contextmanager
 from datetime import datetime
 
 from . import __version__
-from .compat import (HTTPConnection, HTTPSConnection, HTTPException, json,
-                     prepare_to_send, force_unicode)
+from .compat import (HTTPConnection, HTTPSConnection, HTTPException,
+                     json_dumps, json_loads, prepare_to_send, force_unicode)
+from .jobs import JOB_TIMEOUT, JobHandle, JobPoller, JobTimeout, backoff
+from .retry import RetryPolicy, ZoneBackoff, zone_key
+from .stream import StreamDecoder
 
 
 def cleared_class_dict(dict_obj):
@@ -25,65 +33,403 @@ def cleared_class_dict(dict_obj):
             not hasattr(dict_obj[x], '__call__')}
 
 
+#: Parameter names used in place of the variable segments of an API uri by
+#: endpoint_template, for resources whose segments aren't zone/fqdn/id
+_TEMPLATE_PARAMS = {'Job': ('job_id',), 'User': ('user_name',),
+                    'Contact': ('nickname',), 'Task': ('task_id',),
+                    'TrafficDirector': ('service_id',),
+                    'DSFRuleset': ('service_id', 'ruleset_id'),
+                    'DSFResponsePool': ('service_id', 'response_pool_id'),
+                    'DSFRecordSet': ('service_id', 'record_set_id'),
+                    'DSFRecord': ('service_id', 'record_id'),
+                    'DSFMonitor': ('monitor_id',),
+                    'DSFNode': ('service_id',)}
+_DEFAULT_PARAMS = ('zone', 'fqdn', 'id')
+
+
+def endpoint_template(uri):
+    """Collapse an API uri into the template of the endpoint it calls, so that
+    calls against different zones, nodes or records can be aggregated. ie,
+    '/REST/ARecord/example.com/www.example.com/12345/' becomes
+    '/REST/ARecord/{zone}/{fqdn}/{id}/'
+
+    :param uri: A validated API uri
+    """
+    path = uri.split('?')[0]
+    segments = [x for x in path.split('/') if x]
+    # Only REST uri's embed variable segments, others are returned as is
+    if len(segments) < 3 or segments[0] != 'REST':
+        return path
+    names = _TEMPLATE_PARAMS.get(segments[1], _DEFAULT_PARAMS)
+    params = []
+    for i, segment in enumerate(segments[2:]):
+        if i < len(names):
+            params.append('{' + names[i] + '}')
+        else:
+            params.append('{id}' if segment.isdigit() else '{name}')
+    template = '/' + '/'.join(segments[:2] + params)
+    return template + '/' if path.endswith('/') else template
+
+
 def clean_args(dict_obj):
     """Clean a dictionary of API arguments to prevent the display of plain text
-    passwords to users
+    passwords to users. A shallow copy is only made if there is a password to
+    mask, otherwise *dict_obj* itself is returned
 
     :param dict_obj: The dictionary of arguments to be cleaned
     """
-    cleaned_args = copy.deepcopy(dict_obj)
-    if 'password' in cleaned_args:
-        cleaned_args['password'] = '*****'
+    if 'password' not in dict_obj:
+        return dict_obj
+    cleaned_args = dict(dict_obj)
+    cleaned_args['password'] = '*****'
     return cleaned_args
 
 
+class _HeaderDict(dict):
+    """A *dict* of HTTP headers which counts its modifications, so that
+    headers built from it need only be rebuilt after it has changed
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_HeaderDict, self).__init__(*args, **kwargs)
+        self.version = 0
+
+    def _modifier(name):
+        def method(self, *args, **kwargs):
+            self.version += 1
+            return getattr(dict, name)(self, *args, **kwargs)
+        method.__name__ = name
+        return method
+
+    __setitem__ = _modifier('__setitem__')
+    __delitem__ = _modifier('__delitem__')
+    clear = _modifier('clear')
+    pop = _modifier('pop')
+    popitem = _modifier('popitem')
+    setdefault = _modifier('setdefault')
+    update = _modifier('update')
+    del _modifier
+
+    def __reduce__(self):
+        """Rebuild from a plain dict when unpickled, rather than replaying each
+        item through the counting __setitem__
+        """
+        return _HeaderDict, (dict(self),)
+
+
 class _Singleton(type):
+    #: Per-thread instances, keyed weakly on the thread so that an instance is
+    #: released once the thread it was created by exits and is collected
     _instances = {}
+    #: Instances shared by every thread which hasn't created its own
+    _shared = {}
+    #: Guards both registries
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        cur_thread = threading.current_thread()
+        shared = kwargs.pop('shared', False)
         key = getattr(cls, '__metakey__')
-        if key not in cls._instances:
-            cls._instances[key] = {
-                # super(Singleton, cls) evaluates to type; *args/**kwargs get
-                # passed to class __init__ method via type.__call__
-                cur_thread: super(_Singleton, cls).__call__(*args, **kwargs)
-            }
-        elif key in cls._instances and cur_thread not in cls._instances[key]:
-            cls._instances[key][cur_thread] = \
-                super(_Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[key][cur_thread]
+        if shared:
+            with cls._lock:
+                # Held across construction so that concurrent callers share a
+                # single login rather than racing to create their own
+                if key not in cls._shared:
+                    # super(Singleton, cls) evaluates to type; *args/**kwargs
+                    # get passed to class __init__ method via type.__call__
+                    cls._shared[key] = \
+                        super(_Singleton, cls).__call__(*args, **kwargs)
+                return cls._shared[key]
+        cur_thread = threading.current_thread()
+        with cls._lock:
+            instance = cls._instances.get(key, {}).get(cur_thread)
+        if instance is None:
+            instance = super(_Singleton, cls).__call__(*args, **kwargs)
+            cls._register(key, cur_thread, instance)
+        return instance
+
+    def _register(cls, key, thread, instance):
+        """Store *instance* as *thread*'s instance under *key*, dropping the
+        instances of any threads which have since exited
+        """
+        with cls._lock:
+            instances = cls._instances.get(key)
+            if instances is None:
+                instances = cls._instances[key] = weakref.WeakKeyDictionary()
+            for dead in [t for t in list(instances.keys())
+                         if not t.is_alive()]:
+                del instances[dead]
+            instances[thread] = instance
 
 
 # This class is a workaround for supporting metaclasses in both Python2 and 3
 class Singleton(_Singleton('SingletonMeta', (object,), {})):
     """A :class:`~dyn.core.Singleton` type for implementing a true Singleton
-    design pattern, cleanly, using metaclasses
+    design pattern, cleanly, using metaclasses. One instance is kept per
+    thread, unless the instance is created with ``shared=True``, in which case
+    it is shared by every thread which has no instance of its own
     """
     pass
 
 
-class _History(list):
-    """A *list* subclass specifically targeted at being able to store the
-    history of calls made via a SessionEngine
+class ConnectionPool(object):
+    """A thread-safe pool of keep-alive HTTP(S) connections. Connections are
+    lazily created by *factory*, checked out for the duration of a single API
+    call and returned afterwards so that they can be reused by other threads.
     """
 
-    def append(self, p_object):
-        """Override builtin list append operators to allow for the automatic
-        appendation of a timestamp for cleaner record keeping
+    def __init__(self, factory, size=1, idle_timeout=60):
+        """Create a new :class:`~dyn.core.ConnectionPool`
+
+        :param factory: A callable returning a new, unconnected,
+            HTTPConnection or HTTPSConnection
+        :param size: The maximum number of connections this pool will hold
+        :param idle_timeout: The number of seconds a connection may sit unused
+            in the pool before it is closed and evicted
+        """
+        super(ConnectionPool, self).__init__()
+        if size < 1:
+            raise ValueError('ConnectionPool size must be at least 1')
+        self.factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = deque()
+        self._created = 0
+        self._cond = threading.Condition(threading.Lock())
+
+    @staticmethod
+    def _is_healthy(conn):
+        """Return whether or not *conn* is safe to reuse. An idle keep-alive
+        socket should never be readable, if it is then the server has either
+        closed it or sent unsolicited data.
+        """
+        sock = getattr(conn, 'sock', None)
+        if sock is None:
+            # Not yet connected, http.client will open it on next use
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (IOError, OSError, ValueError, select.error):
+            return False
+        return not readable
+
+    def _evict_idle(self):
+        """Close any connections which have been idle longer than
+        idle_timeout. Must be called with the pool's lock held.
+        """
+        if self.idle_timeout is None:
+            return
+        cutoff = time.time() - self.idle_timeout
+        # The oldest idle connections are at the left of the deque
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._created -= 1
+            conn.close()
+
+    def get(self, timeout=None):
+        """Check a connection out of this pool, creating a new one if the pool
+        has not yet reached its maximum size. If all connections are in use,
+        block until one is returned.
+
+        :param timeout: The maximum number of seconds to wait for a connection
+            to become available, or *None* to wait indefinitely
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                self._evict_idle()
+                while self._idle:
+                    # Most recently used first, it is the most likely to
+                    # still be alive
+                    conn, _ = self._idle.pop()
+                    if self._is_healthy(conn):
+                        return conn
+                    self._created -= 1
+                    conn.close()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise RuntimeError('Timed out waiting for a '
+                                           'connection from the pool')
+                    self._cond.wait(remaining)
+        try:
+            return self.factory()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def put(self, conn, discard=False):
+        """Return a connection to this pool
+
+        :param conn: A connection previously checked out via
+            :meth:`~dyn.core.ConnectionPool.get`
+        :param discard: If *True* the connection is closed rather than kept
+            for reuse, ie. after a failed request left it in an unknown state
+        """
+        with self._cond:
+            if discard:
+                self._created -= 1
+                conn.close()
+            else:
+                self._idle.append((conn, time.time()))
+            self._cond.notify()
+
+    def clear(self):
+        """Close all idle connections held by this pool. Connections which
+        are currently checked out will be closed when they are returned.
         """
-        now_ts = datetime.now().isoformat()
-        super(_History, self).append(tuple([now_ts] + list(p_object)))
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._created -= 1
+                conn.close()
+            self._cond.notify_all()
+
+    def __len__(self):
+        """The number of connections currently owned by this pool"""
+        return self._created
+
+
+class _Retry(Exception):
+    """Raised internally by the response handling machinery to signal to
+    :meth:`~dyn.core.SessionEngine.execute` that the current attempt should be
+    retried, for the given *reason*, as governed by the session's
+    :class:`~dyn.retry.RetryPolicy`
+    """
+
+    def __init__(self, reason, retry_after=None):
+        super(_Retry, self).__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _overload_reason(status):
+    """Return the :class:`~dyn.retry.RetryPolicy` reason an HTTP *status*
+    reports the API as being overloaded for, if any
+    """
+    if status == 429:
+        return RetryPolicy.THROTTLED
+    if status >= 500:
+        return RetryPolicy.SERVER
+    return None
+
+
+def _retry_after(response):
+    """Return the number of seconds an HTTP *response* asked the client to
+    wait before retrying, if it gave one
+    """
+    try:
+        return float(response.getheader('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _sleep_until_due(delays, deadline, uri, timeout):
+    """Sleep until the job at *uri* is next due to be polled, or raise a
+    :class:`~dyn.jobs.JobTimeout` if its *deadline* has already passed
+
+    :param delays: The job's :func:`~dyn.jobs.backoff` schedule
+    :param deadline: The time after which the job is given up on
+    :param uri: The uri the job is polled at
+    :param timeout: The number of seconds the job was given to complete
+    """
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise JobTimeout('Job {} did not complete within {} seconds'.format(
+            uri, timeout))
+    time.sleep(min(next(delays), remaining))
+
+
+class HistoryEntry(namedtuple('HistoryEntry', [
+        'timestamp', 'uri', 'method', 'args', 'status', 'http_status',
+        'latency', 'response_bytes', 'retries'])):
+    """The record of a single API call, as stored in a session's history.
+    *timestamp* is the time at which the call was made as an ISO 8601 string,
+    *latency* is the number of seconds it took, including any polling and
+    retries, and *status* is the API's status for the call, or *None* if it
+    failed without a response
+    """
+    __slots__ = ()
+
+    @property
+    def error(self):
+        """Whether or not this call failed"""
+        return self.status != 'success'
+
+
+def _percentile(ordered, percent):
+    """Return the nearest-rank *percent* percentile of the sorted list
+    *ordered*
+    """
+    index = int(math.ceil(percent / 100.0 * len(ordered))) - 1
+    return ordered[max(index, 0)]
+
+
+class _History(deque):
+    """A bounded *deque* specifically targeted at being able to store the
+    history of calls made via a SessionEngine. Once full, recording a new call
+    discards the oldest.
+    """
+
+    def stats(self):
+        """Aggregate the calls in this history by endpoint. Returns a *dict*
+        keyed by (method, endpoint template) tuples, as built by
+        :func:`~dyn.core.endpoint_template`, whose values are *dict*'s holding
+        the number of calls, errors and retries made, the error rate, and the
+        p50, p95 and p99 latencies in seconds
+        """
+        grouped = {}
+        for entry in list(self):
+            key = (entry.method, endpoint_template(entry.uri))
+            grouped.setdefault(key, []).append(entry)
+        stats = {}
+        for key, entries in grouped.items():
+            latencies = sorted(x.latency for x in entries)
+            errors = sum(1 for x in entries if x.error)
+            stats[key] = {'calls': len(entries), 'errors': errors,
+                          'error_rate': errors / float(len(entries)),
+                          'retries': sum(x.retries for x in entries),
+                          'p50': _percentile(latencies, 50),
+                          'p95': _percentile(latencies, 95),
+                          'p99': _percentile(latencies, 99)}
+        return stats
+
+
+class _CallRecord(object):
+    """Details of the API call currently being executed by a thread, which
+    are gathered as its response is handled
+    """
+    __slots__ = ('uri', 'method', 'status', 'http_status', 'response_bytes',
+                 'sent_at')
+
+    def __init__(self, uri, method):
+        self.uri = uri
+        self.method = method
+        self.status = self.http_status = None
+        self.response_bytes = 0
+        self.sent_at = None
 
 
 class SessionEngine(Singleton):
     """Base object representing a DynectSession Session"""
     _valid_methods = tuple()
     uri_root = '/'
+    #: Instance attributes holding connections, locks or threads which can not
+    #: be pickled, and are rebuilt by _init_transport after unpickling
+    _transient_attrs = ('_local', '_pool', '_job_poller', '_job_lock',
+                        '_zone_backoff', '_session_lock', '_observers')
 
     def __init__(self, host=None, port=443, ssl=True, history=False,
                  proxy_host=None, proxy_port=None, proxy_user=None,
-                 proxy_pass=None):
+                 proxy_pass=None, pool_size=1, pool_idle_timeout=60,
+                 retry_policy=None, cache=None, history_size=None,
+                 rate_limiter=None):
         """Initialize a Dynect Rest Session object and store the provided
         credentials
 
@@ -96,10 +442,25 @@ class SessionEngine(Singleton):
         :param proxy_port: The port that the proxy is served on
         :param proxy_user: A username to connect to the proxy with if required
         :param proxy_pass: A password to connect to the proxy with if required
+        :param pool_size: The maximum number of concurrent keep-alive
+            connections this session may open to the API. All connections
+            share this session's auth token
+        :param pool_idle_timeout: The number of seconds an unused connection
+            is kept open before being closed
+        :param retry_policy: The :class:`~dyn.retry.RetryPolicy` governing
+            which failed calls are retried, defaults to a
+            :class:`~dyn.retry.RetryPolicy` with its default settings
+        :param cache: An optional :class:`~dyn.cache.ResponseCache` to serve
+            repeated GET calls from
+        :param history_size: The maximum number of calls kept in this
+            session's history, or *None* to keep every call
+        :param rate_limiter: An optional :class:`~dyn.ratelimit.RateLimiter`
+            shared by every thread using this session
         :return: SessionEngine object
         """
         super(SessionEngine, self).__init__()
-        self.__call_cache = _History() if history else None
+        self.__call_cache = _History(maxlen=history_size) if history else None
+        self._prebuilt_headers = None
         self.extra_headers = dict()
         self.logger = logging.getLogger(self.name)
         self.host = host
@@ -112,13 +473,34 @@ class SessionEngine(Singleton):
         self.poll_incomplete = True
         self.content_type = 'application/json'
         self._encoding = locale.getdefaultlocale()[-1] or 'UTF-8'
+        self.pool_size = pool_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self._init_transport()
         self._token = self._conn = self._last_response = None
         self._permissions = None
 
+    def _init_transport(self):
+        """Build the non-serializable, thread related, state of this session:
+        the connection pool and the thread local storage tracking which pooled
+        connection each thread currently has checked out
+        """
+        self._local = threading.local()
+        self._pool = ConnectionPool(self._new_connection, self.pool_size,
+                                    self.pool_idle_timeout)
+        self._job_poller = None
+        self._job_lock = threading.Lock()
+        self._zone_backoff = ZoneBackoff()
+        self._session_lock = threading.RLock()
+        self._observers = []
+
     @classmethod
     def new_session(cls, *args, **kwargs):
         """Return a new session instance, regardless of whether or not there is
-        already an existing session.
+        already an existing session. A shared session replaced by a new one is
+        logged out and its connections closed.
 
         :param args: Arguments to be passed to the Singleton __call__ method
         :param kwargs: keyword arguments to be passed to the Singleton __call__
@@ -126,6 +508,12 @@ class SessionEngine(Singleton):
         """
         cur_thread = threading.current_thread()
         key = getattr(cls, '__metakey__')
+        if kwargs.get('shared', False):
+            with cls._lock:
+                replaced = cls._shared.pop(key, None)
+            if replaced is not None:
+                replaced._release()
+            return cls.__call__(*args, **kwargs)
         instance = cls._instances.get(key, {}).get(cur_thread, None)
         if instance:
             instance.close_session()
@@ -134,24 +522,49 @@ class SessionEngine(Singleton):
     @classmethod
     def get_session(cls):
         """Return the current session for this Session type or None if there is
-        not an active session
+        not an active session. A session created by the current thread takes
+        precedence over a shared session
         """
         cur_thread = threading.current_thread()
         key = getattr(cls, '__metakey__')
-        return cls._instances.get(key, {}).get(cur_thread, None)
+        with cls._lock:
+            instance = cls._instances.get(key, {}).get(cur_thread, None)
+            if instance is None:
+                instance = cls._shared.get(key, None)
+        return instance
+
+    @classmethod
+    def set_session(cls, session, shared=False):
+        """Make an existing session, ie one which has been unpickled, the
+        current session for this Session type
+
+        :param session: The session instance to register
+        :param shared: If *True*, register *session* as the session shared by
+            every thread, otherwise as the current thread's session
+        """
+        key = getattr(cls, '__metakey__')
+        if shared:
+            with cls._lock:
+                cls._shared[key] = session
+        else:
+            cls._register(key, threading.current_thread(), session)
 
     @classmethod
     def close_session(cls):
         """Remove the current session from the dict of instances and return it.
-        If there was not currently a session being stored, return None. If,
-        after removing this session, there is nothing under the current key,
-        delete that key's entry in the _instances dict.
+        If the current thread has no session of its own, the shared session is
+        removed instead. If there was not currently a session being stored,
+        return None. If, after removing this session, there is nothing under
+        the current key, delete that key's entry in the _instances dict.
         """
         cur_thread = threading.current_thread()
         key = getattr(cls, '__metakey__')
-        closed = cls._instances.get(key, {}).pop(cur_thread, None)
-        if len(cls._instances.get(key, {})) == 0:
-            cls._instances.pop(key, None)
+        with cls._lock:
+            closed = cls._instances.get(key, {}).pop(cur_thread, None)
+            if closed is None:
+                closed = cls._shared.pop(key, None)
+            if len(cls._instances.get(key, {})) == 0:
+                cls._instances.pop(key, None)
         return closed
 
     @property
@@ -159,10 +572,96 @@ class SessionEngine(Singleton):
         """A human readable version of the name of this object"""
         return str(self.__class__).split('.')[-1][:-2]
 
+    @property
+    def extra_headers(self):
+        """A *dict* of additional HTTP headers sent along with every request"""
+        return self._extra_headers
+
+    @extra_headers.setter
+    def extra_headers(self, value):
+        self._extra_headers = _HeaderDict(value)
+        self._prebuilt_headers = None
+
+    @property
+    def content_type(self):
+        """The Content-Type of the bodies of requests sent by this session"""
+        return self._content_type
+
+    @content_type.setter
+    def content_type(self, value):
+        self._content_type = value
+        self._prebuilt_headers = None
+
+    def _headers(self):
+        """Return the headers, other than Auth-Token and Content-length, which
+        are sent with every request. These are only rebuilt after the session's
+        content_type or extra_headers have changed
+        """
+        extra = self._extra_headers
+        prebuilt = self._prebuilt_headers
+        if prebuilt is None or prebuilt[0] != extra.version:
+            user_agent = 'dyn-py v{}'.format(__version__)
+            headers = {'Content-Type': self._content_type,
+                       'User-Agent': user_agent}
+            headers.update(extra)
+            prebuilt = (extra.version, tuple(headers.items()))
+            self._prebuilt_headers = prebuilt
+        return prebuilt[1]
+
+    @property
+    def _conn(self):
+        """The pooled connection checked out by the current thread, or *None*
+        if this thread is not currently executing an API call
+        """
+        return getattr(self._local, 'conn', None)
+
+    @_conn.setter
+    def _conn(self, value):
+        self._local.conn = value
+
+    @contextmanager
+    def _checkout(self):
+        """Check a connection out of the pool for the current thread for the
+        duration of the context block. Nested calls made while a connection is
+        already checked out (ie, polling or re-authenticating from within
+        execute) reuse that same connection.
+        """
+        if self._conn is not None:
+            yield self._conn
+            return
+        conn = self._pool.get()
+        self._conn = conn
+        discard = False
+        try:
+            yield conn
+        except (IOError, HTTPException):
+            # The connection may be left mid-response, don't reuse it
+            discard = True
+            raise
+        finally:
+            self._conn = None
+            self._pool.put(conn, discard=discard)
+
+    def _release(self):
+        """Log this session out, if it is logged in, and close the idle
+        connections held by its pool, once it has been replaced. A failure to
+        log out is logged rather than raised, as the session is being
+        discarded either way
+        """
+        if self._token:
+            try:
+                self.execute('/REST/Session', 'DELETE', final=True)
+            except Exception as err:
+                self.logger.warning(
+                    'Unable to log out replaced session: {}'.format(err))
+            self._token = None
+        self._pool.clear()
+
     def connect(self):
         """Establishes a connection to the REST API server as defined by the
         host, port and ssl instance variables. If a proxy is specified, it
-        is used.
+        is used. Any connections previously held by this session's connection
+        pool are closed.
         """
         if self._token:
             self.logger.debug('Forcing logout from old session')
@@ -171,7 +670,16 @@ class SessionEngine(Singleton):
             self.execute('/REST/Session', 'DELETE')
             self.poll_incomplete = orig_value
             self._token = None
-        self._conn = None
+        self._pool.clear()
+        # Build the first connection up front so that any configuration
+        # errors are raised immediately rather than on the first API call
+        self._pool.put(self._pool.get())
+
+    def _new_connection(self):
+        """Create a new HTTP(S) connection to the REST API server as defined by
+        the host, port and ssl instance variables. If a proxy is specified, it
+        is used.
+        """
         use_proxy = False
         headers = {}
 
@@ -196,9 +704,9 @@ class SessionEngine(Singleton):
                     self.proxy_host,
                     self.proxy_port)
                 self.logger.info(msg)
-                self._conn = HTTPSConnection(self.proxy_host, self.proxy_port,
-                                             timeout=300)
-                self._conn.set_tunnel(self.host, self.port, headers)
+                conn = HTTPSConnection(self.proxy_host, self.proxy_port,
+                                       timeout=300)
+                conn.set_tunnel(self.host, self.port, headers)
             else:
                 s = ('Establishing unencrypted connection to {}:{} with proxy '
                      '{}:{}')
@@ -208,25 +716,24 @@ class SessionEngine(Singleton):
                     self.proxy_host,
                     self.proxy_port)
                 self.logger.info(msg)
-                self._conn = HTTPConnection(self.proxy_host, self.proxy_port,
-                                            timeout=300)
-                self._conn.set_tunnel(self.host, self.port, headers)
+                conn = HTTPConnection(self.proxy_host, self.proxy_port,
+                                      timeout=300)
+                conn.set_tunnel(self.host, self.port, headers)
         else:
             if self.ssl:
                 msg = 'Establishing SSL connection to {}:{}'.format(self.host,
                                                                     self.port)
                 self.logger.info(msg)
-                self._conn = HTTPSConnection(self.host, self.port,
-                                             timeout=300)
+                conn = HTTPSConnection(self.host, self.port, timeout=300)
             else:
                 msg = 'Establishing unencrypted connection to {}:{}'.format(
                     self.host,
                     self.port)
                 self.logger.info(msg)
-                self._conn = HTTPConnection(self.host, self.port,
-                                            timeout=300)
+                conn = HTTPConnection(self.host, self.port, timeout=300)
+        return conn
 
-    def _process_response(self, response, method, final=False):
+    def _process_response(self, response, method, final=False, wait=True):
         """API Method. Process an API response for failure, incomplete, or
         success and throw any appropriate errors
 
@@ -234,38 +741,54 @@ class SessionEngine(Singleton):
         :param method: the HTTP method
         :param final: boolean flag representing whether or not to continue
             polling
+        :param wait: boolean flag representing whether to block until an
+            incomplete job finishes, or to return a
+            :class:`~dyn.jobs.JobHandle` for it
         """
         return response
 
+    def _idempotent(self, uri, method):
+        """Return whether or not a call may safely be repeated, should the API
+        have carried it out before failing
+
+        :param uri: The validated uri of the resource to access
+        :param method: The HTTP method of the call
+        """
+        return method.upper() in ('DELETE', 'GET', 'PUT')
+
     def _handle_error(self, uri, method, raw_args):
-        """Handle the processing of a connection error with the api. Note, to be
-        implemented as needed in subclasses.
+        """Handle the processing of a connection error with the api, repairing
+        this session as needed. Return *True* if the failed call may safely be
+        retried. Note, to be implemented as needed in subclasses.
         """
-        return None
+        return False
 
-    def _handle_response(self, response, uri, method, raw_args, final):
+    def _handle_response(self, response, uri, method, raw_args, final,
+                         wait=True):
         """Handle the processing of the API's response"""
         body = response.read()
-        self.logger.debug('RESPONSE: {0}'.format(body))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('RESPONSE: {0}'.format(body))
         self._last_response = response
+        self._record_response(response, body)
 
         if self.poll_incomplete:
+            if response.status == 307 and not wait:
+                return self._submit_job(response.getheader('Location'),
+                                        method)
             response, body = self.poll_response(response, body)
             self._last_response = response
-        ret_val = json.loads(body.decode('UTF-8'))
-        if self.__call_cache is not None:
-            self.__call_cache.append((uri, method, clean_args(raw_args),
-                                      ret_val['status']))
+        ret_val = json_loads(body)
+        self._record_response(response, status=ret_val['status'])
 
         self._meta_update(uri, method, ret_val)
         # Handle retrying if ZoneProp is blocking the current task
         error_msg = 'Operation blocked by current task'
         if ret_val['status'] == 'failure' and error_msg in \
-                ret_val['msgs'][0]['INFO'] and not final:
-            time.sleep(8)
-            return self.execute(uri, method, raw_args, final=True)
-        else:
-            return self._process_response(ret_val, method)
+                ret_val['msgs'][0]['INFO'] and not final and \
+                self.retry_policy.retries(RetryPolicy.BLOCKED):
+            raise _Retry(RetryPolicy.BLOCKED)
+        return self._process_response(ret_val, method, wait=wait)
 
     def _validate_uri(self, uri):
         """Validate and return a cleaned up uri. Make sure the command is
@@ -300,21 +823,21 @@ class SessionEngine(Singleton):
                                                                      '_json'))
                     for x in d if d[x] is not None and
                     not hasattr(d[x], '__call__') and x.startswith('_')}
-        return args, json.dumps(args), uri
+        return args, json_dumps(args), uri
 
-    def execute(self, uri, method, args=None, final=False):
+    def execute(self, uri, method, args=None, final=False, wait=True):
         """Execute a commands against the rest server
 
         :param uri: The uri of the resource to access. /REST/ will be prepended
             if it is not at the beginning of the uri
         :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
         :param args: Any arguments to be sent as a part of the request
-        :param final: boolean flag representing whether or not we have already
-            failed executing once or not
+        :param final: boolean flag representing whether or not this call may
+            be retried if it fails
+        :param wait: If *False*, calls which spawn a job that does not complete
+            immediately return a :class:`~dyn.jobs.JobHandle` instead of
+            blocking until the job finishes
         """
-        if self._conn is None:
-            self.connect()
-
         uri = self._validate_uri(uri)
 
         # Make sure the method is valid
@@ -323,29 +846,262 @@ class SessionEngine(Singleton):
         # Prepare arguments to send to API
         raw_args, args, uri = self._prepare_arguments(args, method, uri)
 
-        msg = 'uri: {}, method: {}, args: {}'
-        self.logger.debug(
-            msg.format(uri, method, clean_args(json.loads(args))))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            msg = 'uri: {}, method: {}, args: {}'
+            self.logger.debug(msg.format(uri, method, clean_args(raw_args)))
+
+        cache = self.cache
+        if cache is not None and method != 'GET':
+            try:
+                return self._execute(uri, method, args, raw_args, final, wait)
+            finally:
+                cache.invalidate(uri)
+        if cache is None or not cache.cacheable(uri):
+            return self._execute(uri, method, args, raw_args, final, wait)
+
+        key = cache.key(uri, raw_args)
+        response = cache.get(key)
+        if response is None:
+            response = self._execute(uri, method, args, raw_args, final, wait)
+            if not isinstance(response, JobHandle):
+                cache.set(key, response)
+        return response
 
-        # Send the command and deal with results
-        self.send_command(uri, method, args)
+    def _execute(self, uri, method, args, raw_args, final, wait):
+        """Send a prepared API call to the server, retrying it as allowed by
+        this session's :class:`~dyn.retry.RetryPolicy`
 
-        # Deal with the results
+        :param uri: The validated uri of the resource to access
+        :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
+        :param args: The encoded arguments to send to the server
+        :param raw_args: The arguments as passed to
+            :meth:`~dyn.core.SessionEngine.execute`
+        :param final: boolean flag representing whether or not this call may
+            be retried if it fails
+        :param wait: If *False*, return a :class:`~dyn.jobs.JobHandle` for
+            incomplete jobs rather than blocking
+        """
+        record = outer = None
+        if self.__call_cache is not None or self._observers:
+            record = _CallRecord(uri, method)
+            outer = getattr(self._local, 'call', None)
+            self._local.call = record
+        policy = self.retry_policy
+        idempotent = self._idempotent(uri, method)
+        zone = zone_key(uri)
+        started = time.time()
+        attempt = 0
         try:
-            response = self._conn.getresponse()
-        except (IOError, HTTPException) as e:
-            if final:
-                raise e
-            else:
-                # Handle processing a connection error
-                resp = self._handle_error(uri, method, raw_args)
-                # If we got a valid response back from our _handle_error call
-                # Then return it, otherwise raise the original exception
-                if resp is not None:
-                    return resp
-                raise e
+            while True:
+                attempt += 1
+                last = final or policy.exhausted(attempt, started)
+                self._zone_backoff.wait(zone)
+                retry_after = None
+                try:
+                    result = self._attempt(uri, method, args, raw_args, last,
+                                           wait)
+                    if record is not None and record.status == 'incomplete' \
+                            and not isinstance(result, JobHandle):
+                        # The job was waited on until it completed
+                        record.status = 'success'
+                    return result
+                except (IOError, HTTPException):
+                    # The failed connection has already been discarded
+                    if last or not policy.retries(RetryPolicy.CONNECTION,
+                                                  idempotent) or \
+                            not self._handle_error(uri, method, raw_args):
+                        raise
+                    reason = RetryPolicy.CONNECTION
+                except _Retry as e:
+                    reason, retry_after = e.reason, e.retry_after
+
+                # No connection is held while backing off, leaving the pool
+                # free for calls which aren't affected by this failure
+                delay = policy.delay(attempt, started)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                msg = 'Retrying {} {} in {:.2f}s after attempt {} ({})'
+                self.logger.info(msg.format(method, uri, delay, attempt,
+                                            reason))
+                if self._observers:
+                    self._notify('on_retry', method, uri, reason, attempt,
+                                 delay)
+                if reason == RetryPolicy.BLOCKED and zone is not None:
+                    self._zone_backoff.hold(zone, delay)
+                else:
+                    time.sleep(delay)
+        finally:
+            if record is not None:
+                self._local.call = outer
+            if self.__call_cache is not None:
+                self.__call_cache.append(HistoryEntry(
+                    datetime.fromtimestamp(started).isoformat(), uri, method,
+                    copy.deepcopy(clean_args(raw_args)),
+                    record.status, record.http_status, time.time() - started,
+                    record.response_bytes, attempt - 1))
+
+    def _attempt(self, uri, method, args, raw_args, last, wait):
+        """Make a single attempt at an API call over a pooled connection,
+        within this session's rate limit, if it has one
+
+        :param uri: The validated uri of the resource to access
+        :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
+        :param args: The encoded arguments to send to the server
+        :param raw_args: The arguments as passed to
+            :meth:`~dyn.core.SessionEngine.execute`
+        :param last: Whether or not this is the last attempt allowed
+        :param wait: If *False*, return a :class:`~dyn.jobs.JobHandle` for
+            incomplete jobs rather than blocking
+        """
+        limiter = self.rate_limiter
+        ticket = limiter.acquire() if limiter is not None else None
+        reason = RetryPolicy.CONNECTION
+        try:
+            with self._checkout():
+                # Send the command and deal with results
+                record = getattr(self._local, 'call', None)
+                if record is not None:
+                    record.sent_at = time.time()
+                self.send_command(uri, method, args)
+                response = self._conn.getresponse()
+                reason = _overload_reason(response.status)
+                if reason is not None and not last and \
+                        self.retry_policy.retries(
+                            reason, self._idempotent(uri, method)):
+                    self._record_response(response, response.read())
+                    raise _Retry(reason, _retry_after(response))
+                return self._handle_response(response, uri, method, raw_args,
+                                             last, wait)
+        finally:
+            # Released before any error handling, which may make calls itself
+            if ticket is not None:
+                limiter.release(ticket, reason)
+
+    def execute_iter(self, uri, method='GET', args=None):
+        """Execute a command against the rest server, decoding its response
+        incrementally. Yields ``(key, item)`` pairs for every item of every
+        list held in the response's data, as described by
+        :class:`~dyn.stream.StreamDecoder`, so that even the largest responses
+        are never held in memory all at once. Streamed calls are neither
+        retried nor cached.
+
+        The response is read over a dedicated connection, which is closed once
+        iteration finishes, so that other API calls may be made while items
+        are still being consumed.
+
+        :param uri: The uri of the resource to access. /REST/ will be prepended
+            if it is not at the beginning of the uri
+        :param method: One of 'DELETE', 'GET', 'POST', or 'PUT'
+        :param args: Any arguments to be sent as a part of the request
+        """
+        uri = self._validate_uri(uri)
+        self._validate_method(method)
+        raw_args, args, uri = self._prepare_arguments(args, method, uri)
 
-        return self._handle_response(response, uri, method, raw_args, final)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            msg = 'uri: {}, method: {}, args: {} (streaming)'
+            self.logger.debug(msg.format(uri, method, clean_args(raw_args)))
+
+        started = time.time()
+        conn = self._new_connection()
+        try:
+            limiter = self.rate_limiter
+            ticket = limiter.acquire() if limiter is not None else None
+            reason = RetryPolicy.CONNECTION
+            try:
+                self.send_command(uri, method, args, conn=conn)
+                response = conn.getresponse()
+                reason = _overload_reason(response.status)
+            finally:
+                if ticket is not None:
+                    limiter.release(ticket, reason)
+            deadline = time.time() + JOB_TIMEOUT
+            delays = backoff()
+            while self.poll_incomplete and response.status == 307:
+                response.read()
+                location = response.getheader('Location')
+                _sleep_until_due(delays, deadline, location, JOB_TIMEOUT)
+                self.logger.info('Polling {}'.format(location))
+                self.send_command(location, 'GET', '', conn=conn)
+                response = conn.getresponse()
+            self._last_response = response
+
+            stream = StreamDecoder(response.read)
+            for item in stream:
+                yield item
+        finally:
+            conn.close()
+
+        result = stream.meta
+        if self._observers:
+            self._notify('on_response', method, uri, response.status,
+                         time.time() - started, stream.bytes_read)
+        if self.__call_cache is not None:
+            self.__call_cache.append(HistoryEntry(
+                datetime.fromtimestamp(started).isoformat(), uri, method,
+                copy.deepcopy(clean_args(raw_args)),
+                result.get('status'), response.status, time.time() - started,
+                stream.bytes_read, 0))
+        if result.get('status') == 'incomplete':
+            # The job outlived the request, fall back to a buffered response
+            result = self.wait_for_job_to_complete(result['job_id'])
+            data = result.get('data')
+            if result.get('status') == 'success' and data:
+                items = data.items() if isinstance(data, dict) else \
+                    ((None, x) for x in data)
+                for key, value in items:
+                    if isinstance(value, list):
+                        for item in value:
+                            yield key, item
+                    else:
+                        yield key, value
+        # Raise any appropriate errors for failed calls
+        self._process_response(result, method, final=True)
+
+    def execute_many(self, calls, max_concurrency=None):
+        """Execute a batch of commands against the rest server concurrently,
+        fanning them out across a pool of worker threads which share this
+        session's connection pool. Note that the effective concurrency is
+        bounded by both *max_concurrency* and this session's pool_size.
+
+        :param calls: An iterable of (uri, method, args) tuples, where each
+            tuple holds the arguments to a single
+            :meth:`~dyn.core.SessionEngine.execute` call
+        :param max_concurrency: The maximum number of calls to have in flight
+            at once. Defaults to this session's pool_size
+        :return: A *list* of results in the same order as *calls*. If a call
+            raised an exception, the exception instance is returned in its
+            place rather than aborting the remainder of the batch
+        """
+        calls = list(calls)
+        results = [None] * len(calls)
+        if max_concurrency is None:
+            max_concurrency = self.pool_size
+        pending = iter(range(len(calls)))
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                with lock:
+                    index = next(pending, None)
+                if index is None:
+                    return
+                try:
+                    results[index] = self.execute(*calls[index])
+                except Exception as e:
+                    results[index] = e
+
+        n_workers = max(min(max_concurrency, len(calls)), 1)
+        if n_workers == 1:
+            worker()
+            return results
+        threads = [threading.Thread(target=worker) for _ in range(n_workers)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
 
     def _meta_update(self, uri, method, results):
         """Update the HTTP session token if the uri is a login or logout
@@ -364,52 +1120,165 @@ class SessionEngine(Singleton):
             if results['status'] == 'success':
                 self._token = None
 
-    def poll_response(self, response, body):
+    def poll_response(self, response, body, timeout=JOB_TIMEOUT):
         """Looks at a response from a REST command, and while indicates that
         the job is incomplete, poll for response
 
         :param response: the JSON response containing return codes
         :param body: the body of the HTTP response
+        :param timeout: how long (in seconds) to poll for before raising a
+            :class:`~dyn.jobs.JobTimeout`
         """
+        deadline = time.time() + timeout
+        delays = backoff()
         while response.status == 307:
-            time.sleep(1)
             uri = response.getheader('Location')
+            _sleep_until_due(delays, deadline, uri, timeout)
             self.logger.info('Polling {}'.format(uri))
 
+            polled = time.time()
             self.send_command(uri, 'GET', '')
             response = self._conn.getresponse()
             body = response.read()
+            self._record_poll(uri, response, body, polled)
         return response, body
 
-    def send_command(self, uri, method, args):
+    def _record_response(self, response, body=None, status=None):
+        """Note the details of a response received for the API call currently
+        being executed by this thread, if that call is being recorded
+
+        :param response: An HTTP response
+        :param body: The body read from *response*, if any
+        :param status: The API status of the call, if known
+        """
+        record = getattr(self._local, 'call', None)
+        if record is None:
+            return
+        record.http_status = response.status
+        if body is not None:
+            record.response_bytes += len(body)
+            if self._observers:
+                self._notify('on_response', record.method, record.uri,
+                             response.status, time.time() - record.sent_at,
+                             len(body))
+        if status is not None:
+            record.status = status
+
+    def _record_poll(self, uri, response, body, polled):
+        """Note the details of a single poll for the status of a job
+
+        :param uri: The uri polled
+        :param response: The HTTP response to the poll
+        :param body: The body read from *response*
+        :param polled: The time at which the poll was sent
+        """
+        record = getattr(self._local, 'call', None)
+        if record is not None:
+            record.http_status = response.status
+            record.response_bytes += len(body)
+        if self._observers:
+            self._notify('on_poll', uri, response.status,
+                         time.time() - polled, len(body))
+
+    def add_observer(self, observer):
+        """Register a :class:`~dyn.metrics.RequestObserver` to be notified of
+        the lifecycle of every API call made by this session. Observers are
+        not carried over when a session is pickled.
+
+        :param observer: The :class:`~dyn.metrics.RequestObserver` to add
+        """
+        if observer not in self._observers:
+            # Copy on write, so that calls in flight may keep iterating
+            self._observers = self._observers + [observer]
+
+    def remove_observer(self, observer):
+        """Stop notifying a previously added
+        :class:`~dyn.metrics.RequestObserver`
+
+        :param observer: The :class:`~dyn.metrics.RequestObserver` to remove
+        """
+        self._observers = [x for x in self._observers if x is not observer]
+
+    def _notify(self, hook, *args):
+        """Call *hook* on every registered observer. A failing observer is
+        logged, and never allowed to fail the API call being observed
+
+        :param hook: The name of the :class:`~dyn.metrics.RequestObserver`
+            method to call
+        :param args: The arguments to pass along, after this session
+        """
+        for observer in self._observers:
+            try:
+                getattr(observer, hook)(self, *args)
+            except Exception:
+                self.logger.exception('{} observer failed'.format(hook))
+
+    def send_command(self, uri, method, args, conn=None):
         """Responsible for packaging up the API request and sending it to the
         server over the established connection
 
         :param uri: The uri of the resource to interact with
         :param method: The HTTP method to use
         :param args: Encoded arguments to send to the server
+        :param conn: The connection to send the request over, defaults to the
+            connection checked out by the current thread
         """
-        self._conn.putrequest(method, uri)
-
-        # Build headers
-        user_agent = 'dyn-py v{}'.format(__version__)
-        headers = {'Content-Type': self.content_type, 'User-Agent': user_agent}
-        for key, val in self.extra_headers.items():
-            headers[key] = val
+        conn = conn or self._conn
+        conn.putrequest(method, uri)
 
+        for key, val in self._headers():
+            conn.putheader(key, val)
         if self._token is not None:
-            headers['Auth-Token'] = self._token
-
-        for key, val in headers.items():
-            self._conn.putheader(key, val)
+            conn.putheader('Auth-Token', self._token)
 
         # Now the arguments
-        self._conn.putheader('Content-length', '%d' % len(args))
-        self._conn.endheaders()
+        body = prepare_to_send(args)
+        conn.putheader('Content-length', '%d' % len(body))
+        conn.endheaders()
+
+        conn.send(body)
+        if self._observers:
+            self._notify('on_request', method, uri, len(body))
+
+    @property
+    def _jobs(self):
+        """The :class:`~dyn.jobs.JobPoller` responsible for this session's
+        outstanding jobs, created on first use
+        """
+        with self._job_lock:
+            if self._job_poller is None:
+                self._job_poller = JobPoller(self)
+            return self._job_poller
+
+    def _submit_job(self, uri, method):
+        """Hand the job at *uri* off to the background poller and return a
+        :class:`~dyn.jobs.JobHandle` for it
 
-        self._conn.send(prepare_to_send(args))
+        :param uri: The uri to poll for the job's status
+        :param method: The HTTP method of the call which spawned the job
+        """
+        handle = JobHandle(self, self._validate_uri(uri), method)
+        self.logger.info('Deferring job {}'.format(handle.job_id))
+        return self._jobs.submit(handle)
+
+    def _fetch_job(self, uri):
+        """Make a single poll of the status of a job. Returns the decoded
+        response, or *None* if the job is still being redirected
+
+        :param uri: The uri to poll for the job's status
+        """
+        uri = self._validate_uri(uri)
+        with self._checkout():
+            polled = time.time()
+            self.send_command(uri, 'GET', '')
+            response = self._conn.getresponse()
+            body = response.read()
+        self._record_poll(uri, response, body, polled)
+        if response.status == 307:
+            return None
+        return json_loads(body)
 
-    def wait_for_job_to_complete(self, job_id, timeout=120):
+    def wait_for_job_to_complete(self, job_id, timeout=JOB_TIMEOUT):
         """When a response comes back with a status of "incomplete" we need to
         wait and poll for the status of that job until it comes back with
         success or failure
@@ -419,34 +1288,35 @@ class SessionEngine(Singleton):
             response before giving up on this request
         """
         self.logger.debug('Polling for job_id: {}'.format(job_id))
-        start = datetime.now()
         uri = '/Job/{}/'.format(job_id)
-        api_args = {}
-        # response = self.execute(uri, 'GET', api_args)
-        response = {'status': 'incomplete'}
-        now = datetime.now()
+        deadline = time.time() + timeout
+        delays = backoff()
+        response = {'status': 'incomplete', 'job_id': job_id}
         self.logger.warn('Waiting for job {}'.format(job_id))
-        too_long = (now - start).seconds < timeout
-        while response['status'] is 'incomplete' and too_long:
-            time.sleep(10)
-            response = self.execute(uri, 'GET', api_args)
+        while response['status'] == 'incomplete':
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(next(delays), remaining))
+            response = self._fetch_job(uri) or response
         return response
 
     def __getstate__(cls):
         """Because HTTP/HTTPS connections are not serializeable, we need to
-        strip the connection instance out before we ship the pickled data
+        strip the connection pool out before we ship the pickled data
         """
         d = cls.__dict__.copy()
-        d.pop('_conn')
+        for attr in cls._transient_attrs:
+            d.pop(attr, None)
         return d
 
     def __setstate__(cls, state):
-        """Because the HTTP/HTTPS connection was stripped out in __getstate__ we
-        must manually re-enter it as None and let the sessions execute method
-        handle rebuilding it later
+        """Because the connection pool was stripped out in __getstate__ we must
+        manually rebuild an empty one and let the sessions execute method
+        handle opening new connections later
         """
         cls.__dict__ = state
-        cls.__dict__['_conn'] = None
+        cls._init_transport()
 
     def __str__(self):
         """str override"""
@@ -460,9 +1330,12 @@ class SessionEngine(Singleton):
 
     @property
     def history(self):
-        """A history of all API calls that have been made during the duration
-        of this Session's existence. These API call details are returned as a
-        *list* of 5-tuples of the form: (timestamp, uri, method, args, status)
-        where status will be one of 'success' or 'failure'
+        """A history of the API calls made during the duration of this
+        Session's existence, holding only the most recent history_size calls
+        if it was given. These API call details are returned as a *deque* of
+        :class:`~dyn.core.HistoryEntry`'s, whose first five fields are
+        (timestamp, uri, method, args, status) where status will be one of
+        'success' or 'failure'. Aggregate latency and error statistics for
+        each endpoint are available from ``history.stats()``
         """
         return self.__call_cache
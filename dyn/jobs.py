@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""This module contains the machinery for tracking API jobs which did not
+complete within the lifetime of their originating request. Rather than
+parking a thread per job, a single background :class:`~dyn.jobs.JobPoller`
+per session multiplexes the polling of every outstanding job, backing off
+adaptively between polls of any one job.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+__author__ = 'jnappi'
+__all__ = ['JobTimeout', 'JobHandle', 'JobPoller']
+
+#: The default number of seconds a job is polled for before it is given up on
+JOB_TIMEOUT = 120
+
+
+def backoff(initial=0.5, factor=1.5, maximum=10):
+    """Generate an endless sequence of exponentially growing poll delays
+
+    :param initial: The first delay, in seconds
+    :param factor: The multiplier applied to each successive delay
+    :param maximum: The largest delay that will ever be generated
+    """
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * factor, maximum)
+
+
+class JobTimeout(Exception):
+    """Raised when waiting on a :class:`~dyn.jobs.JobHandle` for longer than
+    the requested timeout
+    """
+    pass
+
+
+class JobHandle(object):
+    """A future-like handle to an API job which has not yet completed. Its
+    result is the processed API response, exactly as it would have been
+    returned by a blocking :meth:`~dyn.core.SessionEngine.execute` call.
+    """
+
+    def __init__(self, session, uri, method):
+        """Create a new :class:`~dyn.jobs.JobHandle`
+
+        :param session: The session which issued the original call
+        :param uri: The uri to poll for this job's status
+        :param method: The HTTP method of the call which spawned this job
+        """
+        super(JobHandle, self).__init__()
+        self.session = session
+        self.uri = uri
+        self.method = method
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._result = self._exception = None
+        self._callbacks = []
+
+    @property
+    def job_id(self):
+        """The unique id of the API job this handle is tracking"""
+        return self.uri.rstrip('/').split('/')[-1]
+
+    def done(self):
+        """Return whether or not this job has finished, successfully or not"""
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Wait for this job to complete and return its processed response.
+        If the job failed, the appropriate API error is raised.
+
+        :param timeout: The maximum number of seconds to wait, or *None* to
+            wait until the poller gives up on the job
+        """
+        if not self._event.wait(timeout):
+            raise JobTimeout('Job {} did not complete within {} '
+                             'seconds'.format(self.job_id, timeout))
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for this job to complete and return the exception it failed
+        with, or *None* if it succeeded
+
+        :param timeout: The maximum number of seconds to wait, or *None* to
+            wait until the poller gives up on the job
+        """
+        if not self._event.wait(timeout):
+            raise JobTimeout('Job {} did not complete within {} '
+                             'seconds'.format(self.job_id, timeout))
+        return self._exception
+
+    def add_done_callback(self, fn):
+        """Call *fn*, with this handle as its only argument, once this job
+        completes. If it has already completed, *fn* is called immediately.
+        """
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _resolve(self, result=None, exception=None):
+        """Mark this job as complete and fire any registered callbacks"""
+        with self._lock:
+            self._result = result
+            self._exception = exception
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                self.session.logger.exception('Job callback raised')
+
+    def __str__(self):
+        """str override"""
+        state = 'done' if self.done() else 'pending'
+        return '<JobHandle>: {} ({})'.format(self.job_id, state)
+
+    __repr__ = __unicode__ = __str__
+
+
+class JobPoller(object):
+    """Polls all of a session's outstanding jobs from a single background
+    thread. Each job is polled on its own exponential backoff schedule until it
+    completes or its deadline passes.
+    """
+    #: Seconds the poller thread lingers with no jobs before exiting
+    linger = 5
+
+    def __init__(self, session, initial_delay=0.5, factor=1.5, max_delay=10,
+                 timeout=JOB_TIMEOUT):
+        """Create a new :class:`~dyn.jobs.JobPoller`
+
+        :param session: The session used to poll job statuses
+        :param initial_delay: Seconds to wait before a job's first poll
+        :param factor: Multiplier applied to a job's delay after each poll
+        :param max_delay: The longest delay between two polls of the same job
+        :param timeout: The number of seconds after which a job is given up on
+        """
+        super(JobPoller, self).__init__()
+        self.session = session
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._queue = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition(threading.Lock())
+        self._thread = None
+
+    def submit(self, handle, timeout=None):
+        """Begin polling for the completion of the job tracked by *handle*
+
+        :param handle: The :class:`~dyn.jobs.JobHandle` to resolve
+        :param timeout: Overrides this poller's default timeout for this job
+        """
+        now = time.time()
+        deadline = now + (self.timeout if timeout is None else timeout)
+        delays = backoff(self.initial_delay, self.factor, self.max_delay)
+        with self._cond:
+            heapq.heappush(self._queue, (now + next(delays),
+                                         next(self._counter), handle, delays,
+                                         deadline))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='dyn-job-poller')
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+        return handle
+
+    def __len__(self):
+        """The number of jobs currently being polled"""
+        return len(self._queue)
+
+    def _next(self):
+        """Block until the next job is due to be polled and return its queue
+        entry, or return *None* if there has been nothing to do for a while
+        """
+        with self._cond:
+            idle_since = time.time()
+            while True:
+                now = time.time()
+                if self._queue:
+                    due = self._queue[0][0]
+                    if due <= now:
+                        return heapq.heappop(self._queue)
+                    self._cond.wait(due - now)
+                elif now - idle_since >= self.linger:
+                    self._thread = None
+                    return None
+                else:
+                    self._cond.wait(self.linger)
+
+    def _run(self):
+        """Poller thread main loop"""
+        while True:
+            entry = self._next()
+            if entry is None:
+                return
+            _, _, handle, delays, deadline = entry
+            try:
+                response = self.session._fetch_job(handle.uri)
+            except Exception as e:
+                # Transient connection errors are retried until the deadline
+                self.session.logger.warning('Polling {} failed: {}'.format(
+                    handle.uri, e))
+                response = None
+            incomplete = response is None or \
+                response.get('status') == 'incomplete'
+            now = time.time()
+            if incomplete and now < deadline:
+                with self._cond:
+                    heapq.heappush(self._queue, (
+                        min(now + next(delays), deadline),
+                        next(self._counter), handle, delays, deadline))
+                continue
+            if response is None:
+                response = {'status': 'incomplete',
+                            'job_id': handle.job_id, 'msgs': []}
+            try:
+                result = self.session._process_response(response,
+                                                        handle.method,
+                                                        final=True)
+            except Exception as e:
+                handle._resolve(exception=e)
+            else:
+                handle._resolve(result=result)
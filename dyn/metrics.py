@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""This module contains the interface for observing the lifecycle of the API
+calls made by a session, along with a built in observer which exports what it
+observes as Prometheus metrics::
+
+    >>> from dyn.metrics import PrometheusCollector
+    >>> from dyn.tm.session import DynectSession
+    >>> collector = PrometheusCollector()
+    >>> s = DynectSession('customer', 'user', 'password')
+    >>> s.add_observer(collector)
+    >>> print(collector.render())
+"""
+import threading
+
+from .core import endpoint_template
+
+__author__ = 'jnappi'
+__all__ = ['RequestObserver', 'PrometheusCollector']
+
+
+class RequestObserver(object):
+    """Base class for observers of a session's API calls. Subclasses override
+    whichever hooks they are interested in. Hooks are called synchronously
+    from the thread making the call, so they should be quick, and any
+    exception they raise is logged and otherwise ignored.
+    """
+
+    def on_request(self, session, method, uri, request_bytes):
+        """Called as each HTTP request is sent, including polls
+
+        :param session: The session sending the request
+        :param method: The HTTP method of the request
+        :param uri: The uri requested
+        :param request_bytes: The size of the request body
+        """
+        pass
+
+    def on_response(self, session, method, uri, http_status, latency,
+                    response_bytes):
+        """Called once the response to an API call has been read, before any
+        polling for an incomplete job
+
+        :param session: The session which made the call
+        :param method: The HTTP method of the call
+        :param uri: The uri called
+        :param http_status: The HTTP status of the response
+        :param latency: Seconds from sending the request to reading the
+            response
+        :param response_bytes: The size of the response body
+        """
+        pass
+
+    def on_retry(self, session, method, uri, reason, attempt, delay):
+        """Called when a failed API call is about to be retried
+
+        :param session: The session which made the call
+        :param method: The HTTP method of the call
+        :param uri: The uri called
+        :param reason: Why the call failed, one of the reasons listed by
+            :class:`~dyn.retry.RetryPolicy`
+        :param attempt: The number of the attempt which failed, starting at 1
+        :param delay: Seconds to be waited before the next attempt
+        """
+        pass
+
+    def on_poll(self, session, uri, http_status, latency, response_bytes):
+        """Called as each poll for the status of an incomplete job completes
+
+        :param session: The session which polled
+        :param uri: The uri polled
+        :param http_status: The HTTP status of the poll's response
+        :param latency: Seconds taken by the poll
+        :param response_bytes: The size of the poll's response body
+        """
+        pass
+
+
+def _escape(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+        '\n', '\\n')
+
+
+def _labels(names, values):
+    """Format a Prometheus label set"""
+    return ','.join('{}="{}"'.format(name, _escape(value))
+                    for name, value in zip(names, values))
+
+
+class _Histogram(object):
+    """A Prometheus histogram with a fixed set of buckets"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+class PrometheusCollector(RequestObserver):
+    """A :class:`~dyn.metrics.RequestObserver` which aggregates API calls by
+    HTTP method and endpoint template, ie '/REST/ARecord/{zone}/{fqdn}/', and
+    renders them in the Prometheus text exposition format. A single collector
+    may observe any number of sessions.
+    """
+    #: The Content-Type to serve :meth:`render`'s output with
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+    #: Default latency histogram bucket bounds, in seconds
+    default_buckets = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+    def __init__(self, prefix='dyn', buckets=None):
+        """Create a new :class:`~dyn.metrics.PrometheusCollector`
+
+        :param prefix: The prefix of every exported metric's name
+        :param buckets: The upper bounds of the latency histogram buckets
+        """
+        super(PrometheusCollector, self).__init__()
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets or self.default_buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard everything collected so far"""
+        with self._lock:
+            self._requests = {}
+            self._request_bytes = {}
+            self._responses = {}
+            self._response_bytes = {}
+            self._latency = {}
+            self._retries = {}
+            self._polls = {}
+            self._poll_latency = {}
+
+    def _histogram(self, store, key):
+        histogram = store.get(key)
+        if histogram is None:
+            histogram = store[key] = _Histogram(self.buckets)
+        return histogram
+
+    def on_request(self, session, method, uri, request_bytes):
+        key = (method, endpoint_template(uri))
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._request_bytes[key] = \
+                self._request_bytes.get(key, 0) + request_bytes
+
+    def on_response(self, session, method, uri, http_status, latency,
+                    response_bytes):
+        endpoint = endpoint_template(uri)
+        key = (method, endpoint)
+        with self._lock:
+            code_key = (method, endpoint, http_status)
+            self._responses[code_key] = self._responses.get(code_key, 0) + 1
+            self._response_bytes[key] = \
+                self._response_bytes.get(key, 0) + response_bytes
+            self._histogram(self._latency, key).observe(latency)
+
+    def on_retry(self, session, method, uri, reason, attempt, delay):
+        key = (method, endpoint_template(uri), reason)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def on_poll(self, session, uri, http_status, latency, response_bytes):
+        key = (endpoint_template(uri), http_status)
+        with self._lock:
+            self._polls[key] = self._polls.get(key, 0) + 1
+            self._histogram(self._poll_latency,
+                            key[:1]).observe(latency)
+
+    def _render_counter(self, lines, name, help_text, label_names, store):
+        name = '{}_{}'.format(self.prefix, name)
+        lines.append('# HELP {} {}'.format(name, help_text))
+        lines.append('# TYPE {} counter'.format(name))
+        for key in sorted(store, key=str):
+            lines.append('{}{{{}}} {}'.format(name, _labels(label_names, key),
+                                              store[key]))
+
+    def _render_histogram(self, lines, name, help_text, label_names, store):
+        name = '{}_{}'.format(self.prefix, name)
+        lines.append('# HELP {} {}'.format(name, help_text))
+        lines.append('# TYPE {} histogram'.format(name))
+        for key in sorted(store, key=str):
+            histogram = store[key]
+            labels = _labels(label_names, key)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append('{}_bucket{{{},le="{}"}} {}'.format(
+                    name, labels, bound, cumulative))
+            lines.append('{}_bucket{{{},le="+Inf"}} {}'.format(
+                name, labels, histogram.count))
+            lines.append('{}_sum{{{}}} {}'.format(name, labels,
+                                                  histogram.sum))
+            lines.append('{}_count{{{}}} {}'.format(name, labels,
+                                                    histogram.count))
+
+    def render(self):
+        """Render everything collected so far in the Prometheus text
+        exposition format
+        """
+        lines = []
+        with self._lock:
+            self._render_counter(lines, 'requests_total',
+                                 'HTTP requests sent to the API.',
+                                 ('method', 'endpoint'), self._requests)
+            self._render_counter(lines, 'request_bytes_total',
+                                 'Bytes of request bodies sent to the API.',
+                                 ('method', 'endpoint'), self._request_bytes)
+            self._render_counter(lines, 'responses_total',
+                                 'API responses received, by HTTP status.',
+                                 ('method', 'endpoint', 'code'),
+                                 self._responses)
+            self._render_counter(lines, 'response_bytes_total',
+                                 'Bytes of response bodies read from the '
+                                 'API.', ('method', 'endpoint'),
+                                 self._response_bytes)
+            self._render_histogram(lines, 'request_duration_seconds',
+                                   'Latency of API calls, excluding job '
+                                   'polling.', ('method', 'endpoint'),
+                                   self._latency)
+            self._render_counter(lines, 'retries_total',
+                                 'API calls retried, by reason.',
+                                 ('method', 'endpoint', 'reason'),
+                                 self._retries)
+            self._render_counter(lines, 'polls_total',
+                                 'Polls for the status of incomplete jobs.',
+                                 ('endpoint', 'code'), self._polls)
+            self._render_histogram(lines, 'poll_duration_seconds',
+                                   'Latency of polls for the status of '
+                                   'incomplete jobs.', ('endpoint',),
+                                   self._poll_latency)
+        return '\n'.join(lines) + '\n'
+
+    def __str__(self):
+        """str override"""
+        return '<PrometheusCollector>: {}'.format(self.prefix)
+
+    __repr__ = __unicode__ = __str__
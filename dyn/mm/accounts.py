@@ -61,6 +61,53 @@ def get_all_suppressions(startdate=None, enddate=None, startindex=0):
     return suppressions
 
 
+def _iter_pages(uri, key, args, start_index):
+    """Page through the listing at *uri*, yielding each item held under *key*
+    until an empty page is returned
+    """
+    session = MMSession.get_session()
+    while True:
+        args['start_index'] = start_index
+        page = session.execute(uri, 'GET', args)[key]
+        if not page:
+            return
+        for item in page:
+            yield item
+        start_index += len(page)
+
+
+def iter_all_senders(start_index=0):
+    """Iterate over all :class:`~dyn.mm.accounts.ApprovedSenders`'s accessible
+    to the currently authenticated user, fetching them a page at a time
+
+    :param start_index: The index of the first sender to return
+    """
+    for sender in _iter_pages('/senders', 'senders', {}, start_index):
+        email = sender.pop('emailaddress')
+        yield ApprovedSender(email, api=False, **sender)
+
+
+def iter_all_suppressions(startdate=None, enddate=None, startindex=0):
+    """Iterate over all :class:`~dyn.mm.accounts.Suppression`'s, fetching them
+    a page at a time
+
+    :param startdate: Only suppressions made after this `datetime.datetime`
+    :param enddate: Only suppressions made before this `datetime.datetime`,
+        defaults to now
+    :param startindex: The index of the first suppression to return
+    """
+    args = {}
+    if startdate:
+        args['startdate'] = date_to_str(startdate)
+        enddate = enddate or datetime.now()
+        args['enddate'] = date_to_str(enddate)
+    for suppression in _iter_pages('/suppressions', 'suppressions', args,
+                                   startindex):
+        yield Suppression(suppression.pop('emailaddress'), api=False,
+                          reasontype=suppression.pop('reasontype'),
+                          suppresstime=suppression.pop('suppresstime'))
+
+
 class Account(object):
     """A Message Management account instance. password, companyname, and phone
     are required for creating a new account. To access an existing Account,
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""This module implements an asyncio native interface to a Message Management
+API Session. Note: this module requires Python 3.5 or higher.
+"""
+from dyn.aio import AsyncSessionEngine
+from dyn.compat import urlencode, pathname2url, json_loads, prepare_for_loads
+from dyn.mm.session import MMSession
+
+__author__ = 'jnappi'
+__all__ = ['AsyncMMSession']
+
+
+class AsyncMMSession(AsyncSessionEngine):
+    """Base object representing an asyncio Message Management API Session"""
+    _valid_methods = ('GET', 'POST')
+    uri_root = '/rest/json'
+
+    def __init__(self, apikey, host='emailapi.dynect.net', port=443, ssl=True,
+                 pool_size=10, retry_policy=None):
+        """Initialize an asyncio Message Management API Session
+
+        :param apikey: your unique Email API key
+        :param host: DynECT API server address
+        :param port: Port to connect to DynECT API server
+        :param ssl: Enable SSL
+        :param pool_size: The maximum number of API calls which may be in
+            flight at any given time
+        :param retry_policy: The :class:`~dyn.retry.RetryPolicy` governing
+            which failed calls are retried and how long to back off between
+            attempts
+        """
+        super(AsyncMMSession, self).__init__(host, port, ssl,
+                                             pool_size=pool_size,
+                                             retry_policy=retry_policy)
+        self.apikey = apikey
+        self.content_type = 'application/x-www-form-urlencoded'
+        self._encoding = 'UTF-8'
+
+    async def __aenter__(self):
+        """Yield this session for use within the context block"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close all pooled connections"""
+        await self.close()
+
+    def _prepare_arguments(self, args, method, uri):
+        """Prepare MM arguments which need to be packaged differently depending
+        on the specified HTTP method
+        """
+        args, content, uri = AsyncSessionEngine._prepare_arguments(self, args,
+                                                                   method, uri)
+        if 'apikey' not in args:
+            args['apikey'] = self.apikey
+
+        if method == 'GET':
+            if '%' not in uri:
+                uri = pathname2url(uri)
+            uri = '?'.join([uri, urlencode(args)])
+            return {}, '', uri
+        return args, urlencode(args), uri
+
+    async def _handle_response(self, response, uri, method, raw_args, final):
+        """Handle the processing of the API's response"""
+        ret_val = json_loads(prepare_for_loads(response.body, self._encoding))
+        return await self._process_response(ret_val['response'], method,
+                                            final)
+
+    async def _process_response(self, response, method, final=False):
+        """Process an API response for failure, incomplete, or success and
+        throw any appropriate errors
+
+        :param response: the JSON response from the request being processed
+        """
+        return MMSession._process_response(self, response, method, final)
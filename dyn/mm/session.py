@@ -7,7 +7,7 @@ own respective functionality.
 import locale
 # API Libs
 from dyn.core import SessionEngine
-from dyn.compat import urlencode, pathname2url, json, prepare_for_loads
+from dyn.compat import urlencode, pathname2url, json_loads, prepare_for_loads
 from dyn.mm.errors import (EmailKeyError, EmailInvalidArgumentError,
                            EmailObjectError)
 
@@ -22,7 +22,8 @@ class MMSession(SessionEngine):
 
     def __init__(self, apikey, host='emailapi.dynect.net', port=443, ssl=True,
                  proxy_host=None, proxy_port=None, proxy_user=None,
-                 proxy_pass=None):
+                 proxy_pass=None, pool_size=1, retry_policy=None,
+                 cache=None, rate_limiter=None):
         """Initialize a Dynect Rest Session object and store the provided
         credentials
 
@@ -34,10 +35,24 @@ class MMSession(SessionEngine):
         :param proxy_port: The port that the proxy is served on
         :param proxy_user: A username to connect to the proxy with if required
         :param proxy_pass: A password to connect to the proxy with if required
+        :param pool_size: The maximum number of concurrent connections this
+            session may open to the API
+        :param retry_policy: A :class:`~dyn.retry.RetryPolicy` governing which
+            failed calls are retried, and how long to back off between them
+        :param cache: An optional :class:`~dyn.cache.ResponseCache` used to
+            serve repeated GET calls without a round trip to the API
+        :param rate_limiter: An optional :class:`~dyn.ratelimit.RateLimiter`
+            pacing the calls made by every thread sharing this session
         """
-        super(MMSession, self).__init__(host, port, ssl, proxy_host,
-                                        proxy_port,
-                                        proxy_user, proxy_pass)
+        super(MMSession, self).__init__(host, port, ssl,
+                                        proxy_host=proxy_host,
+                                        proxy_port=proxy_port,
+                                        proxy_user=proxy_user,
+                                        proxy_pass=proxy_pass,
+                                        pool_size=pool_size,
+                                        retry_policy=retry_policy,
+                                        cache=cache,
+                                        rate_limiter=rate_limiter)
         self.apikey = apikey
         self.content_type = 'application/x-www-form-urlencoded'
         self._conn = None
@@ -61,13 +76,16 @@ class MMSession(SessionEngine):
             return {}, '{}', uri
         return args, urlencode(args), uri
 
-    def _handle_response(self, response, uri, method, raw_args, final):
+    def _handle_response(self, response, uri, method, raw_args, final,
+                         wait=True):
         """Handle the processing of the API's response"""
         body = response.read()
-        ret_val = json.loads(prepare_for_loads(body, self._encoding))
+        ret_val = json_loads(prepare_for_loads(body, self._encoding))
+        ok = ret_val['response']['status'] == 200
+        self._record_response(response, body, 'success' if ok else 'failure')
         return self._process_response(ret_val['response'], method, final)
 
-    def _process_response(self, response, method, final=False):
+    def _process_response(self, response, method, final=False, wait=True):
         """Process an API response for failure, incomplete, or success and
         throw any appropriate errors
 
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""This module contains an optional client side limiter for the rate, and
+concurrency, of the API calls made by a session. The limiter is shared by
+every thread using the session, and adapts its concurrency limit to the
+throttling and errors it observes, so that bulk jobs settle at the highest
+rate the API will sustain::
+
+    >>> from dyn.ratelimit import RateLimiter
+    >>> from dyn.tm.session import DynectSession
+    >>> limiter = RateLimiter(rate=20, max_concurrency=16)
+    >>> s = DynectSession('customer', 'user', 'password', pool_size=16,
+    ...                   rate_limiter=limiter)
+"""
+import threading
+import time
+
+from .retry import RetryPolicy
+
+__author__ = 'jnappi'
+__all__ = ['RateLimiter']
+
+
+class RateLimiter(object):
+    """A token bucket which caps the rate at which calls are started, combined
+    with a concurrency limit which is adjusted additive-increase,
+    multiplicative-decrease: each successful call raises the limit by
+    *increase* spread over a full window of calls, while a throttled or
+    failed call cuts it by a factor of *decrease*. Only one cut is made per
+    burst of failures, so that calls which were already in flight when the
+    limit was cut don't cut it again.
+    """
+    #: Failure reasons which indicate the API is overloaded
+    backoff_on = (RetryPolicy.THROTTLED, RetryPolicy.SERVER,
+                  RetryPolicy.CONNECTION)
+
+    def __init__(self, rate=None, burst=None, max_concurrency=16,
+                 min_concurrency=1, initial_concurrency=None, increase=1,
+                 decrease=0.5):
+        """Create a new :class:`~dyn.ratelimit.RateLimiter`
+
+        :param rate: The maximum number of calls started per second, or *None*
+            to only limit concurrency
+        :param burst: The number of calls which may be started at once after
+            a quiet period, defaults to *rate*
+        :param max_concurrency: The upper bound of the concurrency limit
+        :param min_concurrency: The lower bound of the concurrency limit
+        :param initial_concurrency: The concurrency limit to start with,
+            defaults to *max_concurrency*
+        :param increase: The amount the concurrency limit grows by for every
+            full window of successful calls
+        :param decrease: The factor, between 0 and 1, the concurrency limit is
+            multiplied by when the API is overloaded
+        """
+        super(RateLimiter, self).__init__()
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError('Concurrency limits must satisfy '
+                             '1 <= min_concurrency <= max_concurrency')
+        if not 0 < decrease < 1:
+            raise ValueError('decrease must be between 0 and 1')
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.burst = burst or rate
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        if initial_concurrency is None:
+            initial_concurrency = max_concurrency
+        self._limit = float(min(max(initial_concurrency, min_concurrency),
+                                max_concurrency))
+        self._init_state()
+
+    def _init_state(self):
+        """Build the bucket, the in flight counter and their lock"""
+        self._cond = threading.Condition(threading.Lock())
+        self._in_flight = 0
+        self._tokens = self.burst
+        self._refilled = time.time()
+        self._cut_at = 0
+
+    @property
+    def limit(self):
+        """The number of calls currently allowed in flight at once"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        """The number of calls currently in flight"""
+        return self._in_flight
+
+    def _reserve(self):
+        """Take a token from the bucket, returning the number of seconds to
+        wait until it becomes available. Must be called holding the lock
+        """
+        if self.rate is None:
+            return 0
+        now = time.time()
+        self._tokens = min(self.burst, self._tokens +
+                           (now - self._refilled) * self.rate)
+        self._refilled = now
+        # The bucket may go into debt, which later callers must wait out
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0
+
+    def acquire(self):
+        """Block until a call may be started, returning a ticket to be passed
+        to :meth:`~dyn.ratelimit.RateLimiter.release` once it has finished
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return time.time()
+
+    def release(self, ticket, reason=None):
+        """Mark a call as finished, adjusting the concurrency limit by its
+        outcome
+
+        :param ticket: The ticket returned by
+            :meth:`~dyn.ratelimit.RateLimiter.acquire` for the call
+        :param reason: *None* if the call succeeded, otherwise the
+            :class:`~dyn.retry.RetryPolicy` reason it failed for
+        """
+        with self._cond:
+            self._in_flight -= 1
+            if reason in self.backoff_on:
+                if ticket > self._cut_at:
+                    self._limit = max(self.min_concurrency,
+                                      self._limit * self.decrease)
+                    self._cut_at = time.time()
+            elif reason is None:
+                self._limit = min(self.max_concurrency,
+                                  self._limit + self.increase / self._limit)
+            self._cond.notify_all()
+
+    def __getstate__(self):
+        """Locks can't be pickled, and in flight calls belong to this
+        process
+        """
+        d = self.__dict__.copy()
+        for attr in ('_cond', '_in_flight', '_tokens', '_refilled', '_cut_at'):
+            d.pop(attr, None)
+        return d
+
+    def __setstate__(self, state):
+        """Rebuild a full bucket after unpickling"""
+        self.__dict__ = state
+        self._init_state()
+
+    def __str__(self):
+        """str override"""
+        return '<RateLimiter>: {} in flight, limit {}, {} calls/s'.format(
+            self._in_flight, self.limit, self.rate or 'unlimited')
+
+    __repr__ = __unicode__ = __str__
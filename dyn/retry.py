@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""This module contains the policies governing how, and how often, failed API
+calls are retried. A :class:`~dyn.retry.RetryPolicy` may be passed to any
+session to replace the default policy::
+
+    >>> from dyn.retry import RetryPolicy
+    >>> from dyn.tm.session import DynectSession
+    >>> policy = RetryPolicy(max_attempts=6, deadline=300)
+    >>> s = DynectSession('customer', 'user', 'password', retry_policy=policy)
+"""
+import random
+import threading
+import time
+
+__author__ = 'jnappi'
+__all__ = ['RetryPolicy', 'ZoneBackoff', 'zone_key']
+
+#: API resources whose uri's are not scoped to a single zone
+_UNZONED = ('Session', 'Job')
+
+
+def zone_key(uri):
+    """Return the name of the zone the API resource at *uri* belongs to, or
+    *None* if it is not scoped to a zone. ie, '/REST/ARecord/example.com/...'
+    belongs to 'example.com'
+
+    :param uri: A validated API uri
+    """
+    segments = uri.split('?')[0].strip('/').split('/')
+    if len(segments) < 3 or segments[1] in _UNZONED:
+        return None
+    return segments[2].lower()
+
+
+class RetryPolicy(object):
+    """Decides which failed API calls are retried and how long to back off
+    between attempts. Delays grow exponentially from *base_delay*, are capped
+    at *max_delay* and are randomly shortened by up to *jitter* of their
+    length so that concurrent callers don't retry in lock step. Calls which
+    may not safely be repeated are not retried after failures the API may
+    already have carried them out through, unless *retry_non_idempotent* is
+    set.
+    """
+    #: ZoneProp is blocking the call while another task runs on the zone
+    BLOCKED = 'blocked'
+    #: The connection to the API failed mid-request
+    CONNECTION = 'connection'
+    #: The API responded with a 5xx status
+    SERVER = 'server'
+    #: The API responded with a 429 status, asking for calls to slow down
+    THROTTLED = 'throttled'
+    #: Failures after which the API may already have carried out the call
+    UNSAFE = frozenset((CONNECTION, SERVER))
+
+    def __init__(self, max_attempts=4, base_delay=2, max_delay=30,
+                 multiplier=2, jitter=0.5, deadline=120,
+                 retry_on=(BLOCKED, CONNECTION, SERVER, THROTTLED),
+                 retry_non_idempotent=False):
+        """Create a new :class:`~dyn.retry.RetryPolicy`
+
+        :param max_attempts: The total number of times a call may be attempted,
+            including the first. A value of 1 disables retries
+        :param base_delay: Seconds to wait before the first retry
+        :param max_delay: The longest a single backoff may last
+        :param multiplier: The factor the delay grows by after each attempt
+        :param jitter: The fraction, between 0 and 1, of each delay which is
+            randomized
+        :param deadline: The total number of seconds, measured from the first
+            attempt, after which no further retries are made
+        :param retry_on: The failure reasons which may be retried, any of
+            'blocked', 'connection', 'server' or 'throttled'
+        :param retry_non_idempotent: Whether calls which may not safely be
+            repeated, such as a POST creating a record, are retried after a
+            connection or server error, when the API may already have carried
+            them out
+        """
+        super(RetryPolicy, self).__init__()
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        if not 0 <= jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_on = frozenset(retry_on)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def retries(self, reason, idempotent=True):
+        """Return whether or not failures for *reason* are ever retried
+
+        :param reason: The reason the call failed
+        :param idempotent: Whether the call may safely be repeated
+        """
+        if reason not in self.retry_on:
+            return False
+        return idempotent or self.retry_non_idempotent or \
+            reason not in self.UNSAFE
+
+    def exhausted(self, attempt, started):
+        """Return whether or not a call may no longer be retried
+
+        :param attempt: The number of attempts made so far, starting at 1
+        :param started: The time at which the first attempt was made
+        """
+        if attempt >= self.max_attempts:
+            return True
+        return self.deadline is not None and \
+            time.time() - started >= self.deadline
+
+    def delay(self, attempt, started):
+        """Return the number of seconds to back off before the next attempt,
+        never running past the deadline
+
+        :param attempt: The number of attempts made so far, starting at 1
+        :param started: The time at which the first attempt was made
+        """
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1),
+                    self.max_delay)
+        delay -= delay * self.jitter * random.random()
+        if self.deadline is not None:
+            delay = min(delay, max(started + self.deadline - time.time(), 0))
+        return delay
+
+    def __str__(self):
+        """str override"""
+        return '<RetryPolicy>: {} attempts, {}s deadline, {}'.format(
+            self.max_attempts, self.deadline, ', '.join(sorted(self.retry_on)))
+
+    __repr__ = __unicode__ = __str__
+
+
+class ZoneBackoff(object):
+    """Tracks zones which the API has reported as blocked, so that only calls
+    against a blocked zone wait out its backoff, while calls against every
+    other zone proceed
+    """
+
+    def __init__(self):
+        super(ZoneBackoff, self).__init__()
+        self._until = {}
+        self._lock = threading.Lock()
+
+    def hold(self, zone, delay):
+        """Hold all calls against *zone* for the next *delay* seconds
+
+        :param zone: The name of the blocked zone
+        :param delay: The number of seconds to hold the zone for
+        """
+        now = time.time()
+        with self._lock:
+            # Drop any holds which have already expired
+            for name in [k for k, v in self._until.items() if v <= now]:
+                del self._until[name]
+            self._until[zone] = max(self._until.get(zone, 0), now + delay)
+
+    def remaining(self, zone):
+        """Return the number of seconds *zone* will still be held for
+
+        :param zone: The name of the zone about to be called, or *None*
+        """
+        if zone is None or not self._until:
+            return 0
+        with self._lock:
+            return max(self._until.get(zone, 0) - time.time(), 0)
+
+    def wait(self, zone):
+        """Block until *zone* is no longer being held
+
+        :param zone: The name of the zone about to be called, or *None*
+        """
+        remaining = self.remaining(zone)
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = self.remaining(zone)
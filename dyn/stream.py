@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""This module contains an incremental decoder for large API responses. Rather
+than reading a whole response body into memory and decoding it at once, a
+:class:`~dyn.stream.StreamDecoder` reads the body a chunk at a time and yields
+the items found under the response's ``data`` key one by one, so that memory
+use stays flat regardless of the size of the response.
+"""
+import codecs
+import re
+
+from .compat import json
+
+__author__ = 'jnappi'
+__all__ = ['StreamDecoder']
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class StreamDecoder(object):
+    """Iterates over the items in the ``data`` of a JSON API response. If
+    ``data`` is an object, ``(key, item)`` pairs are yielded for every item of
+    every list it holds (a non-list value is yielded as a single item). If it
+    is a list, ``(None, item)`` pairs are yielded. Every other top level key of
+    the response, ie ``status`` and ``msgs``, is collected in
+    :attr:`~dyn.stream.StreamDecoder.meta`, which is complete once iteration
+    has finished.
+    """
+
+    def __init__(self, read, encoding='UTF-8', chunk_size=65536):
+        """Create a new :class:`~dyn.stream.StreamDecoder`
+
+        :param read: A callable taking a number of bytes to read, ie an HTTP
+            response's ``read`` method, returning an empty string once the
+            body is exhausted
+        :param encoding: The character encoding of the body
+        :param chunk_size: The number of bytes to read at a time
+        """
+        super(StreamDecoder, self).__init__()
+        self.meta = {}
+        self._read = read
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._chunk_size = chunk_size
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        #: The number of bytes of the response body read so far
+        self.bytes_read = 0
+
+    def _fill(self):
+        """Read the next chunk of the body into the buffer, discarding what
+        has already been consumed. Returns *False* once the body is exhausted
+        """
+        if self._eof:
+            return False
+        chunk = self._read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            self._buf = self._buf[self._pos:] + self._decoder.decode(b'', True)
+        else:
+            self.bytes_read += len(chunk)
+            self._buf = self._buf[self._pos:] + self._decoder.decode(chunk)
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character without consuming
+        it, or '' at the end of the body
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos:self._pos + 1]
+
+    def _expect(self, chars):
+        """Consume and return the next character, which must be in *chars*"""
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError('Expecting one of {!r} at offset {} of '
+                             'response'.format(chars, self._pos))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode and consume the next complete JSON value"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # The value is most likely split across chunks
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next
+            # chunk, so only trust a value that ends before the buffer does
+            if end < len(self._buf) or not self._fill():
+                self._pos = end
+                return value
+
+    def _items(self, key):
+        """Yield the items of the value about to be read, which is stored
+        under *key* in the response's data
+        """
+        if self._peek() != '[':
+            yield key, self._value()
+            return
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield key, self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _data(self):
+        """Yield every item found in the response's data"""
+        if self._peek() != '{':
+            for item in self._items(None):
+                yield item
+            return
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            for item in self._items(key):
+                yield item
+            if self._expect(',}') == '}':
+                return
+
+    def __iter__(self):
+        """Yield ``(key, item)`` pairs for every item in the response's data"""
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == 'data':
+                for item in self._data():
+                    yield item
+            else:
+                self.meta[key] = self._value()
+            if self._expect(',}') == '}':
+                return
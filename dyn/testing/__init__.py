@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""The dyn.testing package contains tools for exercising this library without
+access to the real DynECT and Message Management APIs, such as the local
+stand-in server in :mod:`dyn.testing.fakeserver`.
+"""
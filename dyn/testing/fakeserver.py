@@ -0,0 +1,760 @@
+# -*- coding: utf-8 -*-
+"""This module contains a local, in-memory, stand-in for the DynECT Traffic
+Management and Message Management REST APIs, for benchmarking and exercising
+this library without network access. It implements enough of both APIs for
+sessions, zones, records, jobs, Traffic Director services and reports to work
+as they would against the real thing, and can inject latency, server errors,
+dropped connections, throttling and long running jobs::
+
+    >>> from dyn.testing.fakeserver import FakeDynServer
+    >>> from dyn.tm.session import DynectSession
+    >>> from dyn.tm.zones import Zone
+    >>> with FakeDynServer(latency=0.05, error_rate=0.01) as server:
+    ...     server.populate('example.com', 1000)
+    ...     s = DynectSession('customer', 'user', 'password',
+    ...                       **server.session_kwargs)
+    ...     records = Zone('example.com').get_all_records()
+
+The same server can be run in a separate process, so that it doesn't compete
+with the client for the GIL, either through
+:class:`~dyn.testing.fakeserver.FakeServerProcess` or from the command line::
+
+    $ python -m dyn.testing.fakeserver --port 8080 --zones 10 --records 1000
+"""
+import argparse
+import itertools
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+
+from ..compat import (BaseHTTPRequestHandler, HTTPServer, ThreadingMixIn,
+                      json_dumps, json_loads, parse_qs)
+
+__author__ = 'jnappi'
+__all__ = ['FakeDynServer', 'FakeServerProcess']
+
+#: The message the API responds with when a session's token isn't valid
+_BAD_TOKEN = 'login: Bad or expired credentials'
+#: The Message Management reports which may be queried
+_MM_REPORTS = ('sent', 'delivered', 'bounces', 'complaints', 'issues',
+               'opens', 'clicks')
+#: Traffic Director resources which aren't scoped to a service
+_DSF_UNSCOPED = ('DSF', 'DSFMonitor')
+#: The most items returned by a single page of a report
+_MM_PAGE_SIZE = 500
+#: The nameservers every zone is created with at its apex
+_NAMESERVERS = ('ns1.p01.dynect.net.', 'ns2.p01.dynect.net.',
+                'ns3.p01.dynect.net.', 'ns4.p01.dynect.net.')
+#: The TTL of the nameservers every zone is created with
+_NS_TTL = 86400
+
+
+def _snake(name):
+    """Convert a resource name to snake case, ie 'DSFRecordSet' becomes
+    'dsf_record_set'
+    """
+    return re.sub(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_',
+                  name).lower()
+
+
+class _Failure(Exception):
+    """Raised while handling a request to respond with an API failure"""
+
+    def __init__(self, http_status, info, code=None):
+        super(_Failure, self).__init__(info)
+        self.http_status = http_status
+        self.info = info
+        self.code = code
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Hands every request off to the server's
+    :class:`~dyn.testing.fakeserver.FakeDynServer`
+    """
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which Nagle's algorithm would
+    # otherwise hold up for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Requests aren't logged, there are far too many of them"""
+        pass
+
+    def _dispatch(self):
+        self.server.fake._dispatch(self)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+
+class _ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeDynServer(object):
+    """A threaded HTTP server which answers requests as the DynECT and Message
+    Management APIs would, from state held in memory. Any customer, username
+    and password may log in unless *credentials* are given. Faults are
+    injected into requests at random, in the order: dropped connections,
+    throttling, then server errors.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0, jitter=0,
+                 error_rate=0, throttle_rate=0, drop_rate=0,
+                 max_concurrency=None, max_rate=None, retry_after=None,
+                 job_rate=0, job_duration=1, report_size=100, apikey=None,
+                 credentials=None, seed=None):
+        """Create a new :class:`~dyn.testing.fakeserver.FakeDynServer`
+
+        :param host: The address to listen on
+        :param port: The port to listen on, 0 picks a free port
+        :param latency: Seconds added to every response
+        :param jitter: Up to this many more seconds, at random, are added to
+            every response
+        :param error_rate: The fraction of requests answered with a 503
+        :param throttle_rate: The fraction of requests answered with a 429
+        :param drop_rate: The fraction of requests whose connection is closed
+            without a response
+        :param max_concurrency: Requests beyond this many in flight at once
+            are answered with a 429
+        :param max_rate: Requests beyond this many in a single second are
+            answered with a 429
+        :param retry_after: Seconds sent as the Retry-After of a 429, if any
+        :param job_rate: The fraction of Traffic Management calls which spawn
+            a job, answered with a 307 to be polled until it completes
+        :param job_duration: Seconds until a spawned job completes
+        :param report_size: The number of items in every Message Management
+            report
+        :param apikey: The only Message Management API key accepted, if any
+        :param credentials: A *dict* mapping (customer, username) to password
+            of the only Traffic Management logins accepted, if any
+        :param seed: A seed, for repeatable fault injection
+        """
+        super(FakeDynServer, self).__init__()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.drop_rate = drop_rate
+        self.max_concurrency = max_concurrency
+        self.max_rate = max_rate
+        self.retry_after = retry_after
+        self.job_rate = job_rate
+        self.job_duration = job_duration
+        self.report_size = report_size
+        self.apikey = apikey
+        self.credentials = credentials
+        #: Counts of requests made, and of each fault injected
+        self.stats = Counter()
+        #: The zones being served, by name
+        self.zones = OrderedDict()
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._tokens = set()
+        self._jobs = {}
+        self._resources = {}
+        self._in_flight = 0
+        self._window = (0, 0)
+        self._server = self._thread = None
+
+    @property
+    def session_kwargs(self):
+        """Keyword arguments connecting a session to this server"""
+        return {'host': self.host, 'port': self.port, 'ssl': False}
+
+    def start(self):
+        """Start serving requests from a background thread"""
+        self._server = _ThreadedHTTPServer((self.host, self.port), _Handler)
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    # Seeding
+
+    def add_zone(self, name, ttl=3600, serial_style='increment',
+                 contact=None):
+        """Add a zone holding only its SOA record and the nameservers at its
+        apex, as the API creates it
+
+        :param name: The name of the zone
+        :param ttl: The default TTL of the zone's records
+        :param serial_style: The style of the zone's serial
+        :param contact: The administrative contact of the zone
+        """
+        name = name.rstrip('.')
+        contact = contact or 'admin@' + name
+        local, _, domain = contact.partition('@')
+        with self._lock:
+            self.zones[name] = {'zone': name, 'serial': 1, 'ttl': ttl,
+                                'serial_style': serial_style,
+                                'rname': contact, 'frozen': False,
+                                'records': OrderedDict()}
+            soa = self.add_record(name, name, 'SOA', {
+                'mname': _NAMESERVERS[0],
+                'rname': '{}.{}.'.format(local.replace('.', '\\.'),
+                                         domain.rstrip('.')),
+                'serial': 1, 'refresh': 3600, 'retry': 600,
+                'expire': 604800, 'minimum': 1800}, ttl)
+            self.zones[name]['soa_id'] = soa['record_id']
+            for nameserver in _NAMESERVERS:
+                self.add_record(name, name, 'NS', {'nsdname': nameserver},
+                                _NS_TTL)
+
+    def add_record(self, zone, fqdn, record_type, rdata, ttl=0):
+        """Add a record to a zone, returning the record as the API would
+
+        :param zone: The name of an existing zone
+        :param fqdn: The fully qualified name of the record's node
+        :param record_type: The type of the record, ie 'A'
+        :param rdata: A *dict* of the record's data, ie {'address': '1.1.1.1'}
+        :param ttl: The TTL of the record, 0 for the zone's default
+        """
+        zone = zone.rstrip('.')
+        with self._lock:
+            record_id = next(self._ids)
+            record = {'zone': zone, 'fqdn': fqdn.rstrip('.'),
+                      'record_type': record_type, 'record_id': record_id,
+                      'ttl': int(ttl or self.zones[zone]['ttl']),
+                      'rdata': dict(rdata)}
+            self.zones[zone]['records'][record_id] = record
+        return record
+
+    def populate(self, zone, count, record_type='A'):
+        """Fill a zone, created if need be, with *count* generated records
+
+        :param zone: The name of the zone
+        :param count: The number of records to add
+        :param record_type: Either 'A', 'AAAA', 'CNAME' or 'TXT'
+        """
+        zone = zone.rstrip('.')
+        with self._lock:
+            if zone not in self.zones:
+                self.add_zone(zone)
+            for i in range(count):
+                rdata = {'A': {'address': '10.{}.{}.{}'.format(
+                             i >> 16 & 255, i >> 8 & 255, i & 255)},
+                         'AAAA': {'address': 'fd00::{:x}'.format(i)},
+                         'CNAME': {'cname': 'target.{}.'.format(zone)},
+                         'TXT': {'txtdata': 'record {}'.format(i)}}
+                self.add_record(zone, 'host{}.{}'.format(i, zone),
+                                record_type, rdata[record_type])
+
+    # Dispatching
+
+    def _fault(self):
+        """Pick the fault, if any, to inject into the current request. Must be
+        called holding the lock
+        """
+        chance = self._random.random
+        if self.drop_rate and chance() < self.drop_rate:
+            return 'dropped'
+        if self.max_concurrency is not None and \
+                self._in_flight > self.max_concurrency:
+            return 'throttled'
+        if self.max_rate is not None:
+            second, count = self._window
+            now = int(time.time())
+            count = count + 1 if now == second else 1
+            self._window = (now, count)
+            if count > self.max_rate:
+                return 'throttled'
+        if self.throttle_rate and chance() < self.throttle_rate:
+            return 'throttled'
+        if self.error_rate and chance() < self.error_rate:
+            return 'errors'
+        return None
+
+    def _dispatch(self, request):
+        """Answer a single request"""
+        path = request.path.split('?')[0]
+        length = int(request.headers.get('Content-Length') or 0)
+        body = request.rfile.read(length) if length else b''
+        with self._lock:
+            self.stats['requests'] += 1
+            self._in_flight += 1
+            fault = self._fault()
+            if fault is not None:
+                self.stats[fault] += 1
+            delay = self.latency + self.jitter * self._random.random()
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            segments = [x for x in path.split('/') if x]
+            if fault == 'dropped':
+                request.close_connection = True
+                request.connection.close()
+            elif fault == 'throttled':
+                headers = {}
+                if self.retry_after is not None:
+                    headers['Retry-After'] = str(self.retry_after)
+                self._send(request, 429, self._tm_payload(
+                    'failure', {}, None, 'Too many requests', 'THROTTLED'),
+                    headers)
+            elif fault == 'errors':
+                self._send(request, 503, self._tm_payload(
+                    'failure', {}, None, 'Service Unavailable'))
+            elif segments[:1] == ['REST']:
+                self._tm(request, segments[1:], body)
+            elif segments[:2] == ['rest', 'json']:
+                self._mm(request, segments[2:], request.path, body)
+            else:
+                self._send(request, 404, None)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _send(request, status, payload, headers=None):
+        """Write a response, with *payload* encoded as JSON"""
+        out = b''
+        if payload is not None:
+            out = json_dumps(payload)
+            if not isinstance(out, bytes):
+                out = out.encode('UTF-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(out)))
+        for key, value in (headers or {}).items():
+            request.send_header(key, value)
+        request.end_headers()
+        request.wfile.write(out)
+
+    # Traffic Management
+
+    @staticmethod
+    def _tm_payload(status, data, job_id, info, code=None):
+        """Build a Traffic Management API response"""
+        return {'status': status, 'data': data, 'job_id': job_id,
+                'msgs': [{'INFO': info, 'SOURCE': 'BLL', 'ERR_CD': code,
+                          'LVL': 'INFO' if status == 'success' else 'ERROR'}]}
+
+    def _tm(self, request, segments, body):
+        """Answer a Traffic Management API request"""
+        method = request.command
+        resource, params = (segments or [''])[0], segments[1:]
+        try:
+            args = json_loads(body) if body else {}
+        except ValueError:
+            args = {}
+        token = request.headers.get('Auth-Token')
+        job_id = next(self._ids)
+        try:
+            with self._lock:
+                if resource == 'Session':
+                    data = self._session(method, args, token)
+                elif token not in self._tokens:
+                    raise _Failure(400, _BAD_TOKEN, 'INVALID_DATA')
+                elif resource == 'Job':
+                    data = self._job(params)
+                else:
+                    data = self._tm_resource(method, resource, params, args)
+        except _Failure as e:
+            return self._send(request, e.http_status, self._tm_payload(
+                'failure', {}, job_id, e.info, e.code))
+        if resource == 'Job':
+            if data is None:
+                location = '/REST/Job/{}/'.format(params[0])
+                return self._send(request, 307, None, {'Location': location})
+            return self._send(request, 200, data)
+        payload = self._tm_payload('success', data, job_id,
+                                   '{}: {} {}'.format(resource.lower(),
+                                                      method.lower(),
+                                                      'succeeded'))
+        if resource != 'Session' and self.job_rate and \
+                self._random.random() < self.job_rate:
+            with self._lock:
+                self.stats['jobs'] += 1
+                self._jobs[str(job_id)] = (time.time() + self.job_duration,
+                                           payload)
+            location = '/REST/Job/{}/'.format(job_id)
+            return self._send(request, 307, None, {'Location': location})
+        self._send(request, 200, payload)
+
+    def _session(self, method, args, token):
+        """Log in, check, keep alive or log out of a session"""
+        if method == 'POST':
+            if self.credentials is not None:
+                login = (args.get('customer_name'), args.get('user_name'))
+                if self.credentials.get(login) != args.get('password'):
+                    raise _Failure(400, 'login: Credentials you entered did '
+                                        'not match those in our database',
+                                   'INVALID_DATA')
+            token = '{:032x}'.format(self._random.getrandbits(128))
+            self._tokens.add(token)
+            return {'token': token, 'version': '3.7.0'}
+        if token not in self._tokens:
+            raise _Failure(400, _BAD_TOKEN, 'INVALID_DATA')
+        if method == 'DELETE':
+            self._tokens.discard(token)
+        return {}
+
+    def _job(self, params):
+        """Return the response of a completed job, or *None* if the job is
+        still running
+        """
+        job_id = params[0] if params else None
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise _Failure(404, 'job: No such job', 'NOT_FOUND')
+        ready_at, payload = job
+        if time.time() < ready_at:
+            return None
+        del self._jobs[job_id]
+        return payload
+
+    def _tm_resource(self, method, resource, params, args):
+        """Return the data of a successful call against a Traffic Management
+        resource, or raise a :class:`_Failure`. Called holding the lock
+        """
+        if resource == 'Zone':
+            return self._zone(method, params, args)
+        if resource in ('AllRecord', 'NodeList'):
+            return self._all_records(resource, params, args)
+        if resource == 'Node' and method == 'DELETE' and len(params) > 1:
+            zone = self._get_zone(params[0])
+            for record in self._under(zone, params[1]):
+                del zone['records'][record['record_id']]
+            return {}
+        if resource.startswith('DSF'):
+            return self._dsf(method, resource, params, args)
+        if resource.endswith('Record') and len(params) > 1:
+            return self._records(method, resource[:-len('Record')], params,
+                                 args)
+        raise _Failure(404, '{}: Not found'.format(resource), 'NOT_FOUND')
+
+    def _get_zone(self, name):
+        """Return the zone *name*, or raise a :class:`_Failure`"""
+        zone = self.zones.get(name.rstrip('.'))
+        if zone is None:
+            raise _Failure(404, 'zone: No such zone', 'NOT_FOUND')
+        return zone
+
+    @staticmethod
+    def _zone_data(zone):
+        """Build the API representation of a zone"""
+        return {'zone': zone['zone'], 'serial': zone['serial'],
+                'serial_style': zone['serial_style'], 'zone_type': 'Primary'}
+
+    def _zone(self, method, params, args):
+        """List, create, get, publish, freeze, thaw or delete a zone"""
+        if not params:
+            if args.get('detail') == 'Y':
+                return [self._zone_data(x) for x in self.zones.values()]
+            return ['/REST/Zone/{}/'.format(x) for x in self.zones]
+        name = params[0].rstrip('.')
+        if method == 'POST':
+            if name in self.zones:
+                raise _Failure(400, 'name: Name already exists',
+                               'TARGET_EXISTS')
+            self.add_zone(name, args.get('ttl', 3600),
+                          args.get('serial_style', 'increment'),
+                          args.get('rname'))
+            return self._zone_data(self.zones[name])
+        zone = self._get_zone(name)
+        if method == 'DELETE':
+            del self.zones[name]
+            return {}
+        if method == 'PUT':
+            if args.get('publish'):
+                zone['serial'] += 1
+                soa = zone['records'].get(zone['soa_id'])
+                if soa is not None:
+                    zone['records'][soa['record_id']] = dict(soa, rdata=dict(
+                        soa['rdata'], serial=zone['serial']))
+            if args.get('freeze'):
+                zone['frozen'] = True
+            if args.get('thaw'):
+                zone['frozen'] = False
+        return self._zone_data(zone)
+
+    @staticmethod
+    def _under(zone, node):
+        """Return the records of *zone* at or below *node*"""
+        node = node.rstrip('.')
+        suffix = '.' + node
+        return [x for x in zone['records'].values()
+                if x['fqdn'] == node or x['fqdn'].endswith(suffix)]
+
+    @staticmethod
+    def _record_uri(record):
+        return '/REST/{}Record/{}/{}/{}'.format(
+            record['record_type'], record['zone'], record['fqdn'],
+            record['record_id'])
+
+    def _all_records(self, resource, params, args):
+        """List the records, or the nodes, of a zone"""
+        if not params:
+            raise _Failure(404, 'zone: No zone specified', 'NOT_FOUND')
+        zone = self._get_zone(params[0])
+        if len(params) > 1:
+            records = self._under(zone, params[1])
+        else:
+            records = list(zone['records'].values())
+        if resource == 'NodeList':
+            return sorted(set(x['fqdn'] for x in records))
+        if args.get('detail') != 'Y':
+            return [self._record_uri(x) for x in records]
+        grouped = OrderedDict()
+        for record in records:
+            label = record['record_type'].lower() + '_records'
+            grouped.setdefault(label, []).append(record)
+        return grouped
+
+    def _records(self, method, record_type, params, args):
+        """List, create, get, update or delete the records of one type at a
+        single node
+        """
+        zone = self._get_zone(params[0])
+        fqdn = params[1].rstrip('.')
+        records = zone['records']
+        if len(params) > 2:
+            try:
+                record = records[int(params[2])]
+            except (KeyError, ValueError):
+                record = None
+            if record is None or record['fqdn'] != fqdn or \
+                    record['record_type'] != record_type:
+                raise _Failure(404, 'record: No such record', 'NOT_FOUND')
+            if method == 'DELETE':
+                del records[record['record_id']]
+                return {}
+            if method == 'PUT':
+                # Replaced rather than updated, as responses being written
+                # out may still refer to the old record
+                record = dict(record, rdata=args.get('rdata', record['rdata']),
+                              ttl=int(args.get('ttl', record['ttl'])))
+                records[record['record_id']] = record
+            return record
+        if method == 'POST':
+            return self.add_record(zone['zone'], fqdn, record_type,
+                                   args.get('rdata', {}), args.get('ttl', 0))
+        matching = [x for x in records.values()
+                    if x['fqdn'] == fqdn and x['record_type'] == record_type]
+        if method == 'DELETE':
+            for record in matching:
+                del records[record['record_id']]
+            return {}
+        if args.get('detail') == 'Y':
+            return matching
+        return [self._record_uri(x) for x in matching]
+
+    def _dsf(self, method, resource, params, args):
+        """Create, list, get, update or delete a Traffic Director resource.
+        Resources other than services and monitors are scoped to a service
+        """
+        id_name = 'service_id' if resource == 'DSF' else \
+            _snake(resource) + '_id'
+        scope = () if resource in _DSF_UNSCOPED else tuple(params[:1])
+        if resource not in _DSF_UNSCOPED and not scope:
+            raise _Failure(404, 'service_id: No service specified',
+                           'NOT_FOUND')
+        params = params[len(scope):]
+        store = self._resources.setdefault(resource, OrderedDict())
+        if not params:
+            if method == 'POST':
+                item = dict(args)
+                item[id_name] = '{:x}'.format(next(self._ids))
+                if scope:
+                    item['service_id'] = scope[0]
+                store[scope + (item[id_name],)] = item
+                return item
+            return [v for k, v in store.items() if k[:-1] == scope]
+        key = scope + (params[0],)
+        item = store.get(key)
+        if item is None:
+            raise _Failure(404, '{}: Not found'.format(id_name), 'NOT_FOUND')
+        if method == 'DELETE':
+            del store[key]
+            return {}
+        if method == 'PUT':
+            item = store[key] = dict(item, **args)
+        return item
+
+    # Message Management
+
+    def _mm(self, request, segments, path, body):
+        """Answer a Message Management API request"""
+        query = path.split('?', 1)[1] if '?' in path else ''
+        if request.command == 'POST':
+            query = body.decode('UTF-8')
+        args = {k: v[0] for k, v in parse_qs(query).items()}
+        if self.apikey is not None and args.get('apikey') != self.apikey:
+            status, message, data = 451, 'Invalid API key', {}
+        elif segments[:1] == ['reports'] and len(segments) > 1 and \
+                segments[1] in _MM_REPORTS:
+            status, message = 200, 'OK'
+            data = self._report(segments[1], segments[2:], args)
+        else:
+            status, message, data = 453, 'Object not found', {}
+        self._send(request, 200, {'response': {'status': status,
+                                               'message': message,
+                                               'data': data}})
+
+    def _report(self, name, params, args):
+        """Build a Message Management report, its count or its uniques"""
+        if params[:1] == ['count']:
+            key = 'unique' if params[1:] == ['unique'] else 'count'
+            return {key: self.report_size}
+        start = int(args.get('startindex', 0))
+        end = min(start + _MM_PAGE_SIZE, self.report_size)
+        epoch = datetime(2015, 1, 1)
+        items = [{'emailaddress': 'user{}@example.com'.format(i),
+                  'date': (epoch + timedelta(minutes=i)).strftime(
+                      '%Y-%m-%dT%H:%M:%S') + '+00:00'}
+                 for i in range(start, end)]
+        return {'unique' if params[:1] == ['unique'] else name: items}
+
+    def __str__(self):
+        """str override"""
+        return '<FakeDynServer>: {}:{}'.format(self.host, self.port)
+
+    __repr__ = __unicode__ = __str__
+
+
+class FakeServerProcess(object):
+    """Runs a :class:`~dyn.testing.fakeserver.FakeDynServer` in a child
+    process, so that benchmarks measure the client rather than the server
+    competing with it for the GIL
+    """
+
+    def __init__(self, **options):
+        """Create a new :class:`~dyn.testing.fakeserver.FakeServerProcess`
+
+        :param options: Any of the command line options of this module, ie
+            latency=0.05 or zones=10, with underscores in place of dashes.
+            Options which may be repeated take a *list*
+        """
+        super(FakeServerProcess, self).__init__()
+        self.options = options
+        self.host = options.get('host', '127.0.0.1')
+        self.port = None
+        self.process = None
+
+    @property
+    def session_kwargs(self):
+        """Keyword arguments connecting a session to the server"""
+        return {'host': self.host, 'port': self.port, 'ssl': False}
+
+    def start(self):
+        """Start the child process, returning once it is serving requests"""
+        command = [sys.executable, '-m', 'dyn.testing.fakeserver']
+        for name, value in sorted(self.options.items()):
+            if value is None:
+                continue
+            if not isinstance(value, (list, tuple)):
+                value = [value]
+            for item in value:
+                command += ['--' + name.replace('_', '-'), str(item)]
+        # Make sure the child imports this copy of the library
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            x for x in (root, env.get('PYTHONPATH')) if x)
+        self.process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                        env=env)
+        line = self.process.stdout.readline().decode('UTF-8')
+        if not line:
+            self.process.wait()
+            raise RuntimeError('Fake server exited with status {}'.format(
+                self.process.returncode))
+        self.host, port = line.split()[-1].rsplit(':', 1)
+        self.port = int(port)
+        return self
+
+    def stop(self):
+        """Stop the child process"""
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+            self.process.stdout.close()
+            self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __str__(self):
+        """str override"""
+        return '<FakeServerProcess>: {}:{}'.format(self.host, self.port)
+
+    __repr__ = __unicode__ = __str__
+
+
+def main(argv=None):
+    """Serve a :class:`~dyn.testing.fakeserver.FakeDynServer` until
+    interrupted, printing the address it is listening on
+    """
+    parser = argparse.ArgumentParser(
+        description='Serve a local stand-in for the DynECT and Message '
+                    'Management REST APIs')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    for name in ('latency', 'jitter', 'error-rate', 'throttle-rate',
+                 'drop-rate', 'retry-after', 'job-rate'):
+        parser.add_argument('--' + name, type=float, default=0)
+    parser.add_argument('--job-duration', type=float, default=1)
+    for name in ('max-concurrency', 'max-rate', 'seed'):
+        parser.add_argument('--' + name, type=int)
+    parser.add_argument('--report-size', type=int, default=100)
+    parser.add_argument('--apikey')
+    parser.add_argument('--zones', type=int, default=0,
+                        help='generate this many zones, named '
+                             'zone0.example.com onwards')
+    parser.add_argument('--records', type=int, default=0,
+                        help='the number of A records in each generated zone')
+    parser.add_argument('--populate', action='append', default=[],
+                        metavar='ZONE=COUNT',
+                        help='generate a zone holding COUNT A records, may '
+                             'be given more than once')
+    options = vars(parser.parse_args(argv))
+    zones, records = options.pop('zones'), options.pop('records')
+    populate = [x.rsplit('=', 1) for x in options.pop('populate')]
+    options['retry_after'] = options['retry_after'] or None
+    server = FakeDynServer(**options)
+    for i in range(zones):
+        server.populate('zone{}.example.com'.format(i), records)
+    for zone, count in populate:
+        server.populate(zone, int(count))
+    server.start()
+    print('Serving on {}:{}'.format(server.host, server.port))
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
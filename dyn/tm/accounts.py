@@ -9,8 +9,10 @@ import re
 
 __author__ = 'jnappi'
 __all__ = ['get_updateusers', 'get_users', 'get_permissions_groups',
-           'get_contacts', 'get_notifiers', 'UpdateUser', 'User',
-           'PermissionsGroup', 'UserZone', 'Notifier', 'Contact']
+           'get_contacts', 'get_notifiers', 'iter_updateusers', 'iter_users',
+           'iter_permissions_groups', 'iter_contacts', 'iter_notifiers',
+           'UpdateUser', 'User', 'PermissionsGroup', 'UserZone', 'Notifier',
+           'Contact']
 
 
 def get_updateusers(search=None):
@@ -162,6 +164,96 @@ def get_notifiers(search=None):
     return notifiers
 
 
+def _iter_matching(uri, build, search=None, api_args=None):
+    """Decode the listing at *uri* incrementally, yielding the object built
+    from each item by *build* which matches any of the criteria in *search*
+    """
+    api_args = dict(api_args or {}, detail='Y')
+    session = DynectSession.get_session()
+    for _, data in session.execute_iter(uri, 'GET', api_args):
+        obj = build(data)
+        if search is None or any(hasattr(obj, key) and
+                                 getattr(obj, key) == val
+                                 for key, val in search.items()):
+            yield obj
+
+
+def iter_updateusers(search=None):
+    """Iterate over :class:`~dyn.tm.accounts.UpdateUser` objects, building
+    each only as it is decoded from the API's response. Takes the same
+    *search* criteria as :func:`~dyn.tm.accounts.get_updateusers`
+
+    :param search: A ``dict`` of search criteria
+    :return: a generator of :class:`~dyn.tm.accounts.UpdateUser` objects
+    """
+    return _iter_matching('/UpdateUser/',
+                          lambda user: UpdateUser(api=False, **user), search)
+
+
+def _build_user(user):
+    user_name = user.pop('user_name', None)
+    return User(user_name, api=False, **user)
+
+
+def iter_users(search=None):
+    """Iterate over :class:`~dyn.tm.accounts.User` objects, building each only
+    as it is decoded from the API's response. Takes the same *search*
+    criteria as :func:`~dyn.tm.accounts.get_users`, which are matched by the
+    API
+
+    :param search: A ``dict`` of search criteria
+    :return: a generator of :class:`~dyn.tm.accounts.User` objects
+    """
+    api_args = {}
+    if search is not None:
+        api_args['search'] = ' AND '.join('{}:"{}"'.format(key, val)
+                                          for key, val in search.items())
+    return _iter_matching('/User/', _build_user, api_args=api_args)
+
+
+def iter_permissions_groups(search=None):
+    """Iterate over :class:`~dyn.tm.accounts.PermissionGroup` objects,
+    building each only as it is decoded from the API's response. Takes the
+    same *search* criteria as :func:`~dyn.tm.accounts.get_permissions_groups`
+
+    :param search: A ``dict`` of search criteria
+    :return: a generator of :class:`~dyn.tm.accounts.PermissionGroup` objects
+    """
+    return _iter_matching(
+        '/PermissionGroup/',
+        lambda group: PermissionsGroup(None, api=False, **group), search)
+
+
+def _build_contact(contact):
+    if 'nickname' in contact:
+        contact['_nickname'] = contact.pop('nickname')
+    return Contact(None, api=False, **contact)
+
+
+def iter_contacts(search=None):
+    """Iterate over :class:`~dyn.tm.accounts.Contact` objects, building each
+    only as it is decoded from the API's response. Takes the same *search*
+    criteria as :func:`~dyn.tm.accounts.get_contacts`
+
+    :param search: A ``dict`` of search criteria
+    :return: a generator of :class:`~dyn.tm.accounts.Contact` objects
+    """
+    return _iter_matching('/Contact/', _build_contact, search)
+
+
+def iter_notifiers(search=None):
+    """Iterate over :class:`~dyn.tm.accounts.Notifier` objects, building each
+    only as it is decoded from the API's response. Takes the same *search*
+    criteria as :func:`~dyn.tm.accounts.get_notifiers`
+
+    :param search: A ``dict`` of search criteria
+    :return: a generator of :class:`~dyn.tm.accounts.Notifier` objects
+    """
+    return _iter_matching(
+        '/Notifier/',
+        lambda notifier: Notifier(None, api=False, **notifier), search)
+
+
 class UpdateUser(object):
     """:class:`~dyn.tm.accounts.UpdateUser` type objects are a special form of
     a :class:`~dyn.tm.accounts.User` which are tied to a specific Dynamic DNS
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""This module implements an asyncio native interface to a DynECT REST
+Session. Unlike :class:`~dyn.tm.session.DynectSession`, an
+:class:`~dyn.tm.aio.AsyncDynectSession` is not a Singleton, it is passed around
+explicitly and its API calls are awaited::
+
+    >>> async with AsyncDynectSession(customer, username, password) as s:
+    ...     zones = await s.execute('/Zone/', 'GET', {'detail': 'Y'})
+
+Note: this module requires Python 3.5 or higher.
+"""
+import asyncio
+import time
+
+from dyn.aio import AsyncSessionEngine
+from dyn.compat import force_unicode, json_loads
+from dyn.encrypt import AESCipher
+from dyn.tm.errors import DynectAuthError, DynectGetError
+from dyn.tm.session import DynectSession
+
+__author__ = 'jnappi'
+__all__ = ['AsyncDynectSession']
+
+
+class AsyncDynectSession(AsyncSessionEngine):
+    """Base object representing an asyncio DynectSession Session"""
+    _valid_methods = ('DELETE', 'GET', 'POST', 'PUT')
+    uri_root = '/REST'
+    _idempotent = DynectSession._idempotent
+
+    def __init__(self, customer, username, password, host='api.dynect.net',
+                 port=443, ssl=True, api_version='current', auto_auth=True,
+                 key=None, pool_size=10, retry_policy=None):
+        """Initialize an asyncio Dynect Rest Session object and store the
+        provided credentials. No connection is made until the session is
+        entered as an async context manager, or
+        :meth:`~dyn.tm.aio.AsyncDynectSession.authenticate` is awaited.
+
+        :param customer: DynECT customer name
+        :param username: DynECT Customer's username
+        :param password: User's password
+        :param host: DynECT API server address
+        :param port: Port to connect to DynECT API server
+        :param ssl: Enable SSL
+        :param api_version: version of the api to use
+        :param auto_auth: declare whether or not to automatically log in when
+            entering this session as an async context manager
+        :param key: A valid AES-256 password encryption key to be used when
+            encrypting your password
+        :param pool_size: The maximum number of API calls which may be in
+            flight at any given time
+        :param retry_policy: The :class:`~dyn.retry.RetryPolicy` governing
+            which failed calls are retried and how long to back off between
+            attempts
+        """
+        super(AsyncDynectSession, self).__init__(host, port, ssl,
+                                                 pool_size=pool_size,
+                                                 retry_policy=retry_policy)
+        self.__cipher = AESCipher(key)
+        self.extra_headers = {'API-Version': api_version}
+        self.customer = customer
+        self.username = username
+        self.password = self.__cipher.encrypt(password)
+        self.auto_auth = auto_auth
+        self._checking_session = False
+
+    async def __aenter__(self):
+        """Log in, if auto_auth was requested, and yield this session"""
+        if self.auto_auth:
+            await self.authenticate()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Log out and close all pooled connections"""
+        try:
+            if self._token is not None:
+                await self.log_out()
+        finally:
+            await self.close()
+
+    async def _handle_error(self, uri, method, raw_args):
+        """Handle the processing of a connection error with the api by checking
+        that our session is still valid, renewing it if not, before the failed
+        call is retried. The current token is kept until a new one has been
+        issued, so that other calls are never made without one
+        """
+        if self._checking_session:
+            # The session is already being checked, retry the call as usual
+            return True
+        token = self._token
+        # Idle keep-alive connections were likely dropped along with ours
+        self._pool.clear()
+        self._checking_session = True
+        try:
+            expired = await self._session_expired()
+        finally:
+            self._checking_session = False
+        if expired and self._token == token:
+            # Swapped in by _meta_update once the login succeeds
+            await self.execute('/REST/Session/', 'POST', self.__auth_data)
+        return True
+
+    async def _session_expired(self):
+        """Return whether the API reports our session as no longer valid. A
+        check which fails for any other reason, once retried as allowed by
+        this session's :class:`~dyn.retry.RetryPolicy`, is not taken as the
+        session having expired
+        """
+        try:
+            session_check = await self.execute('/REST/Session/', 'GET')
+        except DynectGetError as err:
+            return 'login:' in err.message
+        except (IOError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return False
+        return 'login:' in session_check['msgs'][0]['INFO']
+
+    async def _process_response(self, response, method, final=False):
+        """Process an API response for failure, incomplete, or success and
+        throw any appropriate errors
+
+        :param response: the JSON response from the request being processed
+        :param method: the HTTP method
+        :param final: boolean flag representing whether or not to continue
+            polling
+        """
+        if response['status'] == 'incomplete' and not final:
+            response = await self.wait_for_job_to_complete(
+                response['job_id'])
+            final = True
+        return DynectSession._process_response(self, response, method, final)
+
+    async def wait_for_job_to_complete(self, job_id, timeout=120):
+        """Poll for the status of an incomplete job until it comes back with
+        success or failure, or until *timeout* seconds have passed, without
+        blocking the event loop
+
+        :param job_id: the id of the job to poll for a response from
+        :param timeout: how long (in seconds) we should wait for a valid
+            response before giving up on this request
+        """
+        self.logger.debug('Polling for job_id: {}'.format(job_id))
+        uri = '/REST/Job/{}/'.format(job_id)
+        deadline = time.time() + timeout
+        delay = 1
+        response = {'status': 'incomplete'}
+        while response['status'] == 'incomplete' and time.time() < deadline:
+            await asyncio.sleep(min(delay, max(deadline - time.time(), 0)))
+            raw = await self._request(uri, 'GET', '')
+            if raw.status != 307:
+                response = json_loads(raw.body)
+            delay = min(delay * 2, 10)
+        return response
+
+    async def authenticate(self):
+        """Authenticate to the DynectSession service with the provided
+        credentials
+        """
+        try:
+            response = await self.execute('/Session/', 'POST',
+                                          self.__auth_data)
+        except IOError:
+            raise DynectAuthError('Unable to access the API host')
+        if response['status'] != 'success':
+            self.logger.error('An error was encountered authenticating to Dyn')
+            raise DynectAuthError(response['msgs'])
+        self.logger.info('DynectSession Authentication Successful')
+
+    async def log_out(self):
+        """Log the current session out from the DynECT API system"""
+        await self.execute('/Session/', 'DELETE', {})
+
+    @property
+    def __auth_data(self):
+        """A dict of the authdata required to authenticate as this user"""
+        return {'customer_name': self.customer, 'user_name': self.username,
+                'password': self.__cipher.decrypt(self.password)}
+
+    def __str__(self):
+        """str override"""
+        header = super(AsyncDynectSession, self).__str__()
+        return header + force_unicode(': {}, {}').format(self.customer,
+                                                         self.username)
@@ -6,10 +6,19 @@ TODO: add a DynectInvalidPermissionsError
 """
 __all__ = ['DynectAuthError', 'DynectInvalidArgumentError',
            'DynectCreateError', 'DynectUpdateError', 'DynectGetError',
-           'DynectDeleteError', 'DynectQueryTimeout']
+           'DynectDeleteError', 'DynectQueryTimeout', 'DynectZoneFileError']
 __author__ = 'jnappi'
 
 
+def _unpickle(cls, state):
+    """Rebuild a pickled :class:`~dyn.tm.errors.DynectError` without calling
+    its __init__, whose arguments aren't kept
+    """
+    error = cls.__new__(cls)
+    error.__dict__.update(state)
+    return error
+
+
 class DynectError(Exception):
     """Base Dynect Error class"""
     def __init__(self, json_response_messages, api_type=None):
@@ -32,6 +41,10 @@ class DynectError(Exception):
         if api_type is not None:
             self.message = '{}: {}'.format(api_type, self.message)
 
+    def __reduce__(self):
+        """Pickle by state, so errors can be returned from worker processes"""
+        return _unpickle, (type(self), self.__dict__)
+
     def __repr__(self):
         return self.message
 
@@ -142,7 +155,24 @@ class DynectQueryTimeout(DynectError):
     def __str__(self):
         return self.message
 
+
+class DynectZoneFileError(DynectError):
+    """Error raised if a Master file can not be parsed"""
+    def __init__(self, line, reason):
+        """Format this error's message to report back the line of the file
+        which could not be parsed, and why
+        """
+        super(DynectZoneFileError, self).__init__({})
+        self.message = 'Zone File line {}: {}'.format(line, reason)
+
+    def __repr__(self):
+        return self.message
+
+    def __str__(self):
+        return self.message
+
 ACTION_ERRORS = (DynectAuthError, DynectCreateError, DynectUpdateError,
                  DynectGetError, DynectDeleteError)
 
-ALL = ACTION_ERRORS + (DynectQueryTimeout, DynectInvalidArgumentError)
+ALL = ACTION_ERRORS + (DynectQueryTimeout, DynectInvalidArgumentError,
+                       DynectZoneFileError)
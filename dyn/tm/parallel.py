@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""This module contains helpers for fanning work out across a pool of worker
+processes, all of which share the auth token of an existing
+:class:`~dyn.tm.session.DynectSession` rather than each logging in again::
+
+    >>> from dyn.tm.parallel import map_zones
+    >>> from dyn.tm.session import DynectSession
+    >>> from dyn.tm.zones import get_all_zones
+    >>> def count_records(zone):
+    ...     return zone.name, len(zone.get_all_records())
+    >>> s = DynectSession('customer', 'user', 'password')
+    >>> counts = map_zones(count_records, get_all_zones(), processes=8)
+
+Work submitted to a pool created by other means can make use of the same
+token handoff by passing :func:`~dyn.tm.parallel.install_session` as the
+pool's initializer::
+
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from dyn.tm.parallel import install_session
+    >>> executor = ProcessPoolExecutor(
+    ...     initializer=install_session,
+    ...     initargs=(DynectSession.get_session(),))
+"""
+import multiprocessing
+
+from dyn.tm.errors import DynectAuthError
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+__author__ = 'jnappi'
+__all__ = ['install_session', 'map_zones']
+
+
+def install_session(session):
+    """Register a session, shipped from another process, as the shared session
+    of the current process, so that every thread of this process makes use of
+    its auth token. Intended for use as a process pool's initializer
+
+    :param session: An authenticated :class:`~dyn.tm.session.DynectSession`,
+        which is pickled on its way to the worker process
+    """
+    # When the worker was forked, rather than the session unpickled, it holds
+    # the parent's sockets, locks and threads, none of which may be shared
+    session._init_transport()
+    type(session).set_session(session, shared=True)
+
+
+def _apply(job):
+    """Call a mapped function with a single zone, inside a worker process.
+    Exceptions are returned, rather than raised, so that one failing zone
+    doesn't abort the rest of the map
+    """
+    func, zone = job
+    try:
+        if not isinstance(zone, Zone):
+            zone = Zone(zone)
+        return func(zone)
+    except Exception as e:
+        return e
+
+
+def map_zones(func, zones, processes=None, session=None, chunksize=1):
+    """Call *func* with each of *zones* across a pool of worker processes,
+    each of which reuses the auth token of *session* rather than logging in
+
+    :param func: A picklable, ie module level, function taking a single
+        :class:`~dyn.tm.zones.Zone` and returning a picklable result
+    :param zones: An iterable of :class:`~dyn.tm.zones.Zone` objects or zone
+        names. Names are looked up by the worker they are sent to
+    :param processes: The number of worker processes to start, defaults to
+        the number of CPUs
+    :param session: The :class:`~dyn.tm.session.DynectSession` whose token is
+        handed to the workers, defaults to the current session
+    :param chunksize: The number of zones sent to a worker at a time
+    :return: A *list* of results in the same order as *zones*. If a call
+        raised an exception, the exception instance is returned in its place
+    """
+    session = session or DynectSession.get_session()
+    if session is None:
+        raise DynectAuthError('No active DynectSession to share with workers')
+    jobs = [(func, zone) for zone in zones]
+    if not jobs:
+        return []
+    pool = multiprocessing.Pool(processes, install_session, (session,))
+    try:
+        return pool.map(_apply, jobs, chunksize)
+    finally:
+        pool.close()
+        pool.join()
@@ -4,8 +4,11 @@
 These DNS_Records should really only need to be created via a zone instance but
 could also be created independently if passed valid zone, fqdn data
 """
+import time
+
 from .errors import DynectInvalidArgumentError
 from .session import DynectSession
+from .utils import Batchable
 from ..compat import force_unicode
 
 __author__ = 'jnappi'
@@ -15,10 +18,36 @@ __all__ = ['DNSRecord', 'ARecord', 'AAAARecord', 'ALIASRecord', 'CDSRecord',
            'KEYRecord', 'KXRecord', 'LOCRecord', 'IPSECKEYRecord', 'MXRecord',
            'NAPTRRecord', 'PTRRecord', 'PXRecord', 'NSAPRecord',
            'RPRecord', 'NSRecord', 'SOARecord', 'SPFRecord', 'SRVRecord',
-           'TLSARecord', 'TXTRecord', 'SSHFPRecord', 'UNKNOWNRecord']
+           'TLSARecord', 'TXTRecord', 'SSHFPRecord', 'UNKNOWNRecord',
+           'RecordView']
 
 
-class DNSRecord(object):
+class _RecordSchema(type):
+    """Metaclass computing, once for each record class, the schema of the
+    rdata fields its records hold. Unless a class declares its own
+    ``_rdata_fields``, they are the arguments of its ``_post`` method other
+    than the ttl, and otherwise are inherited. Every record also holds a note
+    """
+    def __init__(cls, name, bases, attrs):
+        super(_RecordSchema, cls).__init__(name, bases, attrs)
+        if '_rdata_fields' not in attrs and '_post' in attrs:
+            code = attrs['_post'].__code__
+            cls._rdata_fields = tuple(x for x in
+                                      code.co_varnames[1:code.co_argcount]
+                                      if x != 'ttl')
+        cls._rdata_fields = getattr(cls, '_rdata_fields', ())
+        fields = ('note',) + cls._rdata_fields
+        cls._rdata_names = frozenset(fields)
+        cls._rdata_attrs = tuple((x, '_' + x) for x in fields)
+        cls._attr_names = {x: '_' + x for x in fields + _COMMON_FIELDS}
+
+
+#: The fields, other than rdata, of every record returned by the API
+_COMMON_FIELDS = ('zone', 'fqdn', 'ttl', 'record_type', 'record_id')
+
+
+# This class is a workaround for supporting metaclasses in both Python2 and 3
+class DNSRecord(_RecordSchema('RecordBase', (Batchable,), {})):
     """Base record object contains functionality to be used across all other
     record type objects
     """
@@ -34,6 +63,7 @@ class DNSRecord(object):
         self.api_args = {'rdata': {}}
         self._implicitPublish = True
         self._note = None
+        self._fetched_at = None
 
     def _create_record(self, api_args):
         """Make the API call to create the current record type
@@ -72,6 +102,8 @@ class DNSRecord(object):
 
         :param api_args: arguments to be pased to the API call
         """
+        if self._collect(api_args):
+            return
         if not self._fqdn.endswith('.'):
             self._fqdn += '.'
         if not self._record_type.endswith('Record'):
@@ -82,28 +114,51 @@ class DNSRecord(object):
         self._build(response['data'])
 
     def _pull(self):
-        if self.record_id is not None:
+        """Fetch this record afresh, unless the data already held is within
+        the current session's ``record_max_age``
+        """
+        if self.record_id is not None and not self._is_fresh():
             self._get_record(record_id=self.record_id)
 
+    def _is_fresh(self):
+        """Whether this record's data may be read without fetching it again
+        """
+        if self._batch is not None:
+            # Fetching would overwrite the changes waiting to be flushed
+            return True
+        if self._fetched_at is None:
+            return False
+        max_age = getattr(DynectSession.get_session(), 'record_max_age', 0)
+        return max_age is None or time.time() - self._fetched_at < max_age
+
     def _build(self, data):
+        attrs = self._attr_names
+        held = self.__dict__
         for key, val in data.items():
             if key == 'rdata':
                 for r_key, r_val in val.items():
-                    setattr(self, '_' + r_key, r_val)
+                    held[attrs.get(r_key) or '_' + r_key] = r_val
+                if not self._rdata_names.issuperset(val):
+                    # Fields this class doesn't know of, ie an UNKNOWNRecord's
+                    held['_extra_rdata'] = tuple(
+                        x for x in val if x not in self._rdata_names)
             else:
-                setattr(self, '_' + key, val)
+                held[attrs.get(key) or '_' + key] = val
+        self._fetched_at = time.time()
+
+    def _flush_batch(self, api_args):
+        """Send the changes collected by
+        :meth:`~dyn.tm.utils.Batchable.batch` as a single update
+        """
+        self._update_record(api_args)
 
     def rdata(self):
         """Return a records rdata"""
-        rdata = {}
-        for key, val in self.__dict__.items():
-            if (key.startswith('_') and
-                    not hasattr(val, '__call__') and
-                    key != '_record_type' and
-                    key != '_record_id' and key != '_implicitPublish'):
-                missing = {'ttl', 'zone', 'fqdn'}
-                if all([i not in key for i in missing]):
-                    rdata[key[1:]] = val
+        held = self.__dict__
+        rdata = {key: held[attr] for key, attr in self._rdata_attrs
+                 if attr in held}
+        for key in held.get('_extra_rdata', ()):
+            rdata[key] = held['_' + key]
         return rdata
 
     @property
@@ -1599,6 +1654,8 @@ class LOCRecord(DNSRecord):
     """:class:`~dyn.tm.records.LOCRecord`'s allow for the definition of
     geographic positioning information associated with a host or service name.
     """
+    _rdata_fields = ('altitude', 'latitude', 'longitude', 'horiz_pre', 'size',
+                     'vert_pre', 'version')
 
     def __init__(self, zone, fqdn, *args, **kwargs):
         """Create a :class:`~dyn.tm.records.LOCRecord` object
@@ -2611,6 +2668,7 @@ class SOARecord(DNSRecord):
     time. NOTE: Dynect users do not have the permissions required to create or
     delete SOA records on the Dynect System.
     """
+    _rdata_fields = ('rname', 'serial_style', 'minimum')
 
     def __init__(self, zone, fqdn, *args, **kwargs):
         """Create an :class:`~dyn.tm.records.SOARecord` object
@@ -3242,3 +3300,104 @@ class UNKNOWNRecord(DNSRecord):
     def __repr__(self):
         """print override"""
         return '<UNKNOWNRecordRecord>'
+
+
+#: Record classes by the record type the API reports, ie 'A'
+_RECORD_TYPES = {cls.__name__[:-len('Record')]: cls
+                 for cls in DNSRecord.__subclasses__()}
+#: Values repeated across many records, such as record types, ttls and rdata
+#: field names, shared between every view holding them
+_shared = {}
+
+
+class RecordView(object):
+    """A compact, read-only, view of a record as returned by the API, for
+    loading very large zones. A view holds only the record's fqdn, ttl,
+    record_id, record_type and rdata, with the rdata's field names shared by
+    every view of the same record type, and its rdata fields may be read as
+    attributes, ie ``view.address``. Use
+    :meth:`~dyn.tm.records.RecordView.promote` to get a full, mutable,
+    :class:`~dyn.tm.records.DNSRecord` for any record which needs changing.
+    """
+    __slots__ = ('_zone', '_fqdn', '_record_type', '_record_id', '_ttl',
+                 '_fields', '_values')
+
+    def __init__(self, zone, fqdn, record_type, record_id, ttl, rdata):
+        """Create a new :class:`~dyn.tm.records.RecordView`
+
+        :param zone: The name of the zone the record belongs to
+        :param fqdn: The fqdn of the record's node
+        :param record_type: The type of the record, ie 'A'
+        :param record_id: The unique ID of the record
+        :param ttl: The TTL of the record
+        :param rdata: A *dict* of the record's data
+        """
+        fields = tuple(rdata)
+        self._zone = zone
+        self._fqdn = fqdn
+        self._record_type = _shared.setdefault(record_type, record_type)
+        self._record_id = record_id
+        self._ttl = _shared.setdefault(ttl, ttl)
+        self._fields = _shared.setdefault(fields, fields)
+        self._values = tuple(rdata.values())
+
+    @property
+    def zone(self):
+        """The name of the zone this record belongs to"""
+        return self._zone
+
+    @property
+    def fqdn(self):
+        """The fqdn of this record's node"""
+        return self._fqdn
+
+    @property
+    def record_type(self):
+        """The type of this record, ie 'A'"""
+        return self._record_type
+
+    @property
+    def record_id(self):
+        """The unique ID of this record from the DynECT System"""
+        return self._record_id
+
+    @property
+    def ttl(self):
+        """The TTL for this record"""
+        return self._ttl
+
+    @property
+    def rdata(self):
+        """A new *dict* of this record's data"""
+        return dict(zip(self._fields, self._values))
+
+    def __getattr__(self, name):
+        """Expose the fields of this record's rdata as attributes"""
+        if name.startswith('_'):
+            # Unset slots, ie while unpickling, must not recurse
+            raise AttributeError(name)
+        try:
+            return self._values[self._fields.index(name)]
+        except ValueError:
+            raise AttributeError(name)
+
+    def promote(self):
+        """Build the full :class:`~dyn.tm.records.DNSRecord` this view
+        represents, as :meth:`~dyn.tm.zones.Zone.get_all_records` would have,
+        without making any API calls
+
+        :return: A :class:`~dyn.tm.records.DNSRecord` of this record's type
+        """
+        constructor = _RECORD_TYPES.get(self._record_type, UNKNOWNRecord)
+        rdata = self.rdata
+        kwargs = dict(rdata, record_type=self._record_type,
+                      record_id=self._record_id, ttl=self._ttl, rdata=rdata,
+                      create=False)
+        return constructor(self._zone, self._fqdn, **kwargs)
+
+    def __str__(self):
+        """str override"""
+        return force_unicode('<RecordView>: {} {}').format(
+            self._record_type, self._fqdn)
+
+    __repr__ = __unicode__ = __str__
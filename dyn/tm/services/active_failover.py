@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from dyn.compat import force_unicode
-from dyn.tm.utils import Active
+from dyn.tm.utils import Active, Batchable
 from dyn.tm.errors import DynectInvalidArgumentError
 from dyn.tm.session import DynectSession
 from dyn.tm.task import Task
@@ -9,7 +9,7 @@ __author__ = 'jnappi'
 __all__ = ['HealthMonitor', 'ActiveFailover']
 
 
-class HealthMonitor(object):
+class HealthMonitor(Batchable):
     """A health monitor for an :class:`ActiveFailover` service"""
 
     def __init__(self, protocol, interval, retries=None, timeout=None,
@@ -56,7 +56,7 @@ class HealthMonitor(object):
                      'interval': self.interval}
         for key, val in self.__dict__.items():
             if val is not None and not hasattr(val, '__call__') and \
-                    key.startswith('_'):
+                    key.startswith('_') and key != '_batch':
                 json_blob[key[1:]] = val
         return json_blob
 
@@ -74,6 +74,15 @@ class HealthMonitor(object):
         else:
             return False
 
+    def _update(self, api_args):
+        """Update this :class:`HealthMonitor`, via its service, with the
+        args in api_args
+        """
+        if self._collect(api_args):
+            return
+        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
+        DynectSession.get_session().execute(uri, 'PUT', api_args)
+
     @property
     def status(self):
         """Get the current status of this :class:`HealthMonitor` from the
@@ -95,8 +104,7 @@ class HealthMonitor(object):
             raise Exception
         self._protocol = value
         api_args = {'monitor': {'protocol': self._protocol}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def interval(self):
@@ -109,8 +117,7 @@ class HealthMonitor(object):
             raise Exception
         self._interval = value
         api_args = {'monitor': {'interval': self._interval}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def retries(self):
@@ -123,8 +130,7 @@ class HealthMonitor(object):
     def retries(self, value):
         self._retries = value
         api_args = {'monitor': {'retries': self._retries}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def timeout(self):
@@ -137,8 +143,7 @@ class HealthMonitor(object):
     def timeout(self, value):
         self._timeout = value
         api_args = {'monitor': {'timeout': self._timeout}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def port(self):
@@ -149,8 +154,7 @@ class HealthMonitor(object):
     def port(self, value):
         self._port = value
         api_args = {'monitor': {'port': self._port}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def path(self):
@@ -161,8 +165,7 @@ class HealthMonitor(object):
     def path(self, value):
         self._path = value
         api_args = {'monitor': {'path': self._path}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def host(self):
@@ -173,8 +176,7 @@ class HealthMonitor(object):
     def host(self, value):
         self._host = value
         api_args = {'monitor': {'host': self._host}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def header(self):
@@ -187,8 +189,7 @@ class HealthMonitor(object):
     def header(self, value):
         self._header = value
         api_args = {'monitor': {'header': self._header}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def expected(self):
@@ -202,8 +203,7 @@ class HealthMonitor(object):
     def expected(self, value):
         self._expected = value
         api_args = {'monitor': {'expected': self._expected}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     def __str__(self):
         """str override"""
@@ -216,7 +216,7 @@ class HealthMonitor(object):
         return bytes(self.__str__())
 
 
-class ActiveFailover(object):
+class ActiveFailover(Batchable):
     """With Active Failover, we monitor your Primary IP.  If a failover event
     is detected, our system auto switches (hot swaps) to your dedicated back-up
     IP
@@ -371,6 +371,8 @@ class ActiveFailover(object):
         """Update this :class:`ActiveFailover`, via the API, with the args in
         api_args
         """
+        if self._collect(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -7,7 +7,7 @@ from dyn.tm.session import DynectSession
 from dyn.tm.utils import APIList, Active, unix_date
 
 __author__ = 'jnappi'
-__all__ = ['get_all_dnssec', 'DNSSECKey', 'DNSSEC']
+__all__ = ['get_all_dnssec', 'iter_all_dnssec', 'DNSSECKey', 'DNSSEC']
 
 
 def get_all_dnssec():
@@ -23,6 +23,18 @@ def get_all_dnssec():
     return dnssecs
 
 
+def iter_all_dnssec():
+    """:return: A generator of :class:`DNSSEC` Services, each built only as it
+        is decoded from the API's response
+    """
+    uri = '/DNSSEC/'
+    api_args = {'detail': 'Y'}
+    session = DynectSession.get_session()
+    for _, dnssec in session.execute_iter(uri, 'GET', api_args):
+        zone = dnssec.pop('zone')
+        yield DNSSEC(zone, api=False, **dnssec)
+
+
 class DNSSECKey(object):
     """A Key used by the DNSSEC service"""
     def __init__(self, key_type, algorithm, bits, start_ts=None, lifetime=None,
@@ -2,7 +2,10 @@
 """This module contains wrappers for interfacing with every element of a
 Traffic Director (DSF) service.
 """
-from collections import Iterable
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 from dyn.compat import force_unicode, string_types
 from dyn.tm.utils import APIList, Active
 from dyn.tm.errors import DynectInvalidArgumentError
@@ -21,7 +24,11 @@ __author__ = 'jnappi'
 __all__ = ['get_all_dsf_services', 'get_all_record_sets',
            'get_all_failover_chains', 'get_all_response_pools',
            'get_all_rulesets', 'get_all_dsf_monitors', 'get_all_records',
-           'get_all_notifiers', 'DSFARecord', 'DSFSSHFPRecord', 'get_record',
+           'get_all_notifiers', 'iter_all_dsf_services',
+           'iter_all_record_sets', 'iter_all_failover_chains',
+           'iter_all_response_pools', 'iter_all_rulesets',
+           'iter_all_dsf_monitors', 'iter_all_records', 'iter_all_notifiers',
+           'DSFARecord', 'DSFSSHFPRecord', 'get_record',
            'get_record_set', 'get_failover_chain', 'get_response_pool',
            'get_ruleset', 'get_dsf_monitor', 'DSFNotifier', 'DSFAAAARecord',
            'DSFALIASRecord', 'DSFCERTRecord', 'DSFCNAMERecord',
@@ -149,6 +156,92 @@ def get_all_dsf_monitors():
     return mons
 
 
+def _iter_all(uri, build):
+    """Decode the listing at *uri* incrementally, yielding the object built
+    from each item by *build*
+    """
+    api_args = {'detail': 'Y'}
+    session = DynectSession.get_session()
+    for _, data in session.execute_iter(uri, 'GET', api_args):
+        yield build(data)
+
+
+def iter_all_dsf_services():
+    """:return: A generator of :class:`TrafficDirector` Services, each built
+        only as it is decoded from the API's response
+    """
+    return _iter_all('/DSF/',
+                     lambda dsf: TrafficDirector(None, api=False, **dsf))
+
+
+def iter_all_notifiers():
+    """:return: A generator of :class:`DSFNotifier` Services, each built only
+        as it is decoded from the API's response
+    """
+    return _iter_all('/Notifier/',
+                     lambda notify: DSFNotifier(None, api=False, **notify))
+
+
+def iter_all_records(service):
+    """Iterate over the records of a service, fetching each record only as it
+    is reached, so that a caller which stops early skips the remaining calls
+
+    :param service: a dsf_id string, or :class:`TrafficDirector`
+    :return: A generator of :class:`DSFRecord`s from the passed in `service`
+    """
+    _service_id = _check_type(service)
+    uri = '/DSFRecord/{}/'.format(_service_id)
+    for record in _iter_all(uri, lambda record: record['dsf_record_id']):
+        for dsf_record in get_record(record, _service_id, always_list=True):
+            yield dsf_record
+
+
+def iter_all_record_sets(service):
+    """:param service: a dsf_id string, or :class:`TrafficDirector`
+    :return: A generator of :class:`DSFRecordSets` from the passed in
+        `service`
+    """
+    uri = '/DSFRecordSet/{}/'.format(_check_type(service))
+    return _iter_all(uri, lambda pool: DSFRecordSet(pool.pop('rdata_class'),
+                                                    api=False, **pool))
+
+
+def iter_all_failover_chains(service):
+    """:param service: a dsf_id string, or :class:`TrafficDirector`
+    :return: A generator of :class:`DSFFailoverChains` from the passed in
+        `service`
+    """
+    uri = '/DSFRecordSetFailoverChain/{}/'.format(_check_type(service))
+    return _iter_all(uri, lambda pool: DSFFailoverChain(pool.pop('label'),
+                                                        api=False, **pool))
+
+
+def iter_all_response_pools(service):
+    """:param service: a dsf_id string, or :class:`TrafficDirector`
+    :return: A generator of :class:`DSFResponsePools` from the passed in
+        `service`
+    """
+    uri = '/DSFResponsePool/{}/'.format(_check_type(service))
+    return _iter_all(uri, lambda pool: DSFResponsePool(pool.pop('label'),
+                                                       api=False, **pool))
+
+
+def iter_all_rulesets(service):
+    """:param service: a dsf_id string, or :class:`TrafficDirector`
+    :return: A generator of :class:`DSFRulesets` from the passed in `service`
+    """
+    uri = '/DSFRuleset/{}/'.format(_check_type(service))
+    return _iter_all(uri, lambda rule: DSFRuleset(rule.pop('label'),
+                                                  api=False, **rule))
+
+
+def iter_all_dsf_monitors():
+    """:return: A generator of :class:`DSFMonitor` Services, each built only
+        as it is decoded from the API's response
+    """
+    return _iter_all('/DSFMonitor/', lambda dsf: DSFMonitor(api=False, **dsf))
+
+
 def get_record(record_id, service, always_list=False):
     """
     returns :class:`DSFRecord`
@@ -609,10 +702,7 @@ class _DSFRecord(object):
             outer_key = list(rdata.keys())[0]
             inner_data = rdata[outer_key]
             real_data = {x: inner_data[x] for x in inner_data
-                         if x not in json_blob and x not in self.__dict__ and
-                         x[1:] not in self.__dict__ and
-                         inner_data[x] is not None and x != 'record_set_id' and
-                         x != 'service_id' and x != 'implicitPublish'}
+                         if x not in json_blob and inner_data[x] is not None}
             json_blob['rdata'] = {outer_key: real_data}
         if svc_id and not skip_svc:
             json_blob['service_id'] = svc_id
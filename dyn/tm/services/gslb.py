@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from dyn.compat import force_unicode
-from dyn.tm.utils import APIList
+from dyn.tm.utils import APIList, Batchable
 from dyn.tm.errors import DynectInvalidArgumentError
 from dyn.tm.session import DynectSession
 from dyn.tm.task import Task
@@ -9,7 +9,7 @@ __author__ = 'jnappi'
 __all__ = ['Monitor', 'GSLBRegionPoolEntry', 'GSLBRegion', 'GSLB']
 
 
-class Monitor(object):
+class Monitor(Batchable):
     """A :class:`Monitor` for a GSLB Service"""
 
     def __init__(self, protocol, interval, retries=None, timeout=None,
@@ -56,7 +56,7 @@ class Monitor(object):
                      'interval': self._interval}
         for key, val in self.__dict__.items():
             if val is not None and not hasattr(val, '__call__') and \
-                    key.startswith('_'):
+                    key.startswith('_') and key != '_batch':
                 json_blob[key[1:]] = val
         return json_blob
 
@@ -74,6 +74,15 @@ class Monitor(object):
         else:
             return False
 
+    def _update(self, api_args):
+        """Update this :class:`Monitor`, via its :class:`GSLB` service, with
+        the args in api_args
+        """
+        if self._collect(api_args):
+            return
+        uri = '/GSLB/{}/{}/'.format(self.zone, self.fqdn)
+        DynectSession.get_session().execute(uri, 'PUT', api_args)
+
     @property
     def status(self):
         """Get the current status of this :class:`HealthMonitor` from the
@@ -95,8 +104,7 @@ class Monitor(object):
             raise Exception
         self._protocol = value
         api_args = {'monitor': {'protocol': self._protocol}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def interval(self):
@@ -109,8 +117,7 @@ class Monitor(object):
             raise Exception
         self._interval = value
         api_args = {'monitor': {'interval': self._interval}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def retries(self):
@@ -123,8 +130,7 @@ class Monitor(object):
     def retries(self, value):
         self._retries = value
         api_args = {'monitor': {'retries': self._retries}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def timeout(self):
@@ -137,8 +143,7 @@ class Monitor(object):
     def timeout(self, value):
         self._timeout = value
         api_args = {'monitor': {'timeout': self._timeout}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def port(self):
@@ -149,8 +154,7 @@ class Monitor(object):
     def port(self, value):
         self._port = value
         api_args = {'monitor': {'port': self._port}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def path(self):
@@ -161,8 +165,7 @@ class Monitor(object):
     def path(self, value):
         self._path = value
         api_args = {'monitor': {'path': self._path}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def host(self):
@@ -173,8 +176,7 @@ class Monitor(object):
     def host(self, value):
         self._host = value
         api_args = {'monitor': {'host': self._host}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def header(self):
@@ -187,8 +189,7 @@ class Monitor(object):
     def header(self, value):
         self._header = value
         api_args = {'monitor': {'header': self._header}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     @property
     def expected(self):
@@ -202,8 +203,7 @@ class Monitor(object):
     def expected(self, value):
         self._expected = value
         api_args = {'monitor': {'expected': self._expected}}
-        uri = '/Failover/{}/{}/'.format(self.zone, self.fqdn)
-        DynectSession.get_session().execute(uri, 'PUT', api_args)
+        self._update(api_args)
 
     def __str__(self):
         """str override"""
@@ -216,7 +216,7 @@ class Monitor(object):
         return bytes(self.__str__())
 
 
-class GSLBRegionPoolEntry(object):
+class GSLBRegionPoolEntry(Batchable):
     """:class:`GSLBRegionPoolEntry`"""
 
     def __init__(self, zone, fqdn, region_code, address, *args, **kwargs):
@@ -287,6 +287,8 @@ class GSLBRegionPoolEntry(object):
 
     def _update(self, api_args):
         """Private update method"""
+        if self._collect(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -428,7 +430,7 @@ class GSLBRegionPoolEntry(object):
         return bytes(self.__str__())
 
 
-class GSLBRegion(object):
+class GSLBRegion(Batchable):
     """docstring for GSLBRegion"""
 
     def __init__(self, zone, fqdn, region_code, *args, **kwargs):
@@ -514,6 +516,8 @@ class GSLBRegion(object):
 
     def _update(self, api_args):
         """Private udpate method for PUT commands"""
+        if self._collect(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -655,7 +659,7 @@ class GSLBRegion(object):
         return bytes(self.__str__())
 
 
-class GSLB(object):
+class GSLB(Batchable):
     """A Global Server Load Balancing (GSLB) service"""
 
     def __init__(self, zone, fqdn, *args, **kwargs):
@@ -822,6 +826,16 @@ class GSLB(object):
                 setattr(self, '_' + key, val)
         self._region.uri = self.uri
 
+    def _update(self, api_args):
+        """Update this :class:`GSLB` service with the args in api_args,
+        leaving its regions as they are
+        """
+        if self._collect(api_args):
+            return
+        response = DynectSession.get_session().execute(self.uri, 'PUT',
+                                                       api_args)
+        self._build(response['data'], region=False)
+
     @property
     def task(self):
         """:class:`Task` for most recent system action on this :class:`GSLB`.
@@ -878,9 +892,7 @@ class GSLB(object):
                                              self.valid_auto_recover)
         self._auto_recover = value
         api_args = {'auto_recover': self._auto_recover}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def status(self):
@@ -933,9 +945,7 @@ class GSLB(object):
             raise DynectInvalidArgumentError('ttl', value, self.valid_ttls)
         self._ttl = value
         api_args = {'ttl': self._ttl}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def notify_events(self):
@@ -951,9 +961,7 @@ class GSLB(object):
                                              self.valid_notify_events)
         self._notify_events = value
         api_args = {'notify_events': self._notify_events}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_server(self):
@@ -967,9 +975,7 @@ class GSLB(object):
     def syslog_server(self, value):
         self._syslog_server = value
         api_args = {'syslog_server': self._syslog_server}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_port(self):
@@ -981,9 +987,7 @@ class GSLB(object):
     def syslog_port(self, value):
         self._syslog_port = value
         api_args = {'syslog_port': self._syslog_port}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_ident(self):
@@ -995,9 +999,7 @@ class GSLB(object):
     def syslog_ident(self, value):
         self._syslog_ident = value
         api_args = {'syslog_ident': self._syslog_ident}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_facility(self):
@@ -1017,9 +1019,7 @@ class GSLB(object):
                                              self.valid_syslog_facility)
         self._syslog_facility = value
         api_args = {'syslog_facility': self._syslog_facility}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_delivery(self):
@@ -1029,9 +1029,7 @@ class GSLB(object):
     @syslog_delivery.setter
     def syslog_delivery(self, value):
         api_args = {'syslog_delivery': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_probe_format(self):
@@ -1041,9 +1039,7 @@ class GSLB(object):
     @syslog_probe_format.setter
     def syslog_probe_format(self, value):
         api_args = {'syslog_probe_fmt': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def syslog_status_format(self):
@@ -1053,9 +1049,7 @@ class GSLB(object):
     @syslog_status_format.setter
     def syslog_status_format(self, value):
         api_args = {'syslog_status_fmt': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def recovery_delay(self):
@@ -1065,9 +1059,7 @@ class GSLB(object):
     @recovery_delay.setter
     def recovery_delay(self, value):
         api_args = {'recovery_delay': value}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     @property
     def region(self):
@@ -1093,9 +1085,7 @@ class GSLB(object):
         # We're only going accept new monitors of type Monitor
         if isinstance(value, Monitor):
             api_args = {'monitor': value.to_json()}
-            response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                           api_args)
-            self._build(response['data'], region=False)
+            self._update(api_args)
             self._monitor = value
 
     @property
@@ -1109,9 +1099,7 @@ class GSLB(object):
     def contact_nickname(self, value):
         self._contact_nickname = value
         api_args = {'contact_nickname': self._contact_nickname}
-        response = DynectSession.get_session().execute(self.uri, 'PUT',
-                                                       api_args)
-        self._build(response['data'], region=False)
+        self._update(api_args)
 
     def delete(self):
         """Delete this :class:`GSLB` service from the DynECT System"""
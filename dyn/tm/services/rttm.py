@@ -3,7 +3,7 @@ import warnings
 from datetime import datetime
 
 from dyn.compat import force_unicode
-from dyn.tm.utils import APIList, Active, unix_date
+from dyn.tm.utils import APIList, Active, Batchable, unix_date
 from dyn.tm.errors import DynectInvalidArgumentError
 from dyn.tm.session import DynectSession
 from dyn.tm.task import Task
@@ -13,7 +13,7 @@ __all__ = ['Monitor', 'PerformanceMonitor', 'RegionPoolEntry', 'RTTMRegion',
            'RTTM']
 
 
-class Monitor(object):
+class Monitor(Batchable):
     """A :class:`Monitor` for RTTM Service. May be used as a HealthMonitor"""
 
     def __init__(self, protocol, interval, retries=None, timeout=None,
@@ -59,7 +59,7 @@ class Monitor(object):
                      'interval': self._interval}
         for key, val in self.__dict__.items():
             if val is not None and not hasattr(val, '__call__') and \
-                    key.startswith('_'):
+                    key.startswith('_') and key != '_batch':
                 json_blob[key[1:]] = val
         return json_blob
 
@@ -85,6 +85,8 @@ class Monitor(object):
 
     def _update(self, api_args):
         """Update the Dyn System with data from this :class:`Monitor`"""
+        if self._collect(api_args):
+            return
         uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
         response = DynectSession.get_session().execute(uri, 'PUT', api_args)
         self._build(response['data']['monitor'])
@@ -249,6 +251,8 @@ class PerformanceMonitor(Monitor):
         """Update the Dyn System with data from this
         :class:`PerformanceMonitor`
         """
+        if self._collect(api_args):
+            return
         uri = '/RTTM/{}/{}/'.format(self.zone, self.fqdn)
         response = DynectSession.get_session().execute(uri, 'PUT', api_args)
         self._build(response['data']['performance_monitor'])
@@ -264,7 +268,7 @@ class PerformanceMonitor(Monitor):
         return bytes(self.__str__())
 
 
-class RegionPoolEntry(object):
+class RegionPoolEntry(Batchable):
     """Creates a new RTTM service region pool entry in the zone/node
     indicated
     """
@@ -300,6 +304,8 @@ class RegionPoolEntry(object):
 
     def _update(self, args):
         """Private method for processing various updates"""
+        if self._collect(args):
+            return
         uri = '/RTTMRegionPoolEntry/{}/{}/{}/{}/'.format(self._zone,
                                                          self._fqdn,
                                                          self._region_code,
@@ -449,7 +455,7 @@ class RegionPoolEntry(object):
         return bytes(self.__str__())
 
 
-class RTTMRegion(object):
+class RTTMRegion(Batchable):
     """docstring for RTTMRegion"""
 
     def __init__(self, zone, fqdn, region_code, *args, **kwargs):
@@ -569,6 +575,8 @@ class RTTMRegion(object):
 
     def _update(self, api_args):
         """Private Update method to cut back on redundant code"""
+        if self._collect(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -745,7 +753,7 @@ class RTTMRegion(object):
         return bytes(self.__str__())
 
 
-class RTTM(object):
+class RTTM(Batchable):
     def __init__(self, zone, fqdn, *args, **kwargs):
         """Create a :class:`RTTM` object
 
@@ -913,6 +921,8 @@ class RTTM(object):
 
     def _update(self, api_args):
         """Perform a PUT api call using this objects data"""
+        if self._collect(api_args):
+            return
         response = DynectSession.get_session().execute(self.uri, 'PUT',
                                                        api_args)
         self._build(response['data'])
@@ -6,7 +6,7 @@ own respective functionality.
 """
 import warnings
 # API Libs
-from dyn.compat import force_unicode
+from dyn.compat import HTTPException, force_unicode
 from dyn.core import SessionEngine
 from dyn.encrypt import AESCipher
 from dyn.tm.errors import (DynectAuthError, DynectCreateError,
@@ -23,7 +23,9 @@ class DynectSession(SessionEngine):
     def __init__(self, customer, username, password, host='api.dynect.net',
                  port=443, ssl=True, api_version='current', auto_auth=True,
                  key=None, history=False, proxy_host=None, proxy_port=None,
-                 proxy_user=None, proxy_pass=None):
+                 proxy_user=None, proxy_pass=None, pool_size=1,
+                 retry_policy=None, cache=None, history_size=None,
+                 rate_limiter=None, record_max_age=0):
         """Initialize a Dynect Rest Session object and store the provided
         credentials
 
@@ -43,11 +45,33 @@ class DynectSession(SessionEngine):
         :param proxy_port: The port that the proxy is served on
         :param proxy_user: A username to connect to the proxy with if required
         :param proxy_pass: A password to connect to the proxy with if required
+        :param pool_size: The maximum number of concurrent connections this
+            session may open to the API, allowing multiple threads to share
+            this session's auth token without serializing on a single socket
+        :param retry_policy: A :class:`~dyn.retry.RetryPolicy` governing which
+            failed calls are retried, and how long to back off between them
+        :param cache: An optional :class:`~dyn.cache.ResponseCache` used to
+            serve repeated GET calls without a round trip to the API
+        :param history_size: The maximum number of calls kept in this
+            session's history, the oldest calls are discarded first. Every
+            call is kept by default
+        :param rate_limiter: An optional :class:`~dyn.ratelimit.RateLimiter`
+            pacing the calls made by every thread sharing this session
+        :param record_max_age: How long, in seconds, the data of a
+            :class:`~dyn.tm.records.DNSRecord` fetched from the API is
+            trusted before reading one of its properties fetches it again. 0
+            always fetches a record afresh, *None* never fetches it again
         """
         super(DynectSession, self).__init__(host, port, ssl, history,
                                             proxy_host, proxy_port,
-                                            proxy_user, proxy_pass)
+                                            proxy_user, proxy_pass,
+                                            pool_size=pool_size,
+                                            retry_policy=retry_policy,
+                                            cache=cache,
+                                            history_size=history_size,
+                                            rate_limiter=rate_limiter)
         self.__cipher = AESCipher(key)
+        self.record_max_age = record_max_age
         self.extra_headers = {'API-Version': api_version}
         self.customer = customer
         self.username = username
@@ -72,29 +96,56 @@ class DynectSession(SessionEngine):
         """Accessible method for subclass to encrypt with existing AESCipher"""
         return self.__cipher.encrypt(data)
 
-    def _handle_error(self, uri, method, raw_args):
-        """Handle the processing of a connection error with the api"""
-        # Need to force a re-connect on next execute
-        self._conn.close()
-        self._conn.connect()
+    def _idempotent(self, uri, method):
+        """Logging in may safely be repeated, as may any GET, PUT or DELETE"""
+        return uri.rstrip('/') == '/REST/Session' or \
+            SessionEngine._idempotent(self, uri, method)
 
+    def _handle_error(self, uri, method, raw_args):
+        """Handle the processing of a connection error with the api by checking
+        that our session is still valid, renewing it if not, before the failed
+        call is retried. The current token is kept until a new one has been
+        issued, so that other threads never make calls without one
+        """
+        if getattr(self._local, 'checking_session', False):
+            # The session check itself failed to connect, retry it as usual
+            return True
+        token = self._token
+        with self._session_lock:
+            if self._token != token:
+                # Another thread already renewed our session
+                return True
+            # Idle keep-alive connections were likely dropped along with ours
+            self._pool.clear()
+            self._local.checking_session = True
+            try:
+                expired = self._session_expired()
+            finally:
+                self._local.checking_session = False
+            if expired:
+                # Swapped in by _meta_update once the login succeeds
+                self._renew_token()
+        return True
+
+    def _session_expired(self):
+        """Return whether the API reports our session as no longer valid. A
+        check which fails for any other reason, once retried as allowed by
+        this session's :class:`~dyn.retry.RetryPolicy`, is not taken as the
+        session having expired
+        """
         try:
             session_check = self.execute('/REST/Session/', 'GET')
-            renew_token = 'login:' in session_check['msgs'][0]['INFO']
-        except DynectGetError:
-            renew_token = True
-
-        if renew_token:
-            # Our token is no longer valid because our session was killed
-            self._token = None
-            # Need to get a new Session token
-            self.execute('/REST/Session/', 'POST', self.__auth_data)
+        except DynectGetError as err:
+            return 'login:' in err.message
+        except (IOError, HTTPException):
+            return False
+        return 'login:' in session_check['msgs'][0]['INFO']
 
-        # Then try the current call again and Specify final as true so
-        # if we fail again we can raise the actual error
-        return self.execute(uri, method, raw_args, final=True)
+    def _renew_token(self):
+        """Get a new Session token after our previous session was killed"""
+        self.execute('/REST/Session/', 'POST', self.__auth_data)
 
-    def _process_response(self, response, method, final=False):
+    def _process_response(self, response, method, final=False, wait=True):
         """Process an API response for failure, incomplete, or success and
         throw any appropriate errors
 
@@ -102,6 +153,9 @@ class DynectSession(SessionEngine):
         :param method: the HTTP method
         :param final: boolean flag representing whether or not to continue
             polling
+        :param wait: boolean flag representing whether to block until an
+            incomplete job finishes, or to return a
+            :class:`~dyn.jobs.JobHandle` for it
         """
         status = response['status']
         self.logger.debug(status)
@@ -121,7 +175,9 @@ class DynectSession(SessionEngine):
                 raise DynectDeleteError(response['msgs'])
         else:  # Status was incomplete
             job_id = response['job_id']
-            if not final:
+            if not final and not wait:
+                return self._submit_job('/Job/{}/'.format(job_id), method)
+            elif not final:
                 response = self.wait_for_job_to_complete(job_id)
                 return self._process_response(response, method, True)
             else:
@@ -205,7 +261,9 @@ class DynectMultiSession(DynectSession):
     def __init__(self, customer, username, password, host='api.dynect.net',
                  port=443, ssl=True, api_version='current', auto_auth=True,
                  key=None, history=False, proxy_host=None, proxy_port=None,
-                 proxy_user=None, proxy_pass=None):
+                 proxy_user=None, proxy_pass=None, pool_size=1,
+                 retry_policy=None, cache=None, history_size=None,
+                 rate_limiter=None, record_max_age=0):
 
         self._open_sessions = []
 
@@ -218,31 +276,18 @@ class DynectMultiSession(DynectSession):
                                                  proxy_host=proxy_host,
                                                  proxy_port=proxy_port,
                                                  proxy_user=proxy_user,
-                                                 proxy_pass=proxy_pass)
+                                                 proxy_pass=proxy_pass,
+                                                 pool_size=pool_size,
+                                                 retry_policy=retry_policy,
+                                                 cache=cache,
+                                                 history_size=history_size,
+                                                 rate_limiter=rate_limiter,
+                                                 record_max_age=record_max_age)
         self.__add_open_session()
 
-    def _handle_error(self, uri, method, raw_args):
-        """Handle the processing of a connection error with the api"""
-
-        # Need to force a re-connect on next execute
-        self._conn.close()
-        self._conn.connect()
-
-        try:
-            session_check = self.execute('/REST/Session/', 'GET')
-            renew_token = 'login:' in session_check['msgs'][0]['INFO']
-        except DynectGetError:
-            renew_token = True
-
-        if renew_token:
-            # Our token is no longer valid because our session was killed
-            self._token = None
-            # Need to get a new Session token
-            self.authenticate()
-
-        # Then try the current call again and Specify final as true so
-        # if we fail again we can raise the actual error
-        return self.execute(uri, method, raw_args, final=True)
+    def _renew_token(self):
+        """Get a new Session token after our previous session was killed"""
+        self.authenticate()
 
     def __add_open_session(self):
         """Add new open session to hash of open sessions"""
@@ -15,6 +15,15 @@ def get_tasks():
             for task in response['data']]
 
 
+def iter_tasks():
+    """Iterate over the current tasks, building each :class:`Task` only as it
+    is decoded from the API's response
+    """
+    session = DynectSession.get_session()
+    for _, task in session.execute_iter('/Task', 'GET', {}):
+        yield Task(task.pop('task_id'), api=False, **task)
+
+
 class Task(object):
     """A class representing a DynECT Task"""
     def __init__(self, task_id, *args, **kwargs):
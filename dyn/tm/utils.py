@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """This module contains utilities to be used throughout the dyn.tm module"""
 import calendar
+from contextlib import contextmanager
 
 from dyn.compat import string_types, force_unicode
 
 __author__ = 'jnappi'
-__all__ = ['unix_date', 'APIList', 'Active']
+__all__ = ['unix_date', 'APIList', 'Active', 'Batchable']
 
 
 def unix_date(date):
@@ -139,3 +140,65 @@ class Active(object):
     def __bytes__(self):
         """bytes override"""
         return bytes(self.__str__())
+
+
+class Batchable(object):
+    """Mixin for objects whose property setters each make an update call to
+    the API. Changes made within a :meth:`~dyn.tm.utils.Batchable.batch`
+    block are collected rather than sent, and are sent as a single update
+    once it exits. Subclasses must route their setters through ``_update``,
+    which should return early when ``_collect`` accepts its arguments
+    """
+    #: The arguments collected by the current batch, or *None* outside of one
+    _batch = None
+
+    @contextmanager
+    def batch(self):
+        """Collect the changes made to this object's attributes within a
+        ``with`` block, and send them as a single update on leaving it. If the
+        block raises, the changes are discarded rather than sent, although the
+        attributes keep the values they were given::
+
+            >>> with monitor.batch():
+            ...     monitor.interval = 5
+            ...     monitor.retries = 2
+        """
+        if self._batch is not None:
+            # Nested batches are sent by the outermost
+            yield self
+            return
+        self._batch = {}
+        try:
+            yield self
+            changes = self._batch
+            del self._batch
+            if changes:
+                self._flush_batch(changes)
+        finally:
+            self.__dict__.pop('_batch', None)
+
+    def _collect(self, api_args):
+        """Add *api_args* to the current batch, if there is one, returning
+        whether they were collected rather than needing to be sent now
+        """
+        if self._batch is None:
+            return False
+        _merge_args(self._batch, api_args)
+        return True
+
+    def _flush_batch(self, api_args):
+        """Send the arguments collected by a batch"""
+        self._update(api_args)
+
+
+def _merge_args(pending, api_args):
+    """Merge *api_args* into the *pending* arguments of a batch, combining
+    nested dicts, such as ``rdata``, so that later changes add to earlier ones
+    """
+    for key, val in api_args.items():
+        if isinstance(val, dict) and isinstance(pending.get(key), dict):
+            _merge_args(pending[key], val)
+        elif isinstance(val, dict):
+            pending[key] = dict(val)
+        else:
+            pending[key] = val
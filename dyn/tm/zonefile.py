@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""This module contains an incremental reader and writer of RFC1035, or
+BIND, style Master files. Files are read a line at a time and each record is
+handed on as soon as it has been parsed, so a file of any size may be fed to
+:meth:`~dyn.tm.zones.Zone.add_records` without being held in memory::
+
+    >>> from dyn.tm.zones import Zone
+    >>> from dyn.tm.zonefile import parse_zonefile
+    >>> my_zone = Zone('example.com')
+    >>> with open('example.com.zone') as f:
+    ...     records = (x for x in parse_zonefile(f, 'example.com')
+    ...                if x['record_type'] != 'SOA')
+    ...     failures = my_zone.add_records(records, concurrency=16)
+
+Likewise, records are written out a line at a time, straight from the API's
+response, by :meth:`~dyn.tm.zones.Zone.export_zonefile`::
+
+    >>> with open('example.com.zone', 'w') as f:
+    ...     my_zone.export_zonefile(f)
+"""
+import re
+
+from dyn.compat import force_unicode
+from dyn.tm.errors import DynectZoneFileError
+
+__author__ = 'jnappi'
+__all__ = ['parse_zonefile', 'write_zonefile']
+
+#: The rdata fields of each supported record type, in the order they appear
+#: in a Master file. Any tokens left over are joined onto the last field
+FIELDS = {'A': ('address',), 'AAAA': ('address',), 'ALIAS': ('alias',),
+          'CDNSKEY': ('flags', 'protocol', 'algorithm', 'public_key'),
+          'CDS': ('keytag', 'algorithm', 'digtype', 'digest'),
+          'CERT': ('format', 'tag', 'algorithm', 'certificate'),
+          'CNAME': ('cname',), 'CSYNC': ('soa_serial', 'flags', 'rectypes'),
+          'DHCID': ('digest',), 'DNAME': ('dname',),
+          'DNSKEY': ('flags', 'protocol', 'algorithm', 'public_key'),
+          'DS': ('keytag', 'algorithm', 'digtype', 'digest'),
+          'IPSECKEY': ('precedence', 'gatetype', 'algorithm', 'gateway',
+                       'public_key'),
+          'KEY': ('flags', 'protocol', 'algorithm', 'public_key'),
+          'KX': ('preference', 'exchange'), 'MX': ('preference', 'exchange'),
+          'NAPTR': ('order', 'preference', 'flags', 'services', 'regexp',
+                    'replacement'),
+          'NS': ('nsdname',), 'NSAP': ('nsap',), 'PTR': ('ptrdname',),
+          'PX': ('preference', 'map822', 'mapx400'),
+          'RP': ('mbox', 'txtdname'),
+          'SOA': ('mname', 'rname', 'serial', 'refresh', 'retry', 'expire',
+                  'minimum'),
+          'SPF': ('txtdata',), 'SRV': ('priority', 'weight', 'port', 'target'),
+          'SSHFP': ('algorithm', 'fptype', 'fingerprint'),
+          'TLSA': ('cert_usage', 'selector', 'match_type', 'certificate'),
+          'TXT': ('txtdata',)}
+
+#: The rdata fields holding domain names, which are completed with the origin
+#: when relative
+NAMES = frozenset(('alias', 'cname', 'dname', 'exchange', 'map822',
+                   'mapx400', 'mbox', 'mname', 'nsdname', 'ptrdname',
+                   'replacement', 'rname', 'target', 'txtdname'))
+
+#: The separator leftover tokens are joined onto the last field with, where
+#: it is not the empty string
+_JOINS = {'CSYNC': ' '}
+
+#: A quoted string, a parenthesis, a comment, a word or a stray character
+_TOKENS = re.compile(r'"((?:[^"\\]|\\.)*)"|([()])|;.*|((?:[^\s"();\\]|\\.)+)'
+                     r'|(\S)')
+#: The fields of a SOA record which are times, and so may be given in units
+_TIMES = ('refresh', 'retry', 'expire', 'minimum')
+_ESCAPE = re.compile(r'\\(\d{3}|.)')
+_TTL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+_TTL = re.compile(r'(\d+)([smhdw]?)', re.I)
+#: The characters of a quoted string which must be escaped
+_SPECIAL = re.compile(r'[\\"\x00-\x1f\x7f]')
+#: The longest character string a TXT record may hold
+_STRING_SIZE = 255
+
+
+def _unescape(match):
+    """Replace an escape sequence of a quoted string with its character"""
+    text = match.group(1)
+    return chr(int(text)) if text.isdigit() else text
+
+
+def _entries(lines):
+    """Split *lines* into the entries of a Master file, yielding the line
+    number each starts on, whether it starts with blank space, and its
+    tokens. Comments are dropped, quoted strings become a single token and
+    parentheses join lines together
+
+    :param lines: An iterable of the lines of a Master file
+    """
+    tokens, depth = [], 0
+    for number, line in enumerate(lines, 1):
+        if not depth:
+            start, indented = number, line[:1] in (' ', '\t')
+        for match in _TOKENS.finditer(line):
+            quoted, paren, word, stray = match.groups()
+            if word is not None:
+                tokens.append(word)
+            elif quoted is not None:
+                tokens.append(_ESCAPE.sub(_unescape, quoted))
+            elif paren == '(':
+                depth += 1
+            elif paren == ')':
+                if not depth:
+                    raise DynectZoneFileError(number, 'unbalanced ")"')
+                depth -= 1
+            elif stray is not None:
+                raise DynectZoneFileError(number, 'unterminated string')
+        if not depth and tokens:
+            yield start, indented, tokens
+            tokens = []
+    if depth:
+        raise DynectZoneFileError(start, 'unbalanced "("')
+
+
+def _qualify(name, origin):
+    """Return *name*, completed with *origin* if it is relative"""
+    if name == '@':
+        return origin
+    if name.endswith('.') and not name.endswith('\\.'):
+        return name
+    return '{}.{}'.format(name, origin)
+
+
+def _ttl(text, number):
+    """Return the number of seconds in *text*, a TTL such as 3600 or 1h30m"""
+    seconds, end = 0, 0
+    for match in _TTL.finditer(text):
+        if match.start() != end:
+            break
+        value, unit = match.groups()
+        seconds += int(value) * _TTL_UNITS[unit.lower() or 's']
+        end = match.end()
+    if not end or end != len(text):
+        raise DynectZoneFileError(number, 'invalid TTL {}'.format(text))
+    return seconds
+
+
+def parse_zonefile(lines, origin, ttl=None):
+    """Parse a RFC1035, or BIND, style Master file incrementally, yielding
+    each of its records as a *dict* with the keys fqdn, record_type, ttl and
+    rdata, ready to be passed to :meth:`~dyn.tm.zones.Zone.add_records`.
+    The $ORIGIN and $TTL directives are honoured, and a record without a TTL
+    of its own takes the one in effect, or 0 for the zone's default.
+
+    :param lines: An iterable of the lines of a Master file, such as an open
+        file
+    :param origin: The name relative names are completed with, until the
+        file sets its own with $ORIGIN
+    :param ttl: The TTL of records without one, until the file sets its own
+        with $TTL
+    """
+    if not origin.endswith('.'):
+        origin += '.'
+    owner = None
+    for number, indented, tokens in _entries(lines):
+        if not indented and tokens[0].startswith('$'):
+            directive = tokens[0].upper()
+            if len(tokens) < 2 or directive not in ('$ORIGIN', '$TTL'):
+                raise DynectZoneFileError(
+                    number, 'unsupported directive {}'.format(tokens[0]))
+            if directive == '$ORIGIN':
+                origin = _qualify(tokens[1], origin)
+            else:
+                ttl = _ttl(tokens[1], number)
+            continue
+        if not indented:
+            owner = _qualify(tokens.pop(0), origin)
+        elif owner is None:
+            raise DynectZoneFileError(number, 'no owner name')
+        record_ttl = ttl
+        while tokens and (tokens[0].upper() == 'IN' or tokens[0][0].isdigit()):
+            token = tokens.pop(0)
+            if token.upper() != 'IN':
+                record_ttl = _ttl(token, number)
+        if not tokens:
+            raise DynectZoneFileError(number, 'no record type')
+        record_type = tokens.pop(0).upper()
+        try:
+            fields = FIELDS[record_type]
+        except KeyError:
+            raise DynectZoneFileError(
+                number, 'unsupported record type {}'.format(record_type))
+        if len(tokens) < len(fields):
+            raise DynectZoneFileError(
+                number, 'too few fields for {}'.format(record_type))
+        last = len(fields) - 1
+        values = tokens[:last]
+        values.append(_JOINS.get(record_type, '').join(tokens[last:]))
+        rdata = dict(zip(fields, values))
+        for field in NAMES.intersection(rdata):
+            rdata[field] = _qualify(rdata[field], origin)
+        if record_type == 'SOA':
+            for field in _TIMES:
+                rdata[field] = _ttl(rdata[field], number)
+        yield {'fqdn': owner.rstrip('.'), 'record_type': record_type,
+               'ttl': record_ttl or 0, 'rdata': rdata}
+
+
+def _escape(match):
+    """Replace a character of a quoted string with its escape sequence"""
+    char = match.group()
+    return '\\' + char if char in '\\"' else '\\{:03d}'.format(ord(char))
+
+
+def _quote(value):
+    """Return *value* as one or more quoted strings"""
+    text = force_unicode(value)
+    chunks = [text[i:i + _STRING_SIZE]
+              for i in range(0, len(text) or 1, _STRING_SIZE)]
+    return ' '.join('"{}"'.format(_SPECIAL.sub(_escape, x)) for x in chunks)
+
+
+def _absolute(value):
+    """Return *value*, a domain name, with a trailing dot"""
+    name = force_unicode(value)
+    return name if name.endswith('.') else name + '.'
+
+
+def _formatter(record_type):
+    """Return a function formatting the rdata of a record of *record_type*
+    """
+    fields = FIELDS[record_type]
+    if fields == ('txtdata',):
+        return lambda rdata: _quote(rdata['txtdata'])
+    if len(fields) == 1:
+        field = fields[0]
+        if field in NAMES:
+            return lambda rdata: _absolute(rdata[field])
+        return lambda rdata: force_unicode(rdata[field])
+    convert = tuple((x, _absolute if x in NAMES else force_unicode)
+                    for x in fields)
+    return lambda rdata: ' '.join(func(rdata[x]) for x, func in convert)
+
+
+#: The function formatting the rdata of each supported record type
+_FORMATTERS = {x: _formatter(x) for x in FIELDS}
+
+
+def write_zonefile(fp, records, origin=None):
+    """Write *records* to *fp* as a RFC1035, or BIND, style Master file, a
+    line at a time, so that they may come from a generator of any length.
+    Every name is written in full. A record of a type which Master files can
+    not be written for is written as a comment, so that it is not silently
+    lost.
+
+    :param fp: A file open for writing text
+    :param records: An iterable of *dict*'s with the keys fqdn, record_type,
+        ttl and rdata, as returned by the API
+    :param origin: The name of the zone, written out as $ORIGIN
+    :return: The number of records written
+    """
+    if origin is not None:
+        fp.write('$ORIGIN {}\n'.format(_absolute(origin)))
+    write, line = fp.write, '{}. {} IN {} {}\n'
+    count = 0
+    for record in records:
+        record_type = record['record_type']
+        formatter = _FORMATTERS.get(record_type)
+        if formatter is None:
+            write('; {}. {} record not supported\n'.format(record['fqdn'],
+                                                           record_type))
+            continue
+        write(line.format(record['fqdn'], record['ttl'], record_type,
+                          formatter(record['rdata'])))
+        count += 1
+    return count
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """This module contains all Zone related API objects."""
 import os
+import re
+from itertools import chain, islice
 from time import sleep
 from datetime import datetime
 
@@ -15,16 +17,19 @@ from dyn.tm.records import (ARecord, AAAARecord, ALIASRecord, CDSRecord,
                             LOCRecord, IPSECKEYRecord, MXRecord, NAPTRRecord,
                             PTRRecord, PXRecord, NSAPRecord, RPRecord,
                             NSRecord, SOARecord, SPFRecord, SRVRecord,
-                            TLSARecord, TXTRecord, SSHFPRecord, UNKNOWNRecord)
+                            TLSARecord, TXTRecord, SSHFPRecord, UNKNOWNRecord,
+                            DNSRecord, RecordView)
 from dyn.tm.session import DynectSession
 from dyn.tm.services import (ActiveFailover, DynamicDNS, DNSSEC,
                              TrafficDirector, GSLB, ReverseDNS, RTTM,
                              HTTPRedirect, AdvancedRedirect)
 from dyn.tm.task import Task
+from dyn.tm.zonefile import parse_zonefile, write_zonefile
 
 __author__ = 'jnappi'
-__all__ = ['get_all_zones', 'Zone', 'SecondaryZone', 'Node',
-           'ExternalNameserver', 'ExternalNameserverEntry']
+__all__ = ['get_all_zones', 'iter_all_zones', 'Zone', 'ZonePlan',
+           'SecondaryZone', 'Node', 'ExternalNameserver',
+           'ExternalNameserverEntry']
 
 RECS = {'A': ARecord, 'AAAA': AAAARecord, 'ALIAS': ALIASRecord,
         'CDS': CDSRecord, 'CDNSKEY': CDNSKEYRecord, 'CSYNC': CSYNCRecord,
@@ -38,6 +43,165 @@ RECS = {'A': ARecord, 'AAAA': AAAARecord, 'ALIAS': ALIASRecord,
         'TXT': TXTRecord, 'SSHFP': SSHFPRecord, 'UNKNOWN': UNKNOWNRecord}
 
 
+def _build_record(zone, label, record):
+    """Build a :class:`DNSRecord` from a record returned by the API
+
+    :param zone: The name of the zone the record belongs to
+    :param label: The key the record was listed under, ie 'a_records'
+    :param record: The *dict* representation of the record
+    """
+    search = label.split('_')[0].upper()
+    try:
+        constructor = RECS[search]
+    except KeyError:
+        constructor = RECS['UNKNOWN']
+    del record['zone']
+    fqdn = record['fqdn']
+    del record['fqdn']
+    # Unpack rdata
+    for r_key, r_val in record['rdata'].items():
+        record[r_key] = r_val
+    record['create'] = False
+    return constructor(zone, fqdn, **record)
+
+
+def _build_view(zone, label, record):
+    """Build a read-only :class:`~dyn.tm.records.RecordView` from a record
+    returned by the API
+
+    :param zone: The name of the zone the record belongs to
+    :param label: The key the record was listed under, ie 'a_records'
+    :param record: The *dict* representation of the record
+    """
+    return RecordView(zone, record['fqdn'], record['record_type'],
+                      record['record_id'], record['ttl'], record['rdata'])
+
+
+#: The functions building each view of a record
+_VIEWS = {'full': _build_record, 'compact': _build_view}
+
+
+def _record_builder(view):
+    """Return the function building records of the requested *view*"""
+    try:
+        return _VIEWS[view]
+    except KeyError:
+        raise DynectInvalidArgumentError('view', view, tuple(_VIEWS))
+
+
+def _as_view(zone, record):
+    """Return *record*, a :class:`~dyn.tm.records.RecordView`, a
+    :class:`~dyn.tm.records.DNSRecord` or a *dict* with the keys fqdn,
+    record_type, rdata and optionally ttl, as a
+    :class:`~dyn.tm.records.RecordView`
+
+    :param zone: The name of the zone the record belongs to
+    :param record: The record to convert
+    """
+    if isinstance(record, RecordView):
+        return record
+    if isinstance(record, DNSRecord):
+        rdata = DNSRecord.rdata(record)
+        rdata = {x: rdata[x] for x in rdata
+                 if rdata[x] is not None and x != 'note'}
+        return RecordView(zone, record.fqdn, record.rec_name.upper(),
+                          record.record_id, record.ttl, rdata)
+    if isinstance(record, dict):
+        return RecordView(zone, record['fqdn'], record['record_type'],
+                          record.get('record_id'), record.get('ttl', 0),
+                          record['rdata'])
+    raise DynectInvalidArgumentError('record', record)
+
+
+def _node_key(record):
+    """The (fqdn, record_type) of *record*, compared without case or a
+    trailing dot
+    """
+    return record.fqdn.rstrip('.').lower(), record.record_type.upper()
+
+
+def _rdata_key(record):
+    """The rdata of *record*, in a hashable form in which numbers compare
+    equal to their text
+    """
+    return tuple(sorted((key, force_unicode(val))
+                        for key, val in record.rdata.items()
+                        if val is not None))
+
+
+def _create_call(zone, record):
+    """The (uri, method, args) of the API call creating *record*, a
+    :class:`~dyn.tm.records.RecordView`, in *zone*
+    """
+    uri = '/{}Record/{}/{}/'.format(record.record_type, zone, record.fqdn)
+    return uri, 'POST', {'rdata': record.rdata, 'ttl': record.ttl or 0}
+
+
+def _importable(zone, records):
+    """Yield the records of a Master file which are to be created in *zone*,
+    skipping its SOA record and the nameservers at its apex, as with
+    :meth:`Zone.plan`, since the zone already has its own
+
+    :param zone: The name of the zone the records are imported into
+    :param records: An iterable of records, as parsed by
+        :func:`~dyn.tm.zonefile.parse_zonefile`
+    """
+    apex = zone.rstrip('.').lower()
+    for record in records:
+        record_type = record['record_type']
+        if record_type == 'SOA' or (
+                record_type == 'NS' and
+                record['fqdn'].rstrip('.').lower() == apex):
+            continue
+        yield record
+
+
+#: The mailbox of a SOA record, split into its local part and its domain
+_MAILBOX = re.compile(r'((?:[^.\\]|\\.)+)\.(.+)')
+
+
+def _contact(rname):
+    """Return *rname*, the mailbox of a SOA record such as
+    hostmaster.example.com., as an email address
+    """
+    match = _MAILBOX.match(rname.rstrip('.'))
+    if match is None:
+        return rname
+    local, domain = match.groups()
+    return '{}@{}'.format(local.replace('\\.', '.'), domain)
+
+
+#: The number of changes handed to execute_many at once, so that very large
+#: sets of changes are consumed lazily and progress may be reported
+_CHUNK_SIZE = 1000
+
+
+def _make_changes(changes, concurrency=None, progress=None):
+    """Make every change in *changes* concurrently, a chunk at a time
+
+    :param changes: An iterable of (action, record, call) tuples, where call
+        is the (uri, method, args) of the API call making the change
+    :param concurrency: The maximum number of calls to have in flight at once
+    :param progress: A callable passed the number of changes made and the
+        number of those which failed, after each chunk
+    :return: A *list* of (action, record, exception) for every change which
+        failed, and the number of changes made
+    """
+    session = DynectSession.get_session()
+    changes = iter(changes)
+    failures, done = [], 0
+    while True:
+        chunk = list(islice(changes, _CHUNK_SIZE))
+        if not chunk:
+            return failures, done
+        results = session.execute_many([x[2] for x in chunk], concurrency)
+        failures.extend(change[:2] + (result,) for change, result in
+                        zip(chunk, results) if isinstance(result, Exception))
+        done += len(chunk)
+        if progress is not None:
+            progress(done, len(failures))
+
+
 def get_all_zones():
     """Accessor function to retrieve a *list* of all
     :class:`~dyn.tm.zones.Zone`'s accessible to a user
@@ -53,6 +217,21 @@ def get_all_zones():
     return zones
 
 
+def iter_all_zones():
+    """Accessor function to iterate over all :class:`~dyn.tm.zones.Zone`'s
+    accessible to a user. Unlike :func:`get_all_zones`, the API's response is
+    decoded incrementally and each :class:`~dyn.tm.zones.Zone` is built only
+    as it is reached
+
+    :return: a generator of :class:`~dyn.tm.zones.Zone`'s
+    """
+    uri = '/Zone/'
+    api_args = {'detail': 'Y'}
+    session = DynectSession.get_session()
+    for _, zone in session.execute_iter(uri, 'GET', api_args):
+        yield Zone(zone['zone'], api=False, **zone)
+
+
 def get_all_secondary_zones():
     """Accessor function to retrieve a *list* of all :class:`SecondaryZone`'s
     accessible to a user
@@ -68,6 +247,20 @@ def get_all_secondary_zones():
     return zones
 
 
+def iter_all_secondary_zones():
+    """Accessor function to iterate over all :class:`SecondaryZone`'s
+    accessible to a user, building each only as it is decoded from the API's
+    response
+
+    :return: a generator of :class:`~dyn.tm.zones.SecondaryZone`'s
+    """
+    uri = '/Secondary/'
+    api_args = {'detail': 'Y'}
+    session = DynectSession.get_session()
+    for _, zone in session.execute_iter(uri, 'GET', api_args):
+        yield SecondaryZone(zone.pop('zone'), api=False, **zone)
+
+
 def get_apex(node_name, full_details=False):
     """Accessor function to retireve the apex zone name of a given node
     available to logged in user.
@@ -89,6 +282,76 @@ def get_apex(node_name, full_details=False):
         return response['data']['zone']
 
 
+class ZonePlan(object):
+    """The changes needed to bring a :class:`Zone`'s records to a desired
+    state, as computed by :meth:`Zone.plan`. Records are
+    :class:`~dyn.tm.records.RecordView`'s.
+    """
+
+    def __init__(self, zone, creates=None, updates=None, deletes=None):
+        """Create a :class:`ZonePlan` object
+
+        :param zone: The name of the zone the changes are for
+        :param creates: A *list* of records to create
+        :param updates: A *list* of (current, desired) record pairs, where
+            the current record is changed to match the desired one
+        :param deletes: A *list* of records to delete
+        """
+        super(ZonePlan, self).__init__()
+        self.zone = zone
+        self.creates = creates or []
+        self.updates = updates or []
+        self.deletes = deletes or []
+
+    def calls(self):
+        """Return the (uri, method, args) of every API call this plan makes,
+        in the form accepted by :meth:`~dyn.core.SessionEngine.execute_many`
+        """
+        calls = [_create_call(self.zone, x) for x in self.creates]
+        for current, desired in self.updates:
+            uri = '/{}Record/{}/{}/{}/'.format(current.record_type, self.zone,
+                                               current.fqdn, current.record_id)
+            calls.append((uri, 'PUT', {'rdata': desired.rdata,
+                                       'ttl': desired.ttl or current.ttl}))
+        for record in self.deletes:
+            uri = '/{}Record/{}/{}/{}/'.format(record.record_type, self.zone,
+                                               record.fqdn, record.record_id)
+            calls.append((uri, 'DELETE', {}))
+        return calls
+
+    def changes(self):
+        """Return the ('create', 'update' or 'delete', record) of every
+        change, in the same order as :meth:`calls`. An update's record is its
+        desired record
+        """
+        return ([('create', x) for x in self.creates] +
+                [('update', x[1]) for x in self.updates] +
+                [('delete', x) for x in self.deletes])
+
+    def __len__(self):
+        """The number of API calls needed to apply this plan, other than the
+        publish
+        """
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+    def __nonzero__(self):
+        """Whether this plan changes anything"""
+        return len(self) > 0
+    __bool__ = __nonzero__
+
+    def __str__(self):
+        """str override"""
+        return force_unicode(
+            '<ZonePlan>: {}, {} creates, {} updates, {} deletes').format(
+            self.zone, len(self.creates), len(self.updates),
+            len(self.deletes))
+    __repr__ = __unicode__ = __str__
+
+    def __bytes__(self):
+        """bytes override"""
+        return bytes(self.__str__())
+
+
 class Zone(object):
     """A class representing a DynECT Zone"""
 
@@ -103,7 +366,9 @@ class Zone(object):
         :param serial_style: The style of the zone's serial. Valid values:
             increment, epoch, day, minute
         :param file_name: The path to a valid RFC1035, BIND, or tinydns style
-            Master file. Note: this file must be under 1mb in size.
+            Master file. A file over 1mb in size must be a RFC1035 or BIND
+            Master file starting with its SOA record, and is imported with
+            :meth:`import_zonefile`
         :param master_ip: The IP of the master server from which to fetch zone
             data for Transferring this :class:`Zone`. Note: This argument is
             required for performing a valid ZoneTransfer operation.
@@ -167,8 +432,7 @@ class Zone(object):
         full_path = os.path.abspath(file_name)
         file_size = os.path.getsize(full_path)
         if file_size > 1048576:
-            raise DynectInvalidArgumentError('Zone File Size', file_size,
-                                             'Under 1MB')
+            self._post_with_records(full_path)
         else:
             uri = '/ZoneFile/{}/'.format(self.name)
             f = open(full_path, 'r')
@@ -180,6 +444,26 @@ class Zone(object):
             self.__poll_for_get()
             self._build(response['data'])
 
+    def _post_with_records(self, file_name):
+        """Create a :class:`Zone` from a RFC1035 or BIND style Master file
+        too large for the ZoneFile API. The zone is created from the file's
+        SOA record, then the rest of its records with :meth:`import_zonefile`
+
+        :param file_name: The path to a Master file starting with its SOA
+            record
+        """
+        with open(file_name) as f:
+            records = parse_zonefile(f, self._name)
+            soa = next(records, None)
+            if soa is None or soa['record_type'] != 'SOA':
+                raise DynectInvalidArgumentError('file_name', file_name,
+                                                 'Starting with a SOA record')
+            self._post(_contact(soa['rdata']['rname']), soa['ttl'] or 60)
+            failures = self.add_records(_importable(self._name, records))
+        if failures:
+            msg = '{} records could not be created, the first: {}'
+            raise DynectCreateError(msg.format(len(failures), failures[0][2]))
+
     def _xfer(self, master_ip, timeout=None):
         """Create a :class:`Zone` by ZoneTransfer by providing an optional
         master_ip argument.
@@ -419,6 +703,64 @@ class Zone(object):
             self.records[record_type] = [rec]
         return rec
 
+    def add_records(self, records, concurrency=None, publish=True,
+                    notes=None, progress=None):
+        """Create many records in this :class:`Zone` concurrently, then
+        publish it once. *records* is consumed lazily, so may be a generator
+        of any length, and a record which fails to be created does not stop
+        the others.
+
+        :param records: An iterable of records, each a
+            :class:`~dyn.tm.records.RecordView` or a *dict* with the keys
+            fqdn, record_type, rdata and optionally ttl
+        :param concurrency: The maximum number of calls to have in flight at
+            once. Defaults to the session's pool_size
+        :param publish: Whether to publish this :class:`Zone` once the
+            records have been created
+        :param notes: Notes to publish this :class:`Zone` with
+        :param progress: A callable passed the number of records sent so far
+            and the number of those which failed, every thousand records
+        :return: A *list* of ('create', record, exception) for every record
+            which failed to be created
+        """
+        changes = (('create', record, _create_call(self._name, record))
+                   for record in (_as_view(self._name, x) for x in records))
+        failures, done = _make_changes(changes, concurrency, progress)
+        if publish and len(failures) < done:
+            self.publish(notes)
+        return failures
+
+    def import_zonefile(self, file_name, concurrency=None, publish=True,
+                        notes=None, progress=None):
+        """Create the records of a RFC1035 or BIND style Master file in this
+        :class:`Zone`, concurrently, then publish it once. Unlike the ZoneFile
+        API, files of any size are accepted: the file is parsed a line at a
+        time and its records sent in chunks as they are read. The file's SOA
+        record and the nameservers at its apex are skipped, as this
+        :class:`Zone` already has its own. A file which can not be parsed
+        raises a :class:`~dyn.tm.errors.DynectZoneFileError`, leaving the
+        records already sent unpublished.
+
+        :param file_name: The path to a Master file, or an open file
+        :param concurrency: The maximum number of calls to have in flight at
+            once. Defaults to the session's pool_size
+        :param publish: Whether to publish this :class:`Zone` once the
+            records have been created
+        :param notes: Notes to publish this :class:`Zone` with
+        :param progress: A callable passed the number of records sent so far
+            and the number of those which failed, every thousand records
+        :return: A *list* of ('create', record, exception) for every record
+            which failed to be created
+        """
+        if not hasattr(file_name, 'read'):
+            with open(file_name) as f:
+                return self.import_zonefile(f, concurrency, publish, notes,
+                                            progress)
+        records = _importable(self._name,
+                              parse_zonefile(file_name, self._name))
+        return self.add_records(records, concurrency, publish, notes,
+                                progress)
+
     def add_service(self, name=None, service_type=None, *args, **kwargs):
         """Add the specified service type to this zone, or to a node under this
         zone
@@ -480,14 +822,18 @@ class Zone(object):
             fqdn = self.name + '.'
         return Node(self.name, fqdn)
 
-    def get_all_records(self):
+    def get_all_records(self, view='full'):
         """Retrieve a list of all record resources for the specified node and
         zone combination as well as all records from any Base_Record below that
         point on the zone hierarchy
 
+        :param view: 'full' for :class:`DNSRecord`'s, or 'compact' for
+            read-only :class:`~dyn.tm.records.RecordView`'s, which are far
+            cheaper to build and hold
         :return: A :class:`List` of all the :class:`DNSRecord`'s under this
             :class:`Zone`
         """
+        build = _record_builder(view)
         self.records = {}
         uri = '/AllRecord/{}/'.format(self._name)
         if self.fqdn is not None:
@@ -499,24 +845,131 @@ class Zone(object):
                         response['data'].items() if rec_list != []}
         records = {}
         for key, record_list in record_lists.items():
-            search = key.split('_')[0].upper()
-            try:
-                constructor = RECS[search]
-            except KeyError:
-                constructor = RECS['UNKNOWN']
-            list_records = []
-            for record in record_list:
-                del record['zone']
-                fqdn = record['fqdn']
-                del record['fqdn']
-                # Unpack rdata
-                for r_key, r_val in record['rdata'].items():
-                    record[r_key] = r_val
-                record['create'] = False
-                list_records.append(constructor(self._name, fqdn, **record))
-            records[key] = list_records
+            records[key] = [build(self._name, key, record)
+                            for record in record_list]
         return records
 
+    def iter_records(self, view='full'):
+        """Iterate over all record resources for the specified node and zone
+        combination as well as all records from any Base_Record below that
+        point on the zone hierarchy. Unlike :meth:`get_all_records`, the API's
+        response is decoded incrementally and each :class:`DNSRecord` is built
+        only as it is reached, so memory use stays flat for even the largest
+        zones.
+
+        :param view: 'full' for :class:`DNSRecord`'s, or 'compact' for
+            read-only :class:`~dyn.tm.records.RecordView`'s, which are far
+            cheaper to build and hold
+        :return: A generator of :class:`DNSRecord`'s
+        """
+        build = _record_builder(view)
+        uri = '/AllRecord/{}/'.format(self._name)
+        if self.fqdn is not None:
+            uri += '{}/'.format(self.fqdn)
+        api_args = {'detail': 'Y'}
+        session = DynectSession.get_session()
+        for key, record in session.execute_iter(uri, 'GET', api_args):
+            yield build(self._name, key, record)
+
+    def export_zonefile(self, fp):
+        """Write the records of this :class:`Zone` to *fp* as a RFC1035 or
+        BIND style Master file, SOA record first. Each line is written
+        straight from the API's response as it is decoded, without building
+        any records, so memory use stays flat for even the largest zones.
+
+        :param fp: The path to write the Master file to, or a file open for
+            writing text
+        :return: The number of records written
+        """
+        if not hasattr(fp, 'write'):
+            with open(fp, 'w') as f:
+                return self.export_zonefile(f)
+        session = DynectSession.get_session()
+        api_args = {'detail': 'Y'}
+        uri = '/SOARecord/{}/{}/'.format(self._name, self.fqdn)
+        soa = session.execute(uri, 'GET', api_args)['data']
+        uri = '/AllRecord/{}/'.format(self._name)
+        if self.fqdn is not None:
+            uri += '{}/'.format(self.fqdn)
+        records = (record for _, record in
+                   session.execute_iter(uri, 'GET', api_args)
+                   if record['record_type'] != 'SOA')
+        return write_zonefile(fp, chain(soa, records), self._name)
+
+    def plan(self, desired_records, delete=False):
+        """Compute the changes needed to make this :class:`Zone` hold
+        *desired_records*, from a single fetch of its current records.
+        Records are matched on their fqdn, type and rdata. A matched record
+        whose ttl differs is updated, and an unmatched record is created.
+        Records which are not desired are left alone unless *delete* is set,
+        in which case the zone is made to hold exactly *desired_records*, and
+        an unmatched record is updated in place of one of the same fqdn and
+        type being deleted, so that no more calls than needed are made. The
+        SOA record is never changed, and nameservers at the zone apex are only
+        changed when *desired_records* holds some.
+
+        :param desired_records: An iterable of records, each a
+            :class:`~dyn.tm.records.RecordView`, a :class:`DNSRecord` or a
+            *dict* with the keys fqdn, record_type, rdata and optionally ttl.
+            A ttl of 0 or *None* accepts whatever ttl a record already has
+        :param delete: Whether to delete, or replace, records which are not
+            desired
+        :return: A :class:`ZonePlan`
+        """
+        desired = {}
+        for record in desired_records:
+            record = _as_view(self._name, record)
+            if record.record_type.upper() != 'SOA':
+                desired[_node_key(record) + (_rdata_key(record),)] = record
+        apex = (self._name.rstrip('.').lower(), 'NS')
+        keep_apex_ns = not any(key[:2] == apex for key in desired)
+        plan = ZonePlan(self._name)
+        # Current records left unmatched, by (fqdn, record_type)
+        unmatched = {}
+        for current in self.iter_records(view='compact'):
+            node = _node_key(current)
+            if node[1] == 'SOA' or (node == apex and keep_apex_ns):
+                continue
+            record = desired.pop(node + (_rdata_key(current),), None)
+            if record is None:
+                unmatched.setdefault(node, []).append(current)
+            elif record.ttl and record.ttl != current.ttl:
+                plan.updates.append((current, record))
+        for key, record in desired.items():
+            others = unmatched.get(key[:2]) if delete else None
+            if others:
+                plan.updates.append((others.pop(), record))
+            else:
+                plan.creates.append(record)
+        if delete:
+            for others in unmatched.values():
+                plan.deletes.extend(others)
+        return plan
+
+    def apply(self, plan, concurrency=None, publish=True, notes=None,
+              progress=None):
+        """Make the changes in *plan*, concurrently, then publish this
+        :class:`Zone` once. A failed change does not stop the others from
+        being made, or the zone from being published.
+
+        :param plan: A :class:`ZonePlan`, as returned by :meth:`plan`
+        :param concurrency: The maximum number of calls to have in flight at
+            once. Defaults to the session's pool_size
+        :param publish: Whether to publish this :class:`Zone` once the
+            changes have been made
+        :param notes: Notes to publish this :class:`Zone` with
+        :param progress: A callable passed the number of changes made so far
+            and the number of those which failed, every thousand changes
+        :return: A *list* of ('create', 'update' or 'delete', record,
+            exception) for every change which failed
+        """
+        changes = (change + (call,) for change, call in
+                   zip(plan.changes(), plan.calls()))
+        failures, done = _make_changes(changes, concurrency, progress)
+        if publish and len(failures) < done:
+            self.publish(notes)
+        return failures
+
     def get_all_records_by_type(self, record_type):
         """Get a list of all :class:`DNSRecord` of type ``record_type`` which
         are owned by this node.
@@ -1007,11 +1460,16 @@ class Node(object):
         self.services.append(service)
         return service
 
-    def get_all_records(self):
+    def get_all_records(self, view='full'):
         """Retrieve a list of all record resources for the specified node and
         zone combination as well as all records from any Base_Record below that
         point on the zone hierarchy
+
+        :param view: 'full' for :class:`DNSRecord`'s, or 'compact' for
+            read-only :class:`~dyn.tm.records.RecordView`'s, which are far
+            cheaper to build and hold
         """
+        build = _record_builder(view)
         self.records = {}
         uri = '/AllRecord/{}/'.format(self.zone)
         if self.fqdn is not None:
@@ -1023,24 +1481,32 @@ class Node(object):
                         response['data'].items() if rec_list != []}
         records = {}
         for key, record_list in record_lists.items():
-            search = key.split('_')[0].upper()
-            try:
-                constructor = RECS[search]
-            except KeyError:
-                constructor = RECS['UNKNOWN']
-            list_records = []
-            for record in record_list:
-                del record['zone']
-                fqdn = record['fqdn']
-                del record['fqdn']
-                # Unpack rdata
-                for r_key, r_val in record['rdata'].items():
-                    record[r_key] = r_val
-                record['create'] = False
-                list_records.append(constructor(self.zone, fqdn, **record))
-            records[key] = list_records
+            records[key] = [build(self.zone, key, record)
+                            for record in record_list]
         return records
 
+    def iter_records(self, view='full'):
+        """Iterate over all record resources for the specified node and zone
+        combination as well as all records from any Base_Record below that
+        point on the zone hierarchy. Unlike :meth:`get_all_records`, the API's
+        response is decoded incrementally and each :class:`DNSRecord` is built
+        only as it is reached, so memory use stays flat for even the largest
+        zones.
+
+        :param view: 'full' for :class:`DNSRecord`'s, or 'compact' for
+            read-only :class:`~dyn.tm.records.RecordView`'s, which are far
+            cheaper to build and hold
+        :return: A generator of :class:`DNSRecord`'s
+        """
+        build = _record_builder(view)
+        uri = '/AllRecord/{}/'.format(self.zone)
+        if self.fqdn is not None:
+            uri += '{}/'.format(self.fqdn)
+        api_args = {'detail': 'Y'}
+        session = DynectSession.get_session()
+        for key, record in session.execute_iter(uri, 'GET', api_args):
+            yield build(self.zone, key, record)
+
     def get_all_records_by_type(self, record_type):
         """Get a list of all :class:`DNSRecord` of type ``record_type`` which
         are owned by this node.
@@ -21,7 +21,9 @@ setup(
     author='Jonathan Nappi, Cole Tuininga',
     author_email='jnappi@dyn.com',
     url='https://github.com/dyninc/dyn-python',
-    packages=['dyn', 'dyn/tm', 'dyn/mm', 'dyn/tm/services'],
+    # dyn.aio, dyn.tm.aio and dyn.mm.aio, the asyncio sessions, require Python
+    # 3.5 or higher. The rest of the package supports Python 2.6 and higher
+    packages=['dyn', 'dyn/tm', 'dyn/mm', 'dyn/tm/services', 'dyn/testing'],
     classifiers=[
         'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3',
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Shared setup for the test suite"""
+import sys
+
+if sys.version_info < (3, 5):
+    # The asyncio sessions use syntax which only Python 3.5 and higher parse
+    collect_ignore = ['test_aio.py']
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from dyn.mm.aio import AsyncMMSession
+from dyn.retry import RetryPolicy
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.aio import AsyncDynectSession
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_async_calls_survive_mixed_faults():
+    """Dropped connections and 503s are retried as set by the policy"""
+    policy = RetryPolicy(max_attempts=10, base_delay=0.01, max_delay=0.05,
+                         deadline=None)
+    with FakeDynServer(error_rate=0.2, drop_rate=0.05, seed=3) as server:
+        server.add_zone('example.com')
+        session = AsyncDynectSession('customer', 'user', 'password',
+                                     pool_size=8, retry_policy=policy,
+                                     **server.session_kwargs)
+
+        async def run_all():
+            async with session:
+                calls = [session.execute('/Zone/example.com/', 'GET')
+                         for _ in range(200)]
+                return await asyncio.gather(*calls, return_exceptions=True)
+        results = _run(run_all())
+    assert [x for x in results if isinstance(x, Exception)] == []
+    assert server.stats['dropped'] and server.stats['errors']
+
+
+def test_async_blocked_zone_is_held():
+    session = AsyncDynectSession('customer', 'user', 'password',
+                                 retry_policy=RetryPolicy(base_delay=0.2,
+                                                          jitter=0))
+    session._zone_backoff.hold('example.com', 0.2)
+    assert session._zone_backoff.remaining('example.com') > 0
+    assert session._zone_backoff.remaining('other.com') == 0
+    _run(session._wait_for_zone('example.com'))
+    assert session._zone_backoff.remaining('example.com') == 0
+
+
+def test_async_pool_limits_calls_in_flight():
+    with FakeDynServer(latency=0.05, max_concurrency=2) as server:
+        server.add_zone('example.com')
+        session = AsyncDynectSession('customer', 'user', 'password',
+                                     pool_size=2, **server.session_kwargs)
+
+        async def run_all():
+            async with session:
+                calls = [session.execute('/Zone/example.com/', 'GET')
+                         for _ in range(10)]
+                return await asyncio.gather(*calls)
+        results = _run(run_all())
+    assert [x['status'] for x in results] == ['success'] * 10
+    assert server.stats['throttled'] == 0
+
+
+def test_async_mm_session():
+    with FakeDynServer(report_size=3) as server:
+        session = AsyncMMSession('apikey', **server.session_kwargs)
+
+        async def run():
+            async with session:
+                return await session.execute('/reports/sent/count', 'GET')
+        assert _run(run()) == {'count': 3}
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.errors import DynectGetError
+from dyn.tm.session import DynectSession
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer(latency=0.05) as server:
+        for name in ('a.com', 'b.com', 'c.com'):
+            server.add_zone(name)
+        yield server
+
+
+def test_execute_many_returns_results_in_order(server):
+    session = DynectSession('customer', 'user', 'password', pool_size=4,
+                            **server.session_kwargs)
+    try:
+        calls = [('/Zone/{}/'.format(x), 'GET', None)
+                 for x in ('c.com', 'missing.com', 'a.com', 'b.com')]
+        results = session.execute_many(calls)
+    finally:
+        DynectSession.close_session()
+    assert [x['data']['zone'] for x in results[::2]] == ['c.com', 'a.com']
+    assert isinstance(results[1], DynectGetError)
+    assert results[3]['data']['zone'] == 'b.com'
+
+
+def test_execute_many_runs_calls_concurrently(server):
+    session = DynectSession('customer', 'user', 'password', pool_size=4,
+                            **server.session_kwargs)
+    try:
+        started = time.time()
+        results = session.execute_many([('/Zone/a.com/', 'GET', None)] * 8)
+        elapsed = time.time() - started
+    finally:
+        DynectSession.close_session()
+    assert [x['status'] for x in results] == ['success'] * 8
+    # Eight 50ms calls, four at a time
+    assert elapsed < 8 * 0.05
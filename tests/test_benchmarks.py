@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def suite():
+    path = os.path.join(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))), 'benchmarks')
+    sys.path.insert(0, path)
+    try:
+        import suite
+        yield suite
+    finally:
+        sys.path.remove(path)
+
+
+def test_every_workflow_runs(suite, capsys):
+    results = suite.run(latency=0, scale=0.001)
+    workflows = results['workflows']
+    assert list(workflows) == list(suite.WORKFLOWS)
+    assert [x['ops'] for x in workflows.values()] == [1] * len(workflows)
+    assert workflows['login']['calls_per_op'] == 1
+    assert workflows['mm_report']['calls_per_op'] == 1
+    assert results['environment']['scale'] == 0.001
+    suite.report(results, results)
+    assert '+0.0%' in capsys.readouterr().out
+
+
+def test_helpers(suite):
+    assert suite._percentile([3, 1, 2, 4], 50) == 2
+    assert suite._percentile([3, 1, 2, 4], 99) == 4
+    assert [suite._scaled(x, 0.001) for x in (0, 10, 100000)] == [0, 1, 100]
+    assert suite._change(0, 1) == suite._change(1, None) == ''
+    assert suite._change(2, 3) == '+50.0%'
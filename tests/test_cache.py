@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import pickle
+import time
+
+import pytest
+
+from dyn.cache import ResponseCache
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        server.populate('a.com', 2)
+        server.populate('b.com', 2)
+        yield server
+
+
+def _session(server, cache):
+    return DynectSession('customer', 'user', 'password', cache=cache,
+                         **server.session_kwargs)
+
+
+def test_repeated_gets_served_from_cache(server):
+    session = _session(server, ResponseCache(ttl=30))
+    try:
+        before = server.stats['requests']
+        first = session.execute('/Zone/a.com/', 'GET')
+        first['data']['zone'] = 'mutated'
+        assert session.execute('/Zone/a.com/', 'GET')['data']['zone'] == \
+            'a.com'
+        assert server.stats['requests'] - before == 1
+    finally:
+        DynectSession.close_session()
+
+
+def test_writes_invalidate_their_zone(server):
+    cache = ResponseCache(ttl=30)
+    session = _session(server, cache)
+    try:
+        for zone in ('a.com', 'b.com'):
+            session.execute('/AllRecord/{}/'.format(zone), 'GET')
+        session.execute('/Zone/', 'GET')
+        session.execute('/ARecord/a.com/new.a.com/', 'POST',
+                        {'rdata': {'address': '10.0.0.9'}})
+        # Only b.com's listing survives the write to a.com
+        assert len(cache) == 1
+        before = server.stats['requests']
+        records = session.execute('/AllRecord/a.com/', 'GET')['data']
+        assert len(records) == 8
+        session.execute('/AllRecord/b.com/', 'GET')
+        assert server.stats['requests'] - before == 1
+    finally:
+        DynectSession.close_session()
+
+
+def test_cache_expires_and_evicts():
+    cache = ResponseCache(ttl=0.05, max_entries=2)
+    for name in ('a', 'b', 'c'):
+        cache.set(cache.key('/REST/Zone/{}/'.format(name), {}), {})
+    assert len(cache) == 2
+    assert cache.get(cache.key('/REST/Zone/a/', {})) is None
+    assert cache.get(cache.key('/REST/Zone/c/', {})) == {}
+    time.sleep(0.06)
+    assert cache.get(cache.key('/REST/Zone/c/', {})) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_pickles_empty():
+    cache = ResponseCache(ttl=5)
+    cache.set(cache.key('/REST/Zone/a/', {}), {})
+    copy = pickle.loads(pickle.dumps(cache))
+    assert (copy.ttl, len(copy)) == (5, 0)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from dyn.compat import (JSON_BACKENDS, get_json_backend, json_dumps,
+                        json_loads, set_json_backend)
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+@pytest.fixture(params=JSON_BACKENDS)
+def backend(request):
+    if request.param != 'stdlib':
+        pytest.importorskip(request.param)
+    previous = get_json_backend()
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def test_backend_round_trips(backend):
+    assert get_json_backend() == backend
+    payload = {'data': [1, 2.5, None, True], 'name': u'caf\xe9'}
+    text = json_dumps(payload)
+    assert json_loads(text) == payload
+    assert json_loads(text.encode('UTF-8')) == payload
+
+
+def test_session_uses_backend(backend):
+    with FakeDynServer() as server:
+        server.populate('example.com', 5)
+        session = DynectSession('customer', 'user', 'password',
+                                **server.session_kwargs)
+        try:
+            response = session.execute('/AllRecord/example.com/', 'GET',
+                                       {'detail': 'Y'})
+        finally:
+            DynectSession.close_session()
+    assert len(response['data']['a_records']) == 5
+
+
+def test_auto_picks_an_installed_backend():
+    previous = get_json_backend()
+    try:
+        assert set_json_backend('auto') in JSON_BACKENDS
+    finally:
+        set_json_backend(previous)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        set_json_backend('yaml')
+    assert get_json_backend() in JSON_BACKENDS
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+from dyn.core import clean_args
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+def test_clean_args_masks_password_in_a_copy():
+    args = {'user_name': 'user', 'password': 'secret'}
+    assert clean_args(args) == {'user_name': 'user', 'password': '*****'}
+    assert args['password'] == 'secret'
+    plain = {'rdata': {'address': '10.0.0.1'}}
+    assert clean_args(plain) is plain
+
+
+def test_headers_rebuilt_after_changes():
+    session = DynectSession('customer', 'user', 'password', auto_auth=False)
+    try:
+        headers = dict(session._headers())
+        assert headers['API-Version'] == 'current'
+        assert session._headers() is session._headers()
+        session.extra_headers['X-Trace'] = '1'
+        session.content_type = 'text/plain'
+        headers = dict(session._headers())
+        assert (headers['X-Trace'], headers['Content-Type']) == \
+            ('1', 'text/plain')
+        del session.extra_headers['X-Trace']
+        assert 'X-Trace' not in dict(session._headers())
+        copy = pickle.loads(pickle.dumps(session.extra_headers))
+        copy['X-Trace'] = '2'
+        assert copy.version == 1
+    finally:
+        DynectSession.close_session()
+
+
+def test_history_snapshots_masked_args():
+    with FakeDynServer() as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password', history=True,
+                                **server.session_kwargs)
+        try:
+            args = {'rdata': {'address': '10.0.0.1'}}
+            session.execute('/ARecord/example.com/www.example.com/', 'POST',
+                            args)
+            args['rdata']['address'] = '10.0.0.2'
+            login, create = session.history
+        finally:
+            DynectSession.close_session()
+    assert login.args['password'] == '*****'
+    assert create.args == {'rdata': {'address': '10.0.0.1'}}
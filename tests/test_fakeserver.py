@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        server.populate('example.com', 3)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield server
+    DynectSession.close_session()
+
+
+def test_zone_created_with_soa_and_apex_ns(server):
+    session = DynectSession.get_session()
+    soa = session.execute('/SOARecord/example.com/example.com/', 'GET',
+                          {'detail': 'Y'})['data']
+    assert [x['rdata']['rname'] for x in soa] == ['admin.example.com.']
+    ns = session.execute('/NSRecord/example.com/example.com/', 'GET',
+                         {'detail': 'Y'})['data']
+    assert sorted(x['rdata']['nsdname'] for x in ns) == [
+        'ns{}.p01.dynect.net.'.format(i) for i in range(1, 5)]
+
+
+def test_publish_bumps_soa_serial(server):
+    zone = Zone('example.com')
+    zone.publish()
+    soa = DynectSession.get_session().execute(
+        '/SOARecord/example.com/example.com/', 'GET', {'detail': 'Y'})
+    assert soa['data'][0]['rdata']['serial'] == 2
+
+
+def test_export_writes_soa_first(server):
+    out = io.StringIO()
+    assert Zone('example.com').export_zonefile(out) == 8
+    lines = out.getvalue().splitlines()
+    assert lines[0] == '$ORIGIN example.com.'
+    assert ' IN SOA ns1.p01.dynect.net. admin.example.com. ' in lines[1]
+    assert sum(' IN NS ' in x for x in lines) == 4
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from dyn.tm.services.gslb import Monitor
+from dyn.tm.session import DynectSession
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+def test_monitor_batch_updates_gslb_once():
+    monitor = Monitor('HTTP', 5)
+    monitor.zone, monitor.fqdn = 'example.com', 'www.example.com.'
+    session = mock.Mock()
+    with mock.patch.object(DynectSession, 'get_session',
+                           return_value=session):
+        with monitor.batch():
+            monitor.retries = 2
+            monitor.timeout = 15
+            assert not session.execute.called
+    session.execute.assert_called_once_with(
+        '/GSLB/example.com/www.example.com./', 'PUT',
+        {'monitor': {'retries': 2, 'timeout': 15}})
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+def _history(**kwargs):
+    with FakeDynServer() as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password', history=True,
+                                **dict(server.session_kwargs, **kwargs))
+        try:
+            for _ in range(3):
+                session.execute('/Zone/example.com/', 'GET')
+            return session.history
+        finally:
+            DynectSession.close_session()
+
+
+def test_history_keeps_every_call_by_default():
+    history = _history()
+    assert history.maxlen is None
+    assert [x.method for x in history] == ['POST', 'GET', 'GET', 'GET']
+    # Entries start with the time of the call as an ISO 8601 string
+    datetime.strptime(history[0][0][:19], '%Y-%m-%dT%H:%M:%S')
+    stats = history.stats()[('GET', '/REST/Zone/{zone}/')]
+    assert (stats['calls'], stats['errors']) == (3, 0)
+
+
+def test_history_size_keeps_most_recent_calls():
+    history = _history(history_size=2)
+    assert [x.uri for x in history] == ['/REST/Zone/example.com/'] * 2
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.services.dsf import get_all_records, iter_all_records
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import get_all_zones, iter_all_zones
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield server
+    DynectSession.close_session()
+
+
+def _add_dsf_records(count):
+    session = DynectSession.get_session()
+    service_id = session.execute('/DSF/', 'POST',
+                                 {'label': 'iter'})['data']['service_id']
+    for i in range(count):
+        rdata = {'rdata_a': {'address': '10.2.0.{}'.format(i)}}
+        session.execute('/DSFRecord/{}/'.format(service_id), 'POST', {
+            'rdata_class': 'A', 'ttl': 30, 'label': 'record{}'.format(i),
+            'weight': 1, 'automation': 'auto', 'endpoints': [],
+            'endpoint_up_count': 1, 'eligible': 'true', 'status': 'up',
+            'torpidity': 0, 'dsf_record_set_id': 'set', 'service_id':
+            service_id, 'rdata': [{'data': rdata}]})
+    return service_id
+
+
+def test_iter_all_zones(server):
+    for i in range(5):
+        server.add_zone('example{}.com'.format(i))
+    requests = server.stats['requests']
+    zones = iter_all_zones()
+    # Nothing is fetched until the generator is consumed
+    assert server.stats['requests'] == requests
+    assert [x.name for x in zones] == [x.name for x in get_all_zones()]
+    assert server.stats['requests'] == requests + 2
+
+
+def test_iter_all_dsf_records_stops_early(server):
+    service_id = _add_dsf_records(5)
+    labels = [x.label for x in get_all_records(service_id)]
+    assert labels == ['record{}'.format(i) for i in range(5)]
+    assert [x.label for x in iter_all_records(service_id)] == labels
+    requests = server.stats['requests']
+    records = iter_all_records(service_id)
+    assert next(records).label == 'record0'
+    # Only the listing and the first record have been fetched
+    assert server.stats['requests'] == requests + 2
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from dyn.jobs import JobTimeout
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        server.populate('example.com', 10)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        # Every call from here on spawns a job which outlives the test
+        server.job_rate, server.job_duration = 1, 60
+        yield server
+    DynectSession.close_session()
+
+
+def test_poll_response_gives_up_on_stuck_job(server):
+    session = DynectSession.get_session()
+    started = time.time()
+    with session._checkout():
+        session.send_command('/REST/Zone/example.com/', 'GET', '')
+        response = session._conn.getresponse()
+        body = response.read()
+        assert response.status == 307
+        with pytest.raises(JobTimeout):
+            session.poll_response(response, body, timeout=0.5)
+    assert time.time() - started < 5
+
+
+def test_execute_iter_gives_up_on_stuck_job(server, monkeypatch):
+    monkeypatch.setattr('dyn.core.JOB_TIMEOUT', 0.5)
+    session = DynectSession.get_session()
+    with pytest.raises(JobTimeout):
+        list(session.execute_iter('/AllRecord/example.com/', 'GET',
+                                  {'detail': 'Y'}))
+
+
+@pytest.fixture
+def jobs():
+    with FakeDynServer() as server:
+        server.populate('example.com', 10)
+        DynectSession('customer', 'user', 'password', pool_size=4,
+                      **server.session_kwargs)
+        server.job_rate, server.job_duration = 1, 0.3
+        yield server
+    DynectSession.close_session()
+
+
+def test_wait_false_returns_job_handles(jobs):
+    session = DynectSession.get_session()
+    started = time.time()
+    handles = [session.execute('/Zone/example.com/', 'GET', wait=False)
+               for _ in range(5)]
+    # Handed back without waiting on the jobs
+    assert time.time() - started < 0.3
+    assert not any(x.done() for x in handles)
+    done = []
+    handles[0].add_done_callback(done.append)
+    results = [x.result(timeout=10) for x in handles]
+    assert [x['data']['zone'] for x in results] == ['example.com'] * 5
+    assert done == [handles[0]]
+
+
+def test_job_handle_result_times_out(jobs):
+    jobs.job_duration = 60
+    handle = DynectSession.get_session().execute('/Zone/example.com/', 'GET',
+                                                 wait=False)
+    with pytest.raises(JobTimeout):
+        handle.result(timeout=0.2)
+
+
+def test_blocking_call_waits_on_job(jobs):
+    result = DynectSession.get_session().execute('/Zone/example.com/', 'GET')
+    assert result['data']['zone'] == 'example.com'
+    assert jobs.stats['jobs'] == 1
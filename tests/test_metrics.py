@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from dyn.metrics import PrometheusCollector, RequestObserver
+from dyn.retry import RetryPolicy
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+class _Recorder(RequestObserver):
+    def __init__(self):
+        self.calls = []
+
+    def on_request(self, session, method, uri, request_bytes):
+        self.calls.append(('request', method, uri))
+
+    def on_response(self, session, method, uri, http_status, latency,
+                    response_bytes):
+        self.calls.append(('response', method, http_status))
+
+    def on_retry(self, session, method, uri, reason, attempt, delay):
+        self.calls.append(('retry', reason))
+
+    def on_poll(self, session, uri, http_status, latency, response_bytes):
+        self.calls.append(('poll', http_status))
+
+
+class _Broken(RequestObserver):
+    def on_response(self, *args):
+        raise ValueError('broken observer')
+
+
+def _session(server, *observers):
+    policy = RetryPolicy(max_attempts=20, base_delay=0.01, max_delay=0.02,
+                         deadline=None)
+    session = DynectSession('customer', 'user', 'password',
+                            retry_policy=policy, **server.session_kwargs)
+    for observer in observers:
+        session.add_observer(observer)
+    return session
+
+
+def test_observer_hooks():
+    recorder = _Recorder()
+    with FakeDynServer(throttle_rate=0.5, seed=1) as server:
+        server.add_zone('example.com')
+        session = _session(server, _Broken(), recorder)
+        try:
+            for _ in range(5):
+                session.execute('/Zone/example.com/', 'GET')
+            server.throttle_rate = 0
+            server.job_rate = 1
+            server.job_duration = 0.05
+            session.execute('/Zone/example.com/', 'GET')
+            session.remove_observer(recorder)
+            session.execute('/Zone/example.com/', 'GET')
+        finally:
+            DynectSession.close_session()
+    kinds = [call[0] for call in recorder.calls]
+    assert recorder.calls[0] == ('request', 'GET', '/REST/Zone/example.com/')
+    assert ('retry', 'throttled') in recorder.calls
+    assert ('response', 'GET', 307) in recorder.calls
+    assert ('poll', 200) in recorder.calls
+    assert kinds.count('response') == 5 + kinds.count('retry') + 1
+    assert kinds[-1] == 'poll'
+
+
+def test_prometheus_collector_renders_templates():
+    collector = PrometheusCollector(buckets=(1, 0.5))
+    with FakeDynServer() as server:
+        server.add_zone('example.com')
+        server.populate('example.com', 2)
+        session = _session(server, collector)
+        try:
+            for i in range(2):
+                session.execute('/ARecord/example.com/host{}.example.com/'
+                                .format(i), 'GET')
+        finally:
+            DynectSession.close_session()
+    text = collector.render()
+    labels = 'method="GET",endpoint="/REST/ARecord/{zone}/{fqdn}/"'
+    assert 'dyn_requests_total{{{}}} 2\n'.format(labels) in text
+    assert 'dyn_responses_total{{{},code="200"}} 2\n'.format(labels) in text
+    assert 'dyn_request_duration_seconds_bucket{{{},le="+Inf"}} 2\n'.format(
+        labels) in text
+    assert '# TYPE dyn_request_duration_seconds histogram' in text
+    assert collector.buckets == (0.5, 1)
+    collector.reset()
+    assert 'dyn_requests_total{' not in collector.render()
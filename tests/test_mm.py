@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import dyn.compat
+from dyn.mm.session import MMSession
+from dyn.testing.fakeserver import FakeDynServer
+
+
+def test_responses_decoded_by_json_backend(monkeypatch):
+    decoded = []
+
+    def loads(data):
+        decoded.append(data)
+        return original(data)
+    original = dyn.compat._json_loads
+    monkeypatch.setattr(dyn.compat, '_json_loads', loads)
+    with FakeDynServer(report_size=3) as server:
+        session = MMSession('apikey', **server.session_kwargs)
+        try:
+            response = session.execute('/reports/sent/count', 'GET', {})
+        finally:
+            MMSession.close_session()
+    assert response == {'count': 3}
+    assert len(decoded) == 1
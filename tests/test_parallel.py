@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.errors import DynectAuthError, DynectGetError
+from dyn.tm.parallel import map_zones
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+import pytest
+
+
+def _count_records(zone):
+    token = DynectSession.get_session()._token
+    records = zone.get_all_records()
+    return zone.name, sum(len(x) for x in records.values()), token
+
+
+def test_map_zones_shares_token():
+    with FakeDynServer() as server:
+        for i in range(3):
+            server.add_zone('example{}.com'.format(i))
+            server.populate('example{}.com'.format(i), i)
+        session = DynectSession('customer', 'user', 'password',
+                                **server.session_kwargs)
+        try:
+            zones = ['example0.com', Zone('example1.com'), 'example2.com',
+                     'missing.com']
+            results = map_zones(_count_records, zones, processes=2)
+        finally:
+            DynectSession.close_session()
+    token = session._token
+    # Each zone also holds its SOA and 4 apex NS records
+    assert results[:3] == [('example0.com', 5, token),
+                           ('example1.com', 6, token),
+                           ('example2.com', 7, token)]
+    assert isinstance(results[3], DynectGetError)
+
+
+def test_map_zones_needs_a_session():
+    assert map_zones(_count_records, [], session=object()) == []
+    with pytest.raises(DynectAuthError):
+        map_zones(_count_records, ['example.com'])
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import pytest
+
+from dyn.core import ConnectionPool
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+
+class _Connection(object):
+    sock = None
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_reuses_returned_connections():
+    pool = ConnectionPool(_Connection, size=2)
+    first = pool.get()
+    pool.put(first)
+    assert pool.get() is first
+    assert len(pool) == 1
+
+
+def test_pool_blocks_when_exhausted():
+    pool = ConnectionPool(_Connection, size=2)
+    conns = [pool.get(), pool.get()]
+    with pytest.raises(RuntimeError):
+        pool.get(timeout=0.05)
+    pool.put(conns[0], discard=True)
+    assert conns[0].closed
+    assert pool.get(timeout=0.05) is not conns[0]
+
+
+def test_pool_evicts_idle_connections():
+    pool = ConnectionPool(_Connection, size=1, idle_timeout=0)
+    conn = pool.get()
+    pool.put(conn)
+    assert pool.get() is not conn
+    assert conn.closed
+
+
+def test_session_threads_share_pool():
+    with FakeDynServer(latency=0.05) as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password', pool_size=4,
+                                **server.session_kwargs)
+        errors = []
+
+        def call():
+            try:
+                session.execute('/Zone/example.com/', 'GET')
+            except Exception as err:
+                errors.append(err)
+        try:
+            threads = [threading.Thread(target=call) for _ in range(12)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == []
+            assert 1 < len(session._pool) <= 4
+        finally:
+            DynectSession.close_session()
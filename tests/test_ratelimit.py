@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import pickle
+import threading
+import time
+
+from dyn.ratelimit import RateLimiter
+from dyn.retry import RetryPolicy
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.session import DynectSession
+
+import pytest
+
+
+def test_limit_adjusted_aimd():
+    limiter = RateLimiter(max_concurrency=8, min_concurrency=2)
+    tickets = [limiter.acquire() for _ in range(4)]
+    assert limiter.in_flight == 4
+    # Calls already in flight when the limit is cut don't cut it again
+    for ticket in tickets:
+        limiter.release(ticket, RetryPolicy.THROTTLED)
+    assert limiter.limit == 4
+    limiter.release(limiter.acquire(), RetryPolicy.SERVER)
+    limiter.release(limiter.acquire(), RetryPolicy.CONNECTION)
+    assert limiter.limit == 2
+    # Reasons which aren't overload neither cut nor grow the limit
+    limiter.release(limiter.acquire(), RetryPolicy.BLOCKED)
+    assert limiter.limit == 2
+    # A window of successful calls raises the limit by one
+    for _ in range(3):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 3
+    for _ in range(100):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 8 and limiter.in_flight == 0
+
+
+def test_invalid_limits_rejected():
+    for kwargs in ({'min_concurrency': 0}, {'max_concurrency': 0},
+                   {'decrease': 1}, {'rate': 0}):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+
+def test_rate_capped():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.time()
+    for _ in range(6):
+        limiter.release(limiter.acquire())
+    assert time.time() - start >= 0.09
+    copy = pickle.loads(pickle.dumps(limiter))
+    assert (copy.rate, copy.limit, copy.in_flight) == (50, 16, 0)
+
+
+def test_concurrency_settles_below_api_limit():
+    limiter = RateLimiter(max_concurrency=16)
+    policy = RetryPolicy(max_attempts=50, base_delay=0.01, max_delay=0.05,
+                         deadline=None)
+    with FakeDynServer(latency=0.02, max_concurrency=4) as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password', shared=True,
+                                pool_size=16, retry_policy=policy,
+                                rate_limiter=limiter, **server.session_kwargs)
+        statuses = []
+
+        def work():
+            for _ in range(10):
+                statuses.append(
+                    session.execute('/Zone/example.com/', 'GET')['status'])
+        try:
+            threads = [threading.Thread(target=work) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            DynectSession.close_session()
+    assert statuses == ['success'] * 160
+    assert server.stats['throttled']
+    assert limiter.limit < 16 and limiter.in_flight == 0
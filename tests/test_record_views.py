@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.errors import DynectInvalidArgumentError
+from dyn.tm.records import ARecord, RecordView
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+
+@pytest.fixture
+def zone():
+    with FakeDynServer() as server:
+        server.populate('example.com', 3)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield Zone('example.com')
+    DynectSession.close_session()
+
+
+def test_compact_views_match_full_records(zone):
+    full = zone.get_all_records()
+    compact = zone.get_all_records(view='compact')
+    assert sorted(full) == sorted(compact)
+    views = compact['a_records']
+    assert all(isinstance(x, RecordView) for x in views)
+    assert [(x.fqdn, x.record_id, x.ttl, x.address) for x in views] == \
+        [(x.fqdn, x.record_id, x.ttl, x.address) for x in full['a_records']]
+    # Views of the same record type share their rdata field names
+    assert views[0]._fields is views[1]._fields
+    with pytest.raises(AttributeError):
+        views[0].cname
+    with pytest.raises(AttributeError):
+        views[0].address = '10.9.9.9'
+    with pytest.raises(DynectInvalidArgumentError):
+        zone.get_all_records(view='tiny')
+
+
+def test_view_promoted_and_pickled(zone):
+    view = next(x for x in zone.iter_records(view='compact')
+                if x.record_type == 'A')
+    copy = pickle.loads(pickle.dumps(view))
+    assert (copy.fqdn, copy.rdata) == (view.fqdn, view.rdata)
+    record = view.promote()
+    assert isinstance(record, ARecord)
+    assert (record.zone, record.fqdn, record.record_id, record.address) == \
+        ('example.com', view.fqdn, view.record_id, view.address)
+    record.address = '10.9.9.9'
+    assert ARecord('example.com', view.fqdn,
+                   record_id=view.record_id).address == '10.9.9.9'
+    assert str(view) == '<RecordView>: A {}'.format(view.fqdn)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.records import ARecord, MXRecord
+from dyn.tm.services.dsf import DSFMXRecord
+from dyn.tm.session import DynectSession
+from dyn.tm.utils import Batchable
+from dyn.tm.zones import Zone
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        server.populate('example.com', 1)
+        yield server
+    DynectSession.close_session()
+
+
+def _login(server, **kwargs):
+    return DynectSession('customer', 'user', 'password',
+                         **dict(server.session_kwargs, **kwargs))
+
+
+def _record_id(server):
+    return next(k for k, v in server.zones['example.com']['records'].items()
+                if v['record_type'] == 'A')
+
+
+def _reads(server, record, count=3):
+    requests = server.stats['requests']
+    for _ in range(count):
+        assert record.address == '10.0.0.0'
+    return server.stats['requests'] - requests
+
+
+def test_records_always_fresh_by_default(server):
+    _login(server)
+    record = ARecord('example.com', 'host0.example.com',
+                     record_id=_record_id(server))
+    assert _reads(server, record) == 3
+    assert 'fetched_at' not in str(record.rdata())
+
+
+def test_record_max_age(server):
+    session = _login(server, record_max_age=0.2)
+    record = ARecord('example.com', 'host0.example.com',
+                     record_id=_record_id(server))
+    assert _reads(server, record) == 0
+    time.sleep(0.2)
+    assert _reads(server, record) == 1
+    session.record_max_age = None
+    time.sleep(0.2)
+    assert _reads(server, record) == 0
+
+
+def test_batch_sends_one_update(server):
+    _login(server, record_max_age=None)
+    record = ARecord('example.com', 'host0.example.com',
+                     record_id=_record_id(server))
+    requests = server.stats['requests']
+    with record.batch():
+        record.address = '10.9.9.9'
+        with record.batch():
+            record.ttl = 60
+        assert server.stats['requests'] == requests
+    assert server.stats['requests'] == requests + 1
+    stored = server.zones['example.com']['records'][record.record_id]
+    assert (stored['rdata'], stored['ttl']) == ({'address': '10.9.9.9'}, 60)
+
+
+def test_failed_batch_discarded(server):
+    _login(server)
+    record = ARecord('example.com', 'host0.example.com',
+                     record_id=_record_id(server))
+    requests = server.stats['requests']
+    with pytest.raises(ValueError):
+        with record.batch():
+            record.ttl = 60
+            raise ValueError('abandoned')
+    assert server.stats['requests'] == requests
+    assert server.zones['example.com']['records'][record.record_id][
+        'ttl'] == 3600
+
+
+def test_batch_merges_nested_args():
+    sent = []
+
+    class Monitor(Batchable):
+        def _update(self, api_args):
+            if not self._collect(api_args):
+                sent.append(api_args)
+    monitor = Monitor()
+    with monitor.batch():
+        monitor._update({'monitor': {'interval': 5}, 'ttl': 30})
+        monitor._update({'monitor': {'retries': 2}, 'ttl': 60})
+    monitor._update({'ttl': 90})
+    assert sent == [{'monitor': {'interval': 5, 'retries': 2}, 'ttl': 60},
+                    {'ttl': 90}]
+
+
+def test_rdata_follows_schema(server):
+    server.add_record('example.com', 'mail.example.com', 'MX',
+                      {'exchange': 'mx.example.com.', 'preference': 10})
+    server.add_record('example.com', 'odd.example.com', 'XYZ',
+                      {'rdata_xyz': 'opaque'})
+    _login(server)
+    records = Zone('example.com').get_all_records()
+    mx, = records['mx_records']
+    assert MXRecord._rdata_fields == ('exchange', 'preference')
+    assert mx.rdata() == {'mx_rdata': {'exchange': 'mx.example.com.',
+                                       'preference': 10, 'note': None}}
+    soa, = records['soa_records']
+    soa_rdata = soa.rdata()['soa_rdata']
+    assert (soa_rdata['rname'], soa_rdata['minimum']) == \
+        ('admin.example.com.', 1800)
+    # Fields a class doesn't know of are kept from the API's response
+    unknown, = records['xyz_records']
+    assert unknown.rdata() == {'rdata_xyz': 'opaque', 'note': None}
+    # Traffic Director records share the schema of the record they extend
+    assert DSFMXRecord._rdata_fields == MXRecord._rdata_fields
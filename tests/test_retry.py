@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+from dyn.retry import RetryPolicy, ZoneBackoff, zone_key
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.errors import DynectError
+from dyn.tm.session import DynectSession
+
+
+def test_concurrent_calls_survive_mixed_faults():
+    """Dropped connections make the session check its token, while other
+    threads' calls keep going out, some of them failing with 503s
+    """
+    policy = RetryPolicy(max_attempts=10, base_delay=0.01, max_delay=0.05,
+                         deadline=None)
+    with FakeDynServer(error_rate=0.2, drop_rate=0.05, seed=3) as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password',
+                                pool_size=8, retry_policy=policy,
+                                **server.session_kwargs)
+        try:
+            calls = [('/Zone/example.com/', 'GET', {})] * 200
+            results = session.execute_many(calls)
+        finally:
+            DynectSession.close_session()
+    assert [x for x in results if isinstance(x, Exception)] == []
+    assert server.stats['dropped'] and server.stats['errors']
+
+
+def test_expired_session_renewed_after_connection_error():
+    with FakeDynServer() as server:
+        session = DynectSession('customer', 'user', 'password',
+                                **server.session_kwargs)
+        try:
+            token = session._token
+            server._tokens.clear()
+            assert session._handle_error('/Zone/', 'GET', {})
+            assert session._token not in (None, token)
+            session.execute('/Zone/', 'GET')
+        finally:
+            DynectSession.close_session()
+
+
+def test_live_session_kept_after_connection_error():
+    with FakeDynServer(error_rate=0.5, seed=1) as server:
+        session = DynectSession('customer', 'user', 'password',
+                                retry_policy=RetryPolicy(base_delay=0.01,
+                                                         max_attempts=10),
+                                **server.session_kwargs)
+        try:
+            token = session._token
+            assert session._handle_error('/Zone/', 'GET', {})
+            assert session._token == token
+        finally:
+            DynectSession.close_session()
+
+
+def _attempts(policy, method, uri, args=None, **faults):
+    """The number of requests a call failing with *faults* is sent in"""
+    with FakeDynServer() as server:
+        server.add_zone('example.com')
+        session = DynectSession('customer', 'user', 'password',
+                                retry_policy=policy, **server.session_kwargs)
+        try:
+            for name, value in faults.items():
+                setattr(server, name, value)
+            before = server.stats['requests']
+            with pytest.raises(DynectError):
+                session.execute(uri, method, args)
+            return server.stats['requests'] - before
+        finally:
+            DynectSession.close_session()
+
+
+def test_post_not_retried_after_server_error():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+    record = ('POST', '/ARecord/example.com/www.example.com/',
+              {'rdata': {'address': '10.0.0.1'}})
+    assert _attempts(policy, *record, error_rate=1) == 1
+    assert _attempts(policy, 'GET', '/Zone/example.com/', error_rate=1) == 3
+    # Throttled calls were never carried out, so may always be retried
+    assert _attempts(policy, *record, throttle_rate=1) == 3
+
+
+def test_post_retried_when_policy_allows():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01,
+                         retry_non_idempotent=True)
+    assert _attempts(policy, 'POST', '/ARecord/example.com/www.example.com/',
+                     {'rdata': {'address': '10.0.0.1'}}, error_rate=1) == 3
+
+
+def test_policy_delays_grow_up_to_cap():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=0, deadline=None)
+    started = time.time()
+    assert [policy.delay(x, started) for x in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert not policy.exhausted(3, started)
+    assert policy.exhausted(4, started)
+
+
+def test_policy_never_waits_past_deadline():
+    policy = RetryPolicy(base_delay=10, jitter=0, deadline=1)
+    assert policy.delay(1, time.time()) <= 1
+    assert policy.exhausted(1, time.time() - 2)
+
+
+def test_zone_key():
+    assert zone_key('/REST/ARecord/Example.com/www.example.com/') == \
+        'example.com'
+    assert zone_key('/REST/Session/') is None
+    assert zone_key('/REST/Job/123/') is None
+
+
+def test_zone_backoff_holds_only_blocked_zone():
+    backoff = ZoneBackoff()
+    backoff.hold('example.com', 0.2)
+    started = time.time()
+    backoff.wait('other.com')
+    backoff.wait(None)
+    assert time.time() - started < 0.1
+    backoff.wait('example.com')
+    assert time.time() - started >= 0.15
+
+
+def test_throttled_call_honours_retry_after():
+    policy = RetryPolicy(max_attempts=2, base_delay=0.01)
+    with FakeDynServer() as server:
+        session = DynectSession('customer', 'user', 'password',
+                                retry_policy=policy, **server.session_kwargs)
+        try:
+            server.throttle_rate, server.retry_after = 1, 0.3
+            started = time.time()
+            with pytest.raises(DynectError):
+                session.execute('/Zone/', 'GET')
+            assert time.time() - started >= 0.3
+        finally:
+            DynectSession.close_session()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from dyn.testing.fakeserver import FakeServerProcess
+from dyn.tm.errors import DynectGetError
+from dyn.tm.session import DynectSession
+
+import pytest
+
+
+@pytest.fixture
+def server():
+    with FakeServerProcess() as server:
+        yield server
+    DynectSession.close_session()
+
+
+def test_new_shared_session_logs_out_replaced_session(server):
+    old = DynectSession.new_session('customer', 'user', 'password',
+                                    shared=True, **server.session_kwargs)
+    token = old._token
+    new = DynectSession.new_session('customer', 'user', 'password',
+                                    shared=True, **server.session_kwargs)
+    assert DynectSession.get_session() is new
+    assert old._token is None
+    assert len(old._pool) == 0
+    # The replaced token was logged out of the API
+    new._token = token
+    with pytest.raises(DynectGetError):
+        new.execute('/Zone/', 'GET', final=True)
+
+
+def _in_thread(target):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(target()))
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+def test_shared_session_used_by_other_threads(server):
+    shared = DynectSession('customer', 'user', 'password', shared=True,
+                           **server.session_kwargs)
+
+    def work():
+        session = DynectSession.get_session()
+        return session, session.execute('/Zone/', 'GET')['status']
+    results = [_in_thread(work) for _ in range(4)]
+    assert results == [(shared, 'success')] * 4
+    # A thread's own session takes precedence over the shared one
+    own = DynectSession('customer', 'user', 'password',
+                        **server.session_kwargs)
+    assert DynectSession.get_session() is own
+    assert _in_thread(DynectSession.get_session) is shared
+    assert DynectSession.close_session() is own
+    assert DynectSession.close_session() is shared
+    assert DynectSession.get_session() is None
+
+
+def test_dead_threads_sessions_released(server):
+    key = DynectSession.__metakey__
+
+    def login():
+        return DynectSession('customer', 'user', 'password',
+                             **server.session_kwargs)
+    _in_thread(login)
+    _in_thread(login)
+    session = login()
+    assert list(DynectSession._instances[key].values()) == [session]
+    # An unpickled session may be registered for the current thread
+    DynectSession.close_session()
+    DynectSession.set_session(session)
+    assert DynectSession.get_session() is session
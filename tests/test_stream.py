@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+import pytest
+
+from dyn.stream import StreamDecoder
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm.errors import DynectGetError
+from dyn.tm.records import ARecord
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Node, Zone
+
+
+def _decode(payload, chunk_size=7):
+    # Not ASCII escaped, so multi-byte characters straddle chunks
+    body = json.dumps(payload, ensure_ascii=False).encode('UTF-8')
+    decoder = StreamDecoder(io.BytesIO(body).read, chunk_size=chunk_size)
+    return list(decoder), decoder
+
+
+def test_decodes_dict_of_lists_in_small_chunks():
+    payload = {'status': 'success', 'msgs': [{'INFO': u'caf\xe9'}],
+               'data': {'a_records': [{'x': 1}, {'x': 2}],
+                        'soa_records': [{'y': u'\u2603'}], 'count': 3}}
+    items, decoder = _decode(payload)
+    assert items == [('a_records', {'x': 1}), ('a_records', {'x': 2}),
+                     ('soa_records', {'y': u'\u2603'}), ('count', 3)]
+    assert decoder.meta == {'status': 'success',
+                            'msgs': [{'INFO': u'caf\xe9'}]}
+    assert decoder.bytes_read == len(
+        json.dumps(payload, ensure_ascii=False).encode('UTF-8'))
+
+
+def test_decodes_list_data():
+    items, decoder = _decode({'data': ['a', 'b'], 'status': 'success'})
+    assert items == [(None, 'a'), (None, 'b')]
+    assert decoder.meta == {'status': 'success'}
+
+
+@pytest.fixture
+def server():
+    with FakeDynServer() as server:
+        server.populate('example.com', 300)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield server
+    DynectSession.close_session()
+
+
+def test_iter_records_matches_get_all_records(server):
+    zone = Zone('example.com')
+    streamed = list(zone.iter_records())
+    built = [x for records in zone.get_all_records().values()
+             for x in records]
+    assert len(streamed) == len(built) == 305
+    assert sorted(x.fqdn for x in streamed if isinstance(x, ARecord)) == \
+        sorted(x.fqdn for x in built if isinstance(x, ARecord))
+
+
+def test_node_iter_records(server):
+    node = Node('example.com', 'host7.example.com')
+    assert [(x.fqdn, x.address) for x in node.iter_records()] == \
+        [('host7.example.com', '10.0.0.7')]
+
+
+def test_streamed_failure_raises(server):
+    session = DynectSession.get_session()
+    with pytest.raises(DynectGetError):
+        list(session.execute_iter('/AllRecord/missing.com/', 'GET'))
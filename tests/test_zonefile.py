@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer, FakeServerProcess
+from dyn.tm.session import DynectSession
+from dyn.tm.zonefile import parse_zonefile
+from dyn.tm.zones import Zone
+
+ZONEFILE = u'''$ORIGIN example.com.
+$TTL 3600
+@       IN SOA ns1.p01.dynect.net. hostmaster.example.com. (
+            1 3600 600 604800 60 )
+        IN NS ns1.p01.dynect.net.
+        IN NS ns2.p01.dynect.net.
+sub     IN NS ns1.elsewhere.net.
+www     IN A 10.0.0.1
+'''
+
+
+@pytest.fixture
+def server():
+    with FakeServerProcess() as server:
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield server
+    DynectSession.close_session()
+
+
+#: The zone's own records, with the file's created alongside them
+EXPECTED = [('example.com', 'NS')] * 4 + [('example.com', 'SOA'),
+                                          ('sub.example.com', 'NS'),
+                                          ('www.example.com', 'A')]
+
+
+def _created(zone):
+    return sorted((x.fqdn, x.record_type)
+                  for x in zone.iter_records(view='compact'))
+
+
+def test_import_skips_soa_and_apex_ns(server):
+    zone = Zone('example.com', 'hostmaster@example.com')
+    assert zone.import_zonefile(io.StringIO(ZONEFILE)) == []
+    assert _created(zone) == EXPECTED
+
+
+def test_large_file_skips_soa_and_apex_ns(server, tmpdir):
+    path = tmpdir.join('example.com.zone')
+    # Padded past the ZoneFile API's 1MB limit
+    path.write(ZONEFILE + u'; padding\n' * 120000)
+    zone = Zone('example.com', file_name=str(path))
+    assert _created(zone) == EXPECTED
+
+
+def _key(record):
+    # Parsed rdata holds text where the API returns numbers
+    rdata = {k: u'{}'.format(v) for k, v in record['rdata'].items()
+             if v is not None}
+    return (record['fqdn'], record['record_type'], record['ttl'],
+            tuple(sorted(rdata.items())))
+
+
+def test_export_round_trip(tmpdir):
+    with FakeDynServer() as server:
+        server.populate('example.com', 3)
+        server.add_record('example.com', 'example.com', 'MX',
+                          {'exchange': 'mx.example.com.', 'preference': 10},
+                          300)
+        server.add_record('example.com', 'txt.example.com', 'TXT',
+                          {'txtdata': u'v=spf1 "quoted" ~all'}, 60)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        try:
+            path = str(tmpdir.join('example.com.zone'))
+            assert Zone('example.com').export_zonefile(path) == 10
+        finally:
+            DynectSession.close_session()
+        stored = server.zones['example.com']['records'].values()
+    with io.open(path) as f:
+        exported = list(parse_zonefile(f, 'example.com'))
+    assert exported[0]['record_type'] == 'SOA'
+    assert sorted(_key(x) for x in exported) == sorted(_key(x)
+                                                       for x in stored)
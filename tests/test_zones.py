@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from dyn.testing.fakeserver import FakeDynServer
+from dyn.tm import zones
+from dyn.tm.errors import DynectCreateError
+from dyn.tm.session import DynectSession
+from dyn.tm.zones import Zone
+
+DESIRED = [{'fqdn': 'host0.example.com', 'record_type': 'A',
+            'rdata': {'address': '10.9.9.9'}},
+           {'fqdn': 'host1.example.com', 'record_type': 'A', 'ttl': 60,
+            'rdata': {'address': '10.0.0.1'}}]
+
+
+@pytest.fixture
+def zone():
+    with FakeDynServer() as server:
+        server.populate('example.com', 5)
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        yield Zone('example.com')
+    DynectSession.close_session()
+
+
+def _records(zone):
+    return sorted((x.fqdn, x.record_type, x.ttl, tuple(sorted(
+        x.rdata.items()))) for x in zone.iter_records(view='compact'))
+
+
+def test_plan_keeps_records_not_given(zone):
+    before = _records(zone)
+    plan = zone.plan(DESIRED)
+    assert (len(plan.creates), len(plan.updates), len(plan.deletes)) == \
+        (1, 1, 0)
+    assert zone.apply(plan) == []
+    after = _records(zone)
+    assert len(after) == len(before) + 1
+    assert ('host0.example.com', 'A', 3600, (('address', '10.0.0.0'),)) in \
+        after
+
+
+def test_plan_with_delete_prunes_zone(zone):
+    plan = zone.plan(DESIRED, delete=True)
+    assert (len(plan.creates), len(plan.updates), len(plan.deletes)) == \
+        (0, 2, 3)
+    assert zone.apply(plan) == []
+    # The SOA record and apex nameservers are never pruned
+    assert [x[:2] for x in _records(zone)] == \
+        [('example.com', 'NS')] * 4 + [('example.com', 'SOA'),
+                                       ('host0.example.com', 'A'),
+                                       ('host1.example.com', 'A')]
+
+
+def _serial(server):
+    zone = server.zones['example.com']
+    return zone['records'][zone['soa_id']]['rdata']['serial']
+
+
+def test_add_records(monkeypatch):
+    monkeypatch.setattr(zones, '_CHUNK_SIZE', 10)
+    with FakeDynServer() as server:
+        server.add_zone('example.com')
+        DynectSession('customer', 'user', 'password',
+                      **server.session_kwargs)
+        try:
+            zone = Zone('example.com')
+            fqdns = ['new{}.example.com'.format(i) for i in range(25)]
+            # A malformed fqdn is rejected by the API
+            fqdns[7] += '/7'
+            records = ({'fqdn': fqdn, 'record_type': 'A',
+                        'rdata': {'address': '10.1.0.1'}} for fqdn in fqdns)
+            progress = []
+            failures = zone.add_records(
+                records, progress=lambda *x: progress.append(x))
+            assert _serial(server) == 2
+            assert zone.add_records([DESIRED[0]], publish=False) == []
+            assert _serial(server) == 2
+            a_records = [x for x in zone.iter_records(view='compact')
+                         if x.record_type == 'A']
+        finally:
+            DynectSession.close_session()
+    assert progress == [(10, 1), (20, 1), (25, 1)]
+    (action, record, error), = failures
+    assert (action, record.fqdn) == ('create', 'new7.example.com/7')
+    assert isinstance(error, DynectCreateError)
+    assert len(a_records) == 25